@@ -0,0 +1,140 @@
+"""
+Persistent, content-addressed cache for section analysis results
+"""
+
+import hashlib
+import json
+import threading
+import time
+
+from sqlite_utils import ThreadLocalConnection
+
+
+def make_cache_key(*parts):
+    """Build a stable digest from the inputs that determine an analysis"""
+    digest = hashlib.sha256()
+    for part in parts:
+        data = str(part).encode('utf-8')
+        # Length-prefix every part so ("ab", "c") and ("a", "bc") differ
+        digest.update(f"{len(data)}:".encode('ascii'))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+class AnalysisCache:
+    """SQLite-backed analysis cache shared by every worker on the host"""
+
+    def __init__(self, db_path, max_entries=5000, ttl_seconds=7 * 24 * 3600, evict_every=50):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.evict_every = evict_every
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self._connections = ThreadLocalConnection(db_path)
+        self._stats_lock = threading.Lock()
+
+        conn = self._connection()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS analysis_cache (
+                cache_key TEXT PRIMARY KEY,
+                result TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_analysis_cache_access ON analysis_cache (last_access)")
+        self.evict()
+
+    def _connection(self):
+        return self._connections.get()
+
+    def _count(self, name, amount=1):
+        with self._stats_lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    def get(self, key):
+        """Return the cached result for key, or None"""
+        try:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT result, created_at FROM analysis_cache WHERE cache_key = ?", (key,)
+            ).fetchone()
+
+            now = time.time()
+            if row is None or now - row[1] > self.ttl_seconds:
+                self._count('misses')
+                return None
+
+            conn.execute("UPDATE analysis_cache SET last_access = ? WHERE cache_key = ?", (now, key))
+            self._count('hits')
+            return json.loads(row[0])
+        except Exception as e:
+            print(f"Analysis cache read failed: {str(e)}")
+            self._count('misses')
+            return None
+
+    def set(self, key, result):
+        """Store a result under key"""
+        try:
+            now = time.time()
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO analysis_cache (cache_key, result, created_at, last_access) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(result), now, now)
+            )
+            self._count('writes')
+            if self.writes % self.evict_every == 0:
+                self.evict()
+        except Exception as e:
+            print(f"Analysis cache write failed: {str(e)}")
+
+    def evict(self):
+        """Drop expired entries, then the least recently used beyond max_entries"""
+        try:
+            conn = self._connection()
+            removed = conn.execute(
+                "DELETE FROM analysis_cache WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+            ).rowcount
+
+            overflow = conn.execute("SELECT COUNT(*) FROM analysis_cache").fetchone()[0] - self.max_entries
+            if overflow > 0:
+                removed += conn.execute(
+                    "DELETE FROM analysis_cache WHERE cache_key IN "
+                    "(SELECT cache_key FROM analysis_cache ORDER BY last_access ASC LIMIT ?)", (overflow,)
+                ).rowcount
+
+            if removed:
+                self._count('evictions', removed)
+            return removed
+        except Exception as e:
+            print(f"Analysis cache eviction failed: {str(e)}")
+            return 0
+
+    def clear(self):
+        """Remove every cached result"""
+        conn = self._connection()
+        conn.execute("DELETE FROM analysis_cache")
+
+    def stats(self):
+        """Return hit/miss counters and the current cache size"""
+        try:
+            conn = self._connection()
+            entries, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(result)), 0) FROM analysis_cache"
+            ).fetchone()
+        except Exception:
+            entries, size = 0, 0
+
+        lookups = self.hits + self.misses
+        return {
+            'entries': entries,
+            'size_bytes': size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'writes': self.writes,
+            'evictions': self.evictions,
+            'hit_ratio': round(self.hits / lookups, 3) if lookups else 0.0
+        }
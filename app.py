@@ -1,14 +1,17 @@
-from flask import Flask, render_template, request, jsonify, send_file, session
+from flask import Flask, render_template, request, jsonify, send_file, session, Response, g
 import pandas as pd
 import base64
 import json
 from datetime import datetime
-import boto3
 import threading
 import os
 import re
 import traceback
 import time
+import itertools
+import copy
+import csv
+import io
 from pathlib import Path
 import asyncio
 import uuid
@@ -24,6 +27,25 @@ from docx.oxml import parse_xml
 from docx.oxml.ns import nsdecls, qn
 from werkzeug.utils import secure_filename
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from config import Config
+from bedrock_client import attempt_timeout, get_bedrock_client
+from bedrock_resilience import CircuitBreaker, call_with_retries, fallback_reason
+from analysis_cache import AnalysisCache, make_cache_key
+from feedback_stream import FeedbackItemStreamParser
+from jobs import JobManager, JobQueueFull
+from session_store import create_session_store
+from keyword_matcher import HawkeyeMatcher
+from docx_comments import write_docx_with_comments
+from docx_sections import extract_document_sections_from_xml
+from metrics import REGISTRY
+from usage_ledger import UsageLedger, operation_kind
+from retrieval import ChecklistRetriever, DocumentRetriever, estimate_tokens
+from guidelines_snapshot import GuidelineSource
+from revisions import diff_sections, is_revision
+from single_flight import SingleFlight
+from section_chunks import split_section_chunks, attach_source_paragraphs, merge_feedback_items, drop_duplicate_items, pack_sections
 
 app = Flask(__name__)
 app.secret_key = os.environ.get('SECRET_KEY', 'ct-review-tool-secret-key-2024')
@@ -40,7 +62,100 @@ os.makedirs(OUTPUT_FOLDER, exist_ok=True)
 # Global variables
 guidelines_content = None
 hawkeye_checklist = None
-document_sessions = {}
+checklist_retriever = None
+
+# Persistent analysis cache shared across sessions and worker processes
+analysis_cache = None
+if Config.ANALYSIS_CACHE_ENABLED:
+    analysis_cache = AnalysisCache(
+        Config.ANALYSIS_CACHE_PATH,
+        max_entries=Config.ANALYSIS_CACHE_MAX_ENTRIES,
+        ttl_seconds=Config.ANALYSIS_CACHE_TTL.total_seconds()
+    )
+
+# Token, cost and latency of every Bedrock call
+usage_ledger = None
+if Config.USAGE_LEDGER_ENABLED:
+    usage_ledger = UsageLedger(
+        Config.USAGE_DB_PATH,
+        input_cost_per_1k=Config.BEDROCK_INPUT_COST_PER_1K,
+        output_cost_per_1k=Config.BEDROCK_OUTPUT_COST_PER_1K,
+        retention_seconds=Config.USAGE_RETENTION.total_seconds()
+    )
+
+# Background analysis jobs
+job_manager = JobManager(
+    max_workers=Config.JOB_MAX_WORKERS,
+    max_pending=Config.JOB_MAX_PENDING,
+    retention_seconds=Config.JOB_RETENTION.total_seconds()
+)
+
+# Concurrent identical section analyses share one Bedrock call
+analysis_flights = SingleFlight()
+
+# Fails Bedrock calls fast to the local heuristics while Bedrock is unhealthy
+bedrock_breaker = CircuitBreaker(
+    failure_threshold=Config.BEDROCK_BREAKER_THRESHOLD,
+    reset_seconds=Config.BEDROCK_BREAKER_RESET_SECONDS
+)
+
+# Bump whenever the analysis prompt changes so stale cached results are ignored
+ANALYSIS_PROMPT_VERSION = "3"
+
+# Shared pool for fanning section analyses out to Bedrock
+analysis_executor = ThreadPoolExecutor(max_workers=Config.ANALYSIS_MAX_WORKERS, thread_name_prefix='analysis')
+
+class AnalysisLane:
+    """Bedrock concurrency budget shared by one caller's section analyses and their chunks
+    
+    Every Bedrock call made for the caller, chunk calls included, holds one
+    of max_calls slots. Chunks of long sections run on the lane's own pool,
+    so a large batch never occupies the threads interactive analyses use.
+    """
+    
+    def __init__(self, max_calls, chunk_workers, name):
+        self.slots = threading.BoundedSemaphore(max_calls)
+        self.chunk_executor = ThreadPoolExecutor(max_workers=chunk_workers, thread_name_prefix=f'{name}-chunk')
+    
+    def shutdown(self, wait=True):
+        self.chunk_executor.shutdown(wait=wait, cancel_futures=True)
+
+def create_interactive_lane():
+    # More concurrent calls than pooled connections would only wait for a connection
+    return AnalysisLane(Config.BEDROCK_MAX_POOL_CONNECTIONS, Config.SECTION_CHUNK_WORKERS, 'interactive')
+
+# Lane for analyses requested from the UI; batch reviews use their own
+interactive_lane = create_interactive_lane()
+
+def _reset_pools_after_fork():
+    """Give a forked worker its own thread pools; threads started in the parent do not exist in the child"""
+    global analysis_executor, interactive_lane
+    analysis_executor = ThreadPoolExecutor(max_workers=Config.ANALYSIS_MAX_WORKERS, thread_name_prefix='analysis')
+    interactive_lane = create_interactive_lane()
+    job_manager.reset_after_fork()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_pools_after_fork)
+
+def shutdown_pools(wait=True):
+    """Stop background jobs and analysis pools when a worker exits"""
+    job_manager.shutdown(wait=wait)
+    # Section tasks may still be submitting chunks, so their pool is stopped first
+    analysis_executor.shutdown(wait=wait, cancel_futures=True)
+    interactive_lane.shutdown(wait=wait)
+
+# Metrics served at /metrics
+REQUEST_SECONDS = REGISTRY.histogram('ct_request_duration_seconds', 'Request latency by endpoint', ['endpoint'])
+REQUESTS_IN_PROGRESS = REGISTRY.gauge('ct_requests_in_progress', 'Requests currently being handled', ['endpoint'])
+STAGE_SECONDS = REGISTRY.histogram('ct_stage_duration_seconds', 'Latency of individual processing stages', ['stage'])
+BEDROCK_CALLS = REGISTRY.counter('ct_bedrock_calls_total', 'Bedrock invocations by outcome (ok or fallback to mock)', ['mode', 'outcome'])
+BEDROCK_TOKENS = REGISTRY.counter('ct_bedrock_tokens_total', 'Bedrock tokens by direction', ['direction'])
+BEDROCK_RETRIES = REGISTRY.counter('ct_bedrock_retries_total', 'Bedrock attempts retried after throttling or transient errors', ['error'])
+BEDROCK_FALLBACKS = REGISTRY.counter('ct_bedrock_fallbacks_total', 'Bedrock calls answered by the local heuristics, by reason', ['reason'])
+BEDROCK_IN_FLIGHT = REGISTRY.gauge('ct_bedrock_in_flight', 'Bedrock invocations currently in flight')
+PACKED_SECTIONS = REGISTRY.counter('ct_packed_sections_total', 'Sections analyzed together with others in one Bedrock request')
+SESSION_CACHE_LOOKUPS = REGISTRY.counter('ct_session_feedback_cache_lookups_total', 'Per-session feedback cache lookups', ['result'])
+REVISION_SECTIONS = REGISTRY.counter('ct_revision_sections_total', 'Sections of revised uploads by change since the previous version', ['change'])
 
 # Define paths to guidelines documents
 GUIDELINES_PATH = "CT_EE_Review_Guidelines.docx"
@@ -94,12 +209,49 @@ EXCLUDED_SECTIONS = [
     "Attachments"
 ]
 
+# Keywords that map feedback text to Hawkeye checkpoints
+HAWKEYE_KEYWORDS = {
+    1: ["customer experience", "cx impact", "customer trust", "buyer impact"],
+    2: ["investigation", "sop", "enforcement decision", "abuse pattern"],
+    3: ["seller classification", "good actor", "bad actor", "confused actor"],
+    4: ["enforcement", "violation", "warning", "suspension"],
+    5: ["verification", "supplier", "authenticity", "documentation"],
+    6: ["appeal", "repeat", "retrospective"],
+    7: ["hijacking", "security", "authentication", "secondary user"],
+    8: ["funds", "disbursement", "financial"],
+    9: ["outreach", "communication", "clarification"],
+    10: ["sentiment", "escalation", "health safety", "legal threat"],
+    11: ["root cause", "process gap", "system failure"],
+    12: ["preventative", "solution", "improvement", "mitigation"],
+    13: ["documentation", "reporting", "background"],
+    14: ["cross-team", "collaboration", "engagement"],
+    15: ["quality", "audit", "review", "performance"],
+    16: ["continuous improvement", "training", "update"],
+    17: ["communication standard", "messaging", "clarity"],
+    18: ["metrics", "tracking", "measurement"],
+    19: ["legal", "compliance", "regulation"],
+    20: ["launch", "pilot", "rollback"]
+}
+
+# Risk indicators, checked High before Medium
+HIGH_RISK_INDICATORS = [
+    "counterfeit", "fraud", "manipulation", "multiple violation",
+    "immediate action", "legal", "health safety", "bad actor"
+]
+
+MEDIUM_RISK_INDICATORS = [
+    "pattern", "violation", "enforcement", "remediation",
+    "correction", "warning"
+]
+
+# Built once so every feedback item is classified in a single scan
+hawkeye_matcher = HawkeyeMatcher(HAWKEYE_KEYWORDS, HIGH_RISK_INDICATORS, MEDIUM_RISK_INDICATORS)
+
 class WordDocumentWithComments:
     """Helper class to add comments to Word documents"""
     
     def __init__(self, doc_path):
         self.doc_path = doc_path
-        self.temp_dir = f"temp_{uuid.uuid4()}"
         self.comments = []
         self.comment_id = 1
         
@@ -114,88 +266,20 @@ class WordDocumentWithComments:
         })
         self.comment_id += 1
     
-    def _create_comment_xml(self, comment):
-        """Create comment XML structure"""
-        comment_xml = f'''
-        <w:comment w:id="{comment['id']}" w:author="{comment['author']}" 
-                   w:date="{comment['date'].strftime('%Y-%m-%dT%H:%M:%S.%fZ')}" 
-                   xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
-            <w:p>
-                <w:r>
-                    <w:t>{comment['text']}</w:t>
-                </w:r>
-            </w:p>
-        </w:comment>
-        '''
-        return comment_xml
-    
-    def save_with_comments(self, output_path):
-        """Save document with comments added"""
+    def save_with_comments(self, output):
+        """Save document with comments added
+        
+        output may be a path or a writable binary file object (e.g. a
+        SpooledTemporaryFile). Untouched archive members are copied as-is.
+        """
         try:
-            doc = Document(self.doc_path)
-            temp_docx = f"{self.temp_dir}_temp.docx"
-            doc.save(temp_docx)
-            
-            os.makedirs(self.temp_dir, exist_ok=True)
-            with zipfile.ZipFile(temp_docx, 'r') as zip_ref:
-                zip_ref.extractall(self.temp_dir)
-            
-            comments_path = os.path.join(self.temp_dir, 'word', 'comments.xml')
-            
-            comments_xml = '''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
-            <w:comments xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
-            '''
-            
-            for comment in self.comments:
-                comments_xml += self._create_comment_xml(comment)
-            
-            comments_xml += '</w:comments>'
-            
-            with open(comments_path, 'w', encoding='utf-8') as f:
-                f.write(comments_xml)
-            
-            rels_path = os.path.join(self.temp_dir, 'word', '_rels', 'document.xml.rels')
-            if os.path.exists(rels_path):
-                with open(rels_path, 'r', encoding='utf-8') as f:
-                    rels_content = f.read()
-                
-                if 'comments.xml' not in rels_content:
-                    new_rel = '<Relationship Id="rIdComments" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/comments" Target="comments.xml"/>'
-                    rels_content = rels_content.replace('</Relationships>', f'{new_rel}</Relationships>')
-                    
-                    with open(rels_path, 'w', encoding='utf-8') as f:
-                        f.write(rels_content)
-            
-            content_types_path = os.path.join(self.temp_dir, '[Content_Types].xml')
-            if os.path.exists(content_types_path):
-                with open(content_types_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                if 'comments.xml' not in content:
-                    new_type = '<Override PartName="/word/comments.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.comments+xml"/>'
-                    content = content.replace('</Types>', f'{new_type}</Types>')
-                    
-                    with open(content_types_path, 'w', encoding='utf-8') as f:
-                        f.write(content)
-            
-            with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for root, dirs, files in os.walk(self.temp_dir):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        arcname = os.path.relpath(file_path, self.temp_dir)
-                        zipf.write(file_path, arcname)
-            
-            shutil.rmtree(self.temp_dir)
-            os.remove(temp_docx)
-            
+            write_docx_with_comments(self.doc_path, output, self.comments)
             return True
             
         except Exception as e:
             print(f"Error adding comments: {str(e)}")
-            if os.path.exists(self.temp_dir):
-                shutil.rmtree(self.temp_dir)
-            if os.path.exists(temp_docx):
-                os.remove(temp_docx)
+            if isinstance(output, str) and os.path.exists(output):
+                os.remove(output)
             return False
 
 class ReviewSession:
@@ -218,43 +302,101 @@ class ReviewSession:
         self.ai_feedback_cache = {}
         self.document_comments = []
         self.chat_history = []
+        self.document_retriever = None
+        self.revision_of = None
+        self.revision_round = 1
+    
+    # python-docx objects are not stored (the annotated download reopens document_path) and the retrieval index is rebuilt on demand
+    SERIALIZED_FIELDS = [
+        'session_id', 'document_name', 'document_content', 'document_path', 'sections',
+        'paragraph_indices', 'current_section', 'feedback_history', 'section_status',
+        'accepted_feedback', 'rejected_feedback', 'user_feedback', 'ai_feedback_cache',
+        'document_comments', 'chat_history', 'revision_of', 'revision_round'
+    ]
+    
+    def to_dict(self):
+        """Serialize the session state for a shared session store"""
+        data = {field: getattr(self, field) for field in self.SERIALIZED_FIELDS}
+        data['start_time'] = self.start_time.isoformat()
+        return data
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a session from to_dict() output"""
+        review_session = cls()
+        for field in cls.SERIALIZED_FIELDS:
+            if field in data:
+                setattr(review_session, field, data[field])
+        for field in ('feedback_history', 'accepted_feedback', 'rejected_feedback', 'user_feedback'):
+            setattr(review_session, field, defaultdict(list, getattr(review_session, field)))
+        if data.get('start_time'):
+            review_session.start_time = datetime.fromisoformat(data['start_time'])
+        return review_session
+    
+    def get_document_retriever(self):
+        """Return the paragraph index used for chat context, building it if this session was restored"""
+        if self.document_retriever is None:
+            self.document_retriever = DocumentRetriever(self.sections)
+        return self.document_retriever
+
+# Review sessions, kept in memory or shared through SQLite (SESSION_BACKEND)
+def cleanup_evicted_session(review_session, reason):
+    """Release the upload file of a session dropped from the store"""
+    print(f"Evicting session {review_session.session_id} ({reason})")
+    review_session.document_object = None
+    review_session.section_paragraphs = {}
+    review_session.document_retriever = None
+    if review_session.document_path and os.path.exists(review_session.document_path):
+        os.remove(review_session.document_path)
+
+document_sessions = create_session_store(
+    Config.SESSION_BACKEND,
+    session_factory=ReviewSession.from_dict,
+    db_path=Config.SESSION_DB_PATH,
+    ttl_seconds=Config.PERMANENT_SESSION_LIFETIME.total_seconds(),
+    max_sessions=Config.SESSION_MAX_COUNT,
+    max_bytes=Config.SESSION_MAX_BYTES,
+    on_evict=cleanup_evicted_session
+)
 
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
 def load_guidelines():
-    """Load the CT EE Review guidelines and Hawkeye checklist"""
+    """Load the CT EE Review guidelines and Hawkeye checklist from their snapshots"""
     global guidelines_content, hawkeye_checklist
     
-    try:
-        if os.path.exists(GUIDELINES_PATH):
-            guidelines_content = read_docx(GUIDELINES_PATH)
-        
-        if os.path.exists(HAWKEYE_PATH):
-            hawkeye_checklist = read_docx(HAWKEYE_PATH)
+    guidelines_content = guidelines_source.get()
+    hawkeye_checklist = hawkeye_source.get()
+    return guidelines_content, hawkeye_checklist
+
+def read_docx_text(file_path):
+    """Extract text from a Word document, raising if it cannot be read"""
+    doc = Document(file_path)
+    full_text = []
+    
+    for para in doc.paragraphs:
+        full_text.append(para.text)
         
-        return guidelines_content, hawkeye_checklist
-    except Exception as e:
-        return None, None
+    for table in doc.tables:
+        for row in table.rows:
+            for cell in row.cells:
+                full_text.append(cell.text)
+                
+    return '\n'.join(full_text)
 
 def read_docx(file_path):
     """Extract text from a Word document"""
     try:
-        doc = Document(file_path)
-        full_text = []
-        
-        for para in doc.paragraphs:
-            full_text.append(para.text)
-            
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    full_text.append(cell.text)
-                    
-        return '\n'.join(full_text)
+        return read_docx_text(file_path)
     except Exception as e:
         return f"Error reading document: {str(e)}"
 
+guidelines_source = GuidelineSource(GUIDELINES_PATH, Config.GUIDELINES_SNAPSHOT_DIR, read_docx_text,
+                                    recheck_seconds=Config.GUIDELINES_RECHECK_SECONDS)
+hawkeye_source = GuidelineSource(HAWKEYE_PATH, Config.GUIDELINES_SNAPSHOT_DIR, read_docx_text,
+                                 recheck_seconds=Config.GUIDELINES_RECHECK_SECONDS)
+
 def extract_document_sections_from_docx(doc):
     """Extract sections from Word document based on bold formatting"""
     sections = {}
@@ -336,114 +478,211 @@ def extract_document_sections_from_docx(doc):
 
 def get_hawkeye_reference(category, content):
     """Map feedback to relevant Hawkeye checklist items"""
-    references = []
-    
-    keyword_mapping = {
-        1: ["customer experience", "cx impact", "customer trust", "buyer impact"],
-        2: ["investigation", "sop", "enforcement decision", "abuse pattern"],
-        3: ["seller classification", "good actor", "bad actor", "confused actor"],
-        4: ["enforcement", "violation", "warning", "suspension"],
-        5: ["verification", "supplier", "authenticity", "documentation"],
-        6: ["appeal", "repeat", "retrospective"],
-        7: ["hijacking", "security", "authentication", "secondary user"],
-        8: ["funds", "disbursement", "financial"],
-        9: ["outreach", "communication", "clarification"],
-        10: ["sentiment", "escalation", "health safety", "legal threat"],
-        11: ["root cause", "process gap", "system failure"],
-        12: ["preventative", "solution", "improvement", "mitigation"],
-        13: ["documentation", "reporting", "background"],
-        14: ["cross-team", "collaboration", "engagement"],
-        15: ["quality", "audit", "review", "performance"],
-        16: ["continuous improvement", "training", "update"],
-        17: ["communication standard", "messaging", "clarity"],
-        18: ["metrics", "tracking", "measurement"],
-        19: ["legal", "compliance", "regulation"],
-        20: ["launch", "pilot", "rollback"]
-    }
-    
-    content_lower = content.lower()
-    category_lower = category.lower()
-    
-    for section_num, keywords in keyword_mapping.items():
-        for keyword in keywords:
-            if keyword in content_lower or keyword in category_lower:
-                references.append({
-                    'number': section_num,
-                    'name': HAWKEYE_SECTIONS[section_num]
-                })
-                break
+    checkpoints, _ = hawkeye_matcher.match(category, content)
     
-    return references[:3]
+    return [{'number': num, 'name': HAWKEYE_SECTIONS[num]} for num in checkpoints[:3]]
 
 def classify_risk_level(feedback_item):
     """Classify risk level based on Hawkeye criteria"""
-    high_risk_indicators = [
-        "counterfeit", "fraud", "manipulation", "multiple violation",
-        "immediate action", "legal", "health safety", "bad actor"
-    ]
+    _, risk_level = hawkeye_matcher.match(feedback_item.get('category', ''), feedback_item.get('description', ''))
     
-    medium_risk_indicators = [
-        "pattern", "violation", "enforcement", "remediation",
-        "correction", "warning"
-    ]
+    return risk_level
+
+def classify_feedback_items(feedback_items):
+    """Fill in missing Hawkeye references and risk levels for a batch of items"""
+    matches = hawkeye_matcher.match_items(feedback_items)
     
-    content_lower = f"{feedback_item.get('description', '')} {feedback_item.get('category', '')}".lower()
+    for item, (checkpoints, risk_level) in zip(feedback_items, matches):
+        if 'hawkeye_refs' not in item:
+            item['hawkeye_refs'] = checkpoints[:3]
+        
+        if 'risk_level' not in item:
+            item['risk_level'] = risk_level
     
-    for indicator in high_risk_indicators:
-        if indicator in content_lower:
-            return "High"
+    return feedback_items
+
+def get_checklist_retriever():
+    """Return the passage index for the loaded checklist, rebuilding it if the checklist changed"""
+    global checklist_retriever
     
-    for indicator in medium_risk_indicators:
-        if indicator in content_lower:
-            return "Medium"
+    if not Config.CHECKLIST_RETRIEVAL_ENABLED or not hawkeye_checklist:
+        return None
     
-    return "Low"
+    retriever = checklist_retriever
+    if retriever is None or retriever.source is not hawkeye_checklist:
+        retriever = ChecklistRetriever(
+            hawkeye_checklist,
+            top_k=Config.CHECKLIST_TOP_K,
+            token_budget=Config.CHECKLIST_TOKEN_BUDGET
+        )
+        checklist_retriever = retriever
+    return retriever
 
-def invoke_aws_semantic_search(system_prompt, user_prompt, operation_name="LLM Analysis"):
-    """AWS Bedrock invocation with Hawkeye guidelines"""
-    global guidelines_content, hawkeye_checklist
-    
-    if guidelines_content is None or hawkeye_checklist is None:
-        guidelines_content, hawkeye_checklist = load_guidelines()
+def build_enhanced_system_prompt(system_prompt, retrieval_query=None):
+    """Append the Hawkeye checklist passages relevant to retrieval_query to a system prompt"""
+    # Served from memory; the source files are only re-checked every GUIDELINES_RECHECK_SECONDS
+    load_guidelines()
     
     enhanced_system_prompt = system_prompt
     if hawkeye_checklist:
-        truncated_hawkeye = hawkeye_checklist[:30000]
+        retriever = get_checklist_retriever()
+        if retriever is not None and retrieval_query:
+            checklist_text = '\n\n'.join(retriever.select(retrieval_query))
+        else:
+            checklist_text = hawkeye_checklist[:30000]
+        
+        # No relevant passages: send the prompt alone rather than an empty checklist heading
+        if not checklist_text:
+            return system_prompt
+        
         enhanced_system_prompt = f"""{system_prompt}
 
 HAWKEYE INVESTIGATION CHECKLIST:
-{truncated_hawkeye}
+{checklist_text}
 
 Apply these Hawkeye investigation mental models in your analysis. Reference specific checklist items when providing feedback."""
     
-    try:
-        runtime = boto3.client('bedrock-runtime')
-        
-        body = json.dumps({
-            "anthropic_version": "bedrock-2023-05-31",
-            "max_tokens": 4000,
-            "system": enhanced_system_prompt,
-            "messages": [{"role": "user", "content": user_prompt}]
-        })
-        
+    return enhanced_system_prompt
+
+def build_bedrock_request_body(system_prompt, user_prompt, retrieval_query=None):
+    """Serialize an Anthropic messages request for Bedrock"""
+    return json.dumps({
+        "anthropic_version": "bedrock-2023-05-31",
+        "max_tokens": 4000,
+        "system": build_enhanced_system_prompt(system_prompt, retrieval_query or user_prompt),
+        "messages": [{"role": "user", "content": user_prompt}]
+    })
+
+def record_bedrock_usage(operation_name, started, usage, outcome, session_id=None, section_name=None):
+    """Add one Bedrock call to the usage ledger and token metrics"""
+    input_tokens = usage.get('input_tokens', 0)
+    output_tokens = usage.get('output_tokens', 0)
+    BEDROCK_TOKENS.labels('input').inc(input_tokens)
+    BEDROCK_TOKENS.labels('output').inc(output_tokens)
+    
+    if usage_ledger is not None:
+        usage_ledger.record(
+            operation_kind(operation_name), Config.BEDROCK_MODEL_ID,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            latency_seconds=time.perf_counter() - started,
+            outcome=outcome,
+            session_id=session_id,
+            section=section_name
+        )
+
+def call_bedrock(fn):
+    """Run one Bedrock request under the retry policy, deadline and circuit breaker"""
+    return call_with_retries(
+        fn,
+        breaker=bedrock_breaker,
+        max_attempts=Config.BEDROCK_MAX_ATTEMPTS,
+        deadline_seconds=Config.BEDROCK_CALL_DEADLINE,
+        base_delay=Config.BEDROCK_RETRY_BASE_DELAY,
+        max_delay=Config.BEDROCK_RETRY_MAX_DELAY,
+        attempt_timeout=attempt_timeout(),
+        on_retry=lambda e, attempt, delay: BEDROCK_RETRIES.labels(type(e).__name__).inc()
+    )
+
+def record_bedrock_fallback(mode, operation_name, started, error, session_id=None, section_name=None):
+    """Count a fallback to the local heuristics and return its provenance"""
+    reason = fallback_reason(error)
+    if reason != 'circuit_open':
+        print(f"Bedrock {mode} failed for {operation_name}, using local analysis ({reason}): {str(error)}")
+    BEDROCK_CALLS.labels(mode, 'fallback').inc()
+    BEDROCK_FALLBACKS.labels(reason).inc()
+    record_bedrock_usage(operation_name, started, {}, 'fallback', session_id, section_name)
+    return {'analysis_source': 'local_heuristic', 'fallback_reason': reason}
+
+def invoke_bedrock(system_prompt, user_prompt, operation_name="LLM Analysis", session_id=None, section_name=None,
+                   retrieval_query=None):
+    """Invoke Bedrock and return (text, provenance), falling back to the local heuristics"""
+    body = build_bedrock_request_body(system_prompt, user_prompt, retrieval_query)
+    started = time.perf_counter()
+    
+    def invoke():
+        runtime = get_bedrock_client()
         response = runtime.invoke_model(
             body=body,
-            modelId='anthropic.claude-3-sonnet-20240229-v1:0',
+            modelId=Config.BEDROCK_MODEL_ID,
             accept="application/json",
             contentType="application/json"
         )
-        
-        response_body = json.loads(response.get('body').read())
-        return response_body['content'][0]['text']
-        
+        return json.loads(response.get('body').read())
+    
+    try:
+        with BEDROCK_IN_FLIGHT.track_inprogress(), STAGE_SECONDS.labels('bedrock_invoke').time():
+            response_body = call_bedrock(invoke)
+        text = response_body['content'][0]['text']
+    except Exception as e:
+        provenance = record_bedrock_fallback('invoke', operation_name, started, e, session_id, section_name)
+        return generate_section_specific_response(user_prompt, operation_name), provenance
+    
+    BEDROCK_CALLS.labels('invoke', 'ok').inc()
+    record_bedrock_usage(operation_name, started, response_body.get('usage', {}), 'ok', session_id, section_name)
+    return text, {'analysis_source': 'bedrock'}
+
+def invoke_aws_semantic_search(system_prompt, user_prompt, operation_name="LLM Analysis", session_id=None, section_name=None,
+                               retrieval_query=None):
+    """AWS Bedrock invocation with Hawkeye guidelines"""
+    return invoke_bedrock(system_prompt, user_prompt, operation_name, session_id, section_name, retrieval_query)[0]
+
+def invoke_aws_semantic_search_stream(system_prompt, user_prompt, operation_name="LLM Analysis", session_id=None, section_name=None,
+                                      retrieval_query=None, provenance=None, fallback=None):
+    """Stream text deltas from Bedrock, falling back to a single mock chunk
+    
+    If a provenance dict is given it is filled in with the analysis_source
+    (and fallback_reason) once the stream has started. fallback, if given,
+    returns the text to send instead of the mock response.
+    """
+    body = build_bedrock_request_body(system_prompt, user_prompt, retrieval_query)
+    started = time.perf_counter()
+    
+    def open_stream():
+        runtime = get_bedrock_client()
+        response = runtime.invoke_model_with_response_stream(
+            body=body,
+            modelId=Config.BEDROCK_MODEL_ID,
+            accept="application/json",
+            contentType="application/json"
+        )
+        stream = iter(response.get('body'))
+        return stream, next(stream, None)
+    
+    try:
+        stream, first_event = call_bedrock(open_stream)
     except Exception as e:
-        # Generate section-specific mock responses for testing
-        return generate_section_specific_response(user_prompt, operation_name)
+        fallback_provenance = record_bedrock_fallback('stream', operation_name, started, e, session_id, section_name)
+        if provenance is not None:
+            provenance.update(fallback_provenance)
+        yield fallback() if fallback is not None else generate_section_specific_response(user_prompt, operation_name)
+        return
+    
+    BEDROCK_CALLS.labels('stream', 'ok').inc()
+    if provenance is not None:
+        provenance['analysis_source'] = 'bedrock'
+    
+    # Once text has been sent the stream cannot switch to the mock path,
+    # so errors past this point propagate to the caller.
+    usage = {}
+    outcome = 'error'
+    try:
+        for event in itertools.chain([first_event] if first_event else [], stream):
+            chunk = event.get('chunk')
+            if chunk:
+                payload = json.loads(chunk['bytes'])
+                if payload.get('type') == 'content_block_delta':
+                    yield payload.get('delta', {}).get('text', '')
+                elif payload.get('type') == 'message_start':
+                    usage.update(payload.get('message', {}).get('usage', {}))
+                elif payload.get('type') == 'message_delta':
+                    usage.update(payload.get('usage', {}))
+        outcome = 'ok'
+    finally:
+        record_bedrock_usage(operation_name, started, usage, outcome, session_id, section_name)
 
 def generate_section_specific_response(user_prompt, operation_name):
     """Generate section-specific responses based on content analysis"""
-    time.sleep(1)
-    
     if "chat" in operation_name.lower():
         # Extract actual question from user prompt
         question = user_prompt.lower()
@@ -470,6 +709,16 @@ def generate_section_specific_response(user_prompt, operation_name):
         else:
             return f"I'm TARA, your CT review assistant. I can help with: Hawkeye checkpoints (#1-20), seller classification, risk assessment, investigation best practices, or specific feedback items. What would you like to know?"
     
+    if "PACKED SECTIONS:" in user_prompt:
+        # Keyed response for several sections analyzed in one request
+        start = user_prompt.find('PACKED SECTIONS:') + 16
+        end = user_prompt.find('SECTION-SPECIFIC GUIDANCE:', start)
+        blocks = re.split(r'^### (S\d+): "(.*)"$', user_prompt[start:end], flags=re.MULTILINE)
+        return json.dumps({"sections": {
+            section_id: {"feedback_items": generate_contextual_feedback(name, content.strip())}
+            for section_id, name, content in zip(blocks[1::3], blocks[2::3], blocks[3::3])
+        }})
+    
     # Extract section name and content for analysis
     section_name = "Unknown Section"
     section_content = ""
@@ -483,7 +732,8 @@ def generate_section_specific_response(user_prompt, operation_name):
     
     if "SECTION CONTENT:" in user_prompt:
         start = user_prompt.find('SECTION CONTENT:') + 16
-        section_content = user_prompt[start:start+1000].strip()
+        end = user_prompt.find('SECTION-SPECIFIC GUIDANCE:', start)
+        section_content = user_prompt[start:end if end != -1 else None].strip()
     
     # Generate section-specific feedback
     feedback_items = generate_contextual_feedback(section_name, section_content)
@@ -604,7 +854,7 @@ def generate_contextual_feedback(section_name, content):
                 "category": "Investigation Process",
                 "description": "Investigation process documentation fails to meet Hawkeye #2 standards by not adequately demonstrating SOP adherence, critical thinking, or decision-making rationale. This creates audit risks and reduces investigation credibility.",
                 "suggestion": "Provide comprehensive investigation documentation including: 1) Specific SOPs followed with version numbers, 2) Detailed rationale for any deviations, 3) Critical thinking examples where standard procedures were challenged, 4) Decision trees showing alternative approaches considered, 5) Consultation records with other teams, 6) Quality control checkpoints completed",
-                "example": "Investigation Methodology:\n\nSOPs Applied:\n• SOP-CT-001 v2.3: Initial Assessment [Completed: Date, Analyst: Name]\n• SOP-CT-015 v1.8: Evidence Collection [Deviation at Step 5 - See below]\n\nCritical Thinking Applied:\n• Standard procedure suggested [X], but unique circumstances [Y] required alternative approach\n• Challenged assumption [A] based on evidence [B], leading to discovery [C]\n\nDeviations & Rationale:\n• Step 5 of SOP-CT-015: Used [alternative method] instead of [standard method] because [specific technical/legal reason]\n• Consulted with [Team/Expert] who confirmed approach validity\n\nQuality Controls:\n• Peer review completed by [Name] on [Date]\n• Supervisor approval obtained for deviations\n• Documentation audit trail maintained"
+                "example": "Investigation Methodology:\n\nSOPs Applied:\n• SOP-CT-001 v2.3: Initial Assessment [Completed: Date, Analyst: Name]\n• SOP-CT-015 v1.8: Evidence Collection [Deviation at Step 5 - See below]\n\nCritical Thinking Applied:\n• Standard procedure suggested [X], but unique circumstances [Y] required alternative approach\n• Challenged assumption [A] based on evidence [B], leading to discovery [C]\n\nDeviations & Rationale:\n• Step 5 of SOP-CT-015: Used [alternative method] instead of [standard method] because [specific technical/legal reason]\n• Consulted with [Team/Expert] who confirmed approach validity\n\nQuality Controls:\n• Peer review completed by [Name] on [Date]\n• Supervisor approval obtained for deviations\n• Documentation audit trail maintained",
                 "questions": [
                     "Which SOPs were followed?",
                     "Were any standard procedures challenged or modified?",
@@ -643,26 +893,29 @@ def generate_contextual_feedback(section_name, content):
             })
     
     # Ensure each feedback item has required fields
-    for item in feedback_items:
-        if 'hawkeye_refs' not in item:
-            refs = get_hawkeye_reference(item.get('category', ''), item.get('description', ''))
-            item['hawkeye_refs'] = [ref['number'] for ref in refs]
-        
-        if 'risk_level' not in item:
-            item['risk_level'] = classify_risk_level(item)
-    
-    return feedback_items
+    return classify_feedback_items(feedback_items)
+
+def build_section_retrieval_query(section_name, section_content):
+    """Text used to pick the checklist passages for a section analysis"""
+    return f"{section_name}\n{get_section_specific_guidance(section_name)}\n{section_content[:3000]}"
 
-def analyze_section_with_ai(section_name, section_content, doc_type="Full Write-up"):
-    """Analyze a single section with Hawkeye framework"""
+def build_section_analysis_prompts(section_name, section_content, doc_type="Full Write-up", part=None):
+    """Build the system and user prompts for a section analysis
+    
+    part is (number, total) when section_content is one chunk of a long section.
+    """
     
     # Create detailed analysis prompt with section-specific guidance
     section_guidance = get_section_specific_guidance(section_name)
     
+    part_note = ""
+    if part and part[1] > 1:
+        part_note = f"\nThis is part {part[0]} of {part[1]} of the section; the other parts are reviewed separately, so only comment on this part.\n"
+    
     prompt = f"""Analyze this section "{section_name}" from a {doc_type} document using the Hawkeye investigation framework.
-
+{part_note}
 SECTION CONTENT:
-{section_content[:3000]}
+{section_content}
 
 SECTION-SPECIFIC GUIDANCE:
 {section_guidance}
@@ -702,35 +955,452 @@ Return feedback in this JSON format:
 Analyze the provided section content thoroughly and provide specific, actionable feedback based on what is actually written (or missing) in the content.
 Focus on document-centric analysis rather than generic advice."""
     
-    response = invoke_aws_semantic_search(system_prompt, prompt, f"Detailed Hawkeye Analysis: {section_name}")
+    return system_prompt, prompt
+
+def build_packed_analysis_prompts(section_ids, sections, doc_type="Full Write-up"):
+    """Build prompts reviewing several short sections in one request
     
-    try:
-        result = json.loads(response)
-    except:
-        json_match = re.search(r'\{.*\}', response, re.DOTALL)
-        if json_match:
-            try:
-                result = json.loads(json_match.group(0))
-            except:
-                result = {"feedback_items": []}
-        else:
-            result = {"feedback_items": []}
+    section_ids maps the keys used in the response ("S1", "S2", ...) to section names.
+    """
+    section_blocks = '\n\n'.join(
+        f'### {section_id}: "{name}"\n{sections[name]}' for section_id, name in section_ids.items()
+    )
+    guidance_blocks = '\n\n'.join(
+        f'{section_id} ({name}):\n{get_section_specific_guidance(name)}' for section_id, name in section_ids.items()
+    )
+    example_ids = list(section_ids)[:2]
+    
+    prompt = f"""Analyze each of the following {len(section_ids)} sections from a {doc_type} document using the Hawkeye investigation framework.
+Review every section on its own merits; feedback for one section must only refer to that section's content.
+
+PACKED SECTIONS:
+{section_blocks}
+
+SECTION-SPECIFIC GUIDANCE:
+{guidance_blocks}
+
+Provide detailed, document-specific feedback following the 20-point Hawkeye checklist. For each feedback item, include:
+- Specific references to the actual content
+- Detailed suggestions for improvement
+- Relevant Hawkeye checkpoint numbers (#1-20)
+- Risk classification based on impact
+- Specific questions that should be answered
+
+Return feedback in this JSON format, with one entry per section key ({', '.join(section_ids)}):
+{{
+    "sections": {{
+        "{example_ids[0]}": {{
+            "feedback_items": [
+                {{
+                    "id": "unique_id",
+                    "type": "critical|important|suggestion|positive",
+                    "category": "category matching Hawkeye sections",
+                    "description": "Detailed description referencing specific content and Hawkeye criteria",
+                    "suggestion": "Specific, actionable suggestion based on content analysis",
+                    "example": "Concrete example or template for improvement",
+                    "questions": ["Specific question about this content?", "What should be clarified?"],
+                    "hawkeye_refs": [1, 11, 12],
+                    "risk_level": "High|Medium|Low",
+                    "confidence": 0.95
+                }}
+            ]
+        }},
+        "{example_ids[-1]}": {{"feedback_items": []}}
+    }}
+}}"""
     
-    # Enhance feedback items with additional context
-    for item in result.get('feedback_items', []):
-        if 'hawkeye_refs' not in item:
-            refs = get_hawkeye_reference(item.get('category', ''), item.get('description', ''))
-            item['hawkeye_refs'] = [ref['number'] for ref in refs]
-        
-        if 'risk_level' not in item:
-            item['risk_level'] = classify_risk_level(item)
-        
+    system_prompt = f"""You are an expert CT EE document reviewer with deep knowledge of the Hawkeye investigation framework. 
+Analyze each provided section thoroughly and provide specific, actionable feedback based on what is actually written (or missing) in it.
+Focus on document-centric analysis rather than generic advice."""
+    
+    return system_prompt, prompt
+
+def enrich_feedback_items(feedback_items, section_name):
+    """Fill in Hawkeye references, risk level and section context"""
+    for item in classify_feedback_items(feedback_items):
         # Add section context to description
         if 'description' in item and section_name not in item['description']:
             item['description'] = f"In '{section_name}': {item['description']}"
     
+    return feedback_items
+
+def parse_feedback_response(response):
+    """Parse the feedback JSON out of a model response"""
+    with STAGE_SECONDS.labels('json_parse').time():
+        try:
+            return json.loads(response)
+        except:
+            json_match = re.search(r'\{.*\}', response, re.DOTALL)
+            if json_match:
+                try:
+                    return json.loads(json_match.group(0))
+                except:
+                    pass
+            return {"feedback_items": []}
+
+def combine_provenance(provenances):
+    """A merged analysis counts as Bedrock's only if every chunk came from Bedrock"""
+    for provenance in provenances:
+        if provenance.get('analysis_source') != 'bedrock':
+            return dict(provenance)
+    return {'analysis_source': 'bedrock'}
+
+def analyze_section_chunk(section_name, paragraphs, chunk, part, doc_type="Full Write-up", session_id=None, lane=None):
+    """Analyze one chunk of a section, returning (classified feedback items, provenance)"""
+    system_prompt, prompt = build_section_analysis_prompts(section_name, chunk['text'], doc_type, part)
+    
+    with (lane or interactive_lane).slots:
+        response, provenance = invoke_bedrock(
+            system_prompt, prompt, f"Detailed Hawkeye Analysis: {section_name}",
+            session_id=session_id, section_name=section_name,
+            retrieval_query=build_section_retrieval_query(section_name, chunk['text'])
+        )
+    
+    feedback_items = parse_feedback_response(response).get('feedback_items', [])
+    if part[1] > 1:
+        # Chunks are analyzed independently, so keep their item ids apart
+        for item in feedback_items:
+            item['id'] = f"{item.get('id', 'item')}_p{part[0]}"
+    attach_source_paragraphs(feedback_items, paragraphs, chunk['paragraphs'])
+    return classify_feedback_items(feedback_items), provenance
+
+def analyze_section_with_ai(section_name, section_content, doc_type="Full Write-up", session_id=None, lane=None):
+    """Analyze a single section with Hawkeye framework
+    
+    Sections longer than SECTION_CHUNK_TOKENS are split on paragraph
+    boundaries, the chunks analyzed in parallel on the caller's lane and
+    their feedback merged.
+    """
+    lane = lane or interactive_lane
+    paragraphs = section_content.split('\n')
+    chunks = split_section_chunks(paragraphs, Config.SECTION_CHUNK_TOKENS)
+    
+    if len(chunks) <= 1:
+        feedback_items, provenance = analyze_section_chunk(
+            section_name, paragraphs, chunks[0] if chunks else {'text': '', 'paragraphs': []}, (1, 1), doc_type, session_id, lane
+        )
+        provenances = [provenance]
+    else:
+        futures = [
+            lane.chunk_executor.submit(analyze_section_chunk, section_name, paragraphs, chunk,
+                                       (number, len(chunks)), doc_type, session_id, lane)
+            for number, chunk in enumerate(chunks, 1)
+        ]
+        chunk_results = [future.result() for future in futures]
+        feedback_items = merge_feedback_items([items for items, _ in chunk_results])
+        provenances = [provenance for _, provenance in chunk_results]
+    
+    # Enhance feedback items with additional context
+    result = {'feedback_items': enrich_feedback_items(feedback_items, section_name)}
+    result.update(combine_provenance(provenances))
+    if len(chunks) > 1:
+        result['chunks'] = len(chunks)
+    
+    return result
+
+def stream_section_analysis(section_name, section_content, doc_type="Full Write-up", session_id=None, provenance=None):
+    """Yield enriched feedback items as Bedrock streams them
+    
+    Long sections are analyzed chunk by chunk in parallel and each chunk's
+    new (non-duplicate) items are yielded as soon as that chunk finishes.
+    """
+    paragraphs = section_content.split('\n')
+    chunks = split_section_chunks(paragraphs, Config.SECTION_CHUNK_TOKENS)
+    
+    if len(chunks) > 1:
+        futures = [
+            interactive_lane.chunk_executor.submit(analyze_section_chunk, section_name, paragraphs, chunk,
+                                                   (number, len(chunks)), doc_type, session_id)
+            for number, chunk in enumerate(chunks, 1)
+        ]
+        yielded = []
+        provenances = []
+        try:
+            for future in as_completed(futures):
+                feedback_items, chunk_provenance = future.result()
+                provenances.append(chunk_provenance)
+                for item in drop_duplicate_items(yielded, feedback_items):
+                    yielded.append(item)
+                    yield enrich_feedback_items([dict(item)], section_name)[0]
+        finally:
+            for future in futures:
+                future.cancel()
+        if provenance is not None:
+            provenance.update(combine_provenance(provenances))
+        return
+    
+    chunk = chunks[0] if chunks else {'text': '', 'paragraphs': []}
+    system_prompt, prompt = build_section_analysis_prompts(section_name, chunk['text'], doc_type)
+    parser = FeedbackItemStreamParser()
+    
+    with interactive_lane.slots:
+        stream = invoke_aws_semantic_search_stream(
+            system_prompt, prompt, f"Detailed Hawkeye Analysis: {section_name}",
+            session_id=session_id, section_name=section_name,
+            retrieval_query=build_section_retrieval_query(section_name, section_content),
+            provenance=provenance
+        )
+        for text in stream:
+            feedback_items = attach_source_paragraphs(parser.feed(text), paragraphs, chunk['paragraphs'])
+            for item in enrich_feedback_items(feedback_items, section_name):
+                yield item
+
+def get_section_cache_key(section_name, section_content):
+    """Build the session cache key for a section analysis"""
+    return f"{section_name}_{make_cache_key(section_content)[:16]}"
+
+def get_session_feedback(review_session, cache_key):
+    """Return a session's cached analysis, unless it is a heuristic fallback Bedrock can now replace"""
+    result = review_session.ai_feedback_cache.get(cache_key)
+    if result is not None and result.get('analysis_source') == 'local_heuristic' and bedrock_breaker.state == 'closed':
+        return None
     return result
 
+def find_previous_version(review_session, previous_session_id=None):
+    """Return the earlier review this upload is a revision of, or None
+
+    A previous session named by the client needs a matching file name or
+    mostly unchanged sections. The browser's current review, picked
+    implicitly, needs both, so another write-up with a similar file name
+    or shared boilerplate sections never inherits its decisions.
+    """
+    previous_id = previous_session_id or session.get('session_id')
+    if not previous_id or previous_id == review_session.session_id:
+        return None
+    previous = document_sessions.get(previous_id)
+    if previous is None:
+        return None
+    if not is_revision(
+        previous.document_name, previous.sections, review_session.document_name, review_session.sections,
+        require_both=not previous_session_id
+    ):
+        return None
+    return previous
+
+def carry_over_review(previous, review_session):
+    """Start a revision's review from the previous version's
+
+    For sections whose text is unchanged, the cached analysis and the
+    accepted, rejected and user feedback are copied, and their Word
+    comments are moved to the same paragraphs of the new file, so only
+    changed and new sections are analyzed again. Returns the section diff
+    and the carried decisions by section and feedback item id.
+    """
+    diff = diff_sections(previous.sections, review_session.sections)
+    review_session.revision_of = previous.session_id
+    review_session.revision_round = previous.revision_round + 1
+    
+    decisions = {}
+    for name in diff['unchanged']:
+        result = previous.ai_feedback_cache.get(get_section_cache_key(name, previous.sections[name]))
+        if result is not None:
+            review_session.ai_feedback_cache[get_section_cache_key(name, review_session.sections[name])] = copy.deepcopy(result)
+        
+        for field in ('accepted_feedback', 'rejected_feedback', 'user_feedback'):
+            items = getattr(previous, field).get(name)
+            if items:
+                getattr(review_session, field)[name] = copy.deepcopy(items)
+        
+        section_decisions = {item.get('id'): 'rejected' for item in previous.rejected_feedback.get(name, [])}
+        section_decisions.update({item.get('id'): 'accepted' for item in previous.accepted_feedback.get(name, [])})
+        if section_decisions:
+            decisions[name] = section_decisions
+        
+        previous_indices = previous.paragraph_indices.get(name, [])
+        indices = review_session.paragraph_indices.get(name, [])
+        for comment in previous.document_comments:
+            if comment.get('section') != name or not indices:
+                continue
+            position = previous_indices.index(comment['paragraph_index']) if comment['paragraph_index'] in previous_indices else 0
+            review_session.document_comments.append(dict(comment, paragraph_index=indices[min(position, len(indices) - 1)]))
+    
+    for change, names in diff.items():
+        REVISION_SECTIONS.labels(change).inc(len(names))
+    
+    return dict(diff, previous_session_id=previous.session_id, round=review_session.revision_round, decisions=decisions)
+
+def get_checklist_version():
+    """Digest of the loaded guideline documents used in analysis prompts"""
+    load_guidelines()
+    return make_cache_key(guidelines_source.sha256 or '', hawkeye_source.sha256 or '')[:16]
+
+def get_analysis_cache_key(section_name, section_content, doc_type="Full Write-up"):
+    """Build the persistent cache key for a section analysis"""
+    return make_cache_key(
+        section_name, doc_type, section_content,
+        Config.BEDROCK_MODEL_ID, ANALYSIS_PROMPT_VERSION, get_checklist_version()
+    )
+
+def analyze_section_cached(section_name, section_content, doc_type="Full Write-up", session_id=None, lane=None):
+    """Analyze a section, reusing cached results and sharing identical analyses already in flight"""
+    cache_key = get_analysis_cache_key(section_name, section_content, doc_type)
+    if analysis_cache is not None:
+        result = analysis_cache.get(cache_key)
+        if result is not None:
+            return result
+    
+    def analyze():
+        result = analyze_section_with_ai(section_name, section_content, doc_type, session_id, lane)
+        # Heuristic fallbacks are not persisted, so the section is re-analyzed once Bedrock recovers
+        if analysis_cache is not None and result.get('analysis_source') == 'bedrock':
+            analysis_cache.set(cache_key, result)
+        return result
+    
+    result, shared = analysis_flights.do(cache_key, analyze)
+    # Shared results end up in several sessions, so each waiter gets its own copy
+    return copy.deepcopy(result) if shared else result
+
+def analyze_packed_sections(sections, doc_type="Full Write-up", session_id=None, lane=None):
+    """Analyze several short sections (name -> content) in one Bedrock request
+    
+    Returns {section name: result} for the sections the response covered.
+    """
+    section_ids = {f"S{number}": name for number, name in enumerate(sections, 1)}
+    system_prompt, prompt = build_packed_analysis_prompts(section_ids, sections, doc_type)
+    
+    with (lane or interactive_lane).slots:
+        response, provenance = invoke_bedrock(
+            system_prompt, prompt, f"Packed Hawkeye Analysis: {len(sections)} sections",
+            session_id=session_id, section_name=', '.join(sections),
+            retrieval_query=' '.join(build_section_retrieval_query(name, content) for name, content in sections.items())
+        )
+    
+    # A reply that is valid JSON but not an object (a list, a string) leaves every section to the fallback
+    parsed = parse_feedback_response(response)
+    packed = parsed.get('sections') if isinstance(parsed, dict) else None
+    results = {}
+    for section_id, name in section_ids.items():
+        entry = packed.get(section_id) if isinstance(packed, dict) else None
+        if not isinstance(entry, dict) or not isinstance(entry.get('feedback_items'), list):
+            continue
+        paragraphs = sections[name].split('\n')
+        feedback_items = attach_source_paragraphs(entry['feedback_items'], paragraphs, list(range(len(paragraphs))))
+        results[name] = dict({'feedback_items': enrich_feedback_items(feedback_items, name), 'packed': len(sections)},
+                             **provenance)
+    
+    PACKED_SECTIONS.inc(len(results))
+    return results
+
+def analyze_section_group(sections, doc_type="Full Write-up", session_id=None, lane=None):
+    """Analyze a group of sections (name -> content), returning {section name: result}
+    
+    Cached results and identical analyses already in flight are reused; the
+    remaining sections share one packed request, and any section the packed
+    response missed is analyzed on its own.
+    """
+    if len(sections) == 1:
+        name, content = next(iter(sections.items()))
+        return {name: analyze_section_cached(name, content, doc_type, session_id, lane)}
+    
+    results = {}
+    leading = {}
+    waiting = {}
+    for name, content in sections.items():
+        cache_key = get_analysis_cache_key(name, content, doc_type)
+        cached = analysis_cache.get(cache_key) if analysis_cache is not None else None
+        if cached is not None:
+            results[name] = cached
+            continue
+        flight, leader = analysis_flights.begin(cache_key)
+        (leading if leader else waiting)[name] = (cache_key, flight)
+    
+    try:
+        if len(leading) > 1:
+            results.update(analyze_packed_sections({name: sections[name] for name in leading}, doc_type, session_id, lane))
+        for name, (cache_key, _) in leading.items():
+            if name not in results:
+                results[name] = analyze_section_with_ai(name, sections[name], doc_type, session_id, lane)
+            if analysis_cache is not None and results[name].get('analysis_source') == 'bedrock':
+                analysis_cache.set(cache_key, results[name])
+    finally:
+        for name, (cache_key, flight) in leading.items():
+            analysis_flights.finish(cache_key, flight, result=results.get(name))
+    
+    for name, (_, flight) in waiting.items():
+        shared = analysis_flights.wait(flight)
+        if shared is not None:
+            results[name] = copy.deepcopy(shared)
+        else:
+            results[name] = analyze_section_cached(name, sections[name], doc_type, session_id, lane)
+    
+    return results
+
+def submit_section_analyses(executor, sections, doc_type="Full Write-up", session_id=None, lane=None):
+    """Queue analyses of sections (name -> content) on executor, packing short sections together
+    
+    Their Bedrock calls, including those for chunks of long sections, count
+    against lane (the interactive lane by default). Returns {future: [section
+    names]}; each future resolves to {section name: result}.
+    """
+    futures = {}
+    small = {}
+    for name, content in sections.items():
+        if Config.SECTION_PACKING_ENABLED and estimate_tokens(content) <= Config.SECTION_PACK_SMALL_TOKENS:
+            small[name] = content
+        else:
+            futures[executor.submit(analyze_section_group, {name: content}, doc_type, session_id, lane)] = [name]
+    
+    for pack in pack_sections(small, Config.SECTION_PACK_TOKEN_BUDGET, Config.SECTION_PACK_MAX_SECTIONS):
+        group = {name: small[name] for name in pack}
+        futures[executor.submit(analyze_section_group, group, doc_type, session_id, lane)] = pack
+    
+    return futures
+
+def analyze_document_sections(review_session, doc_type="Full Write-up", progress_callback=None, cancel_event=None):
+    """Analyze every section of a review session concurrently"""
+    results = {}
+    errors = {}
+    pending = {}
+    
+    for section_name, section_content in review_session.sections.items():
+        cached = get_session_feedback(review_session, get_section_cache_key(section_name, section_content))
+        if cached is not None:
+            SESSION_CACHE_LOOKUPS.labels('hit').inc()
+            results[section_name] = cached
+        else:
+            SESSION_CACHE_LOOKUPS.labels('miss').inc()
+            pending[section_name] = section_content
+    
+    futures = submit_section_analyses(analysis_executor, pending, doc_type, review_session.session_id)
+    
+    completed = 0
+    for future in as_completed(futures):
+        section_names = futures[future]
+        
+        if cancel_event is not None and cancel_event.is_set():
+            for queued in futures:
+                queued.cancel()
+            break
+        
+        try:
+            group_results = future.result()
+        except Exception as e:
+            group_results = {}
+            for section_name in section_names:
+                print(f"Error analyzing section {section_name}: {str(e)}")
+                errors[section_name] = str(e)
+        
+        for section_name in section_names:
+            completed += 1
+            if progress_callback:
+                progress_callback(completed, len(pending), section_name)
+            if section_name in group_results:
+                result = group_results[section_name]
+                cache_key = get_section_cache_key(section_name, pending[section_name])
+                document_sessions.cache_feedback(review_session, cache_key, result)
+                results[section_name] = result
+    
+    # Report sections in document order rather than completion order
+    ordered = {name: results[name] for name in review_session.sections if name in results}
+    
+    return {
+        'sections': ordered,
+        'errors': errors,
+        'analyzed_count': len(pending) - len(errors),
+        'cached_count': len(review_session.sections) - len(pending),
+        'total_feedback': sum(len(r.get('feedback_items', [])) for r in ordered.values())
+    }
+
 def get_section_specific_guidance(section_name):
     """Get specific guidance for different section types"""
     section_lower = section_name.lower()
@@ -791,31 +1461,58 @@ def get_section_specific_guidance(section_name):
 - Cross-team collaboration details (Hawkeye #14)
 - Quality assurance measures"""
 
-def process_chat_query(query, context, session_id):
-    """Process chat query with context awareness"""
-    session = document_sessions.get(session_id)
-    if not session:
-        return "No active session found."
-    
-    current_section = context.get('current_section', 'None')
+def build_chat_context(query, current_section, session):
+    """Return the document excerpts and cached feedback most relevant to a chat question
+
+    Paragraphs are retrieved from every section of the document. Feedback
+    already generated for the sections they come from is added while the
+    CHAT_CONTEXT_TOKEN_BUDGET allows.
+    """
+    retrieval_query = query if current_section == 'None' else f"{query}\n{current_section}"
+    excerpts = session.get_document_retriever().select(
+        retrieval_query, Config.CHAT_CONTEXT_TOP_K, Config.CHAT_CONTEXT_TOKEN_BUDGET
+    )
+    used = sum(estimate_tokens(text) for _, _, text in excerpts)
+    
+    excerpt_lines = [f"[{section_name}] {text}" for section_name, _, text in excerpts]
+    
+    feedback_lines = []
+    for section_name in dict.fromkeys(name for name, _, _ in excerpts):
+        cached = session.ai_feedback_cache.get(get_section_cache_key(section_name, session.sections.get(section_name, '')))
+        for item in (cached or {}).get('feedback_items', []):
+            line = f"[{section_name}] {item.get('category', 'General')} ({item.get('risk_level', 'Low')}): {item.get('description', '')}"
+            tokens = estimate_tokens(line)
+            if used + tokens > Config.CHAT_CONTEXT_TOKEN_BUDGET:
+                break
+            feedback_lines.append(line)
+            used += tokens
     
-    # Get current section content for context
-    section_content = ""
-    if current_section != 'None' and current_section in session.sections:
-        section_content = session.sections[current_section][:500]  # First 500 chars for context
+    return excerpt_lines, feedback_lines
+
+def build_chat_prompts(query, context, session):
+    """Build (system prompt, prompt, section name, retrieval query) for a chat question"""
+    current_section = context.get('current_section') or 'None'
     
-    # Get current feedback for context
+    # Get current feedback for context (cached under the section's content key)
     current_feedback = ""
-    if current_section in session.ai_feedback_cache:
-        feedback_items = session.ai_feedback_cache[current_section].get('feedback_items', [])
+    if current_section in session.sections:
+        cached = session.ai_feedback_cache.get(get_section_cache_key(current_section, session.sections[current_section]))
+        feedback_items = cached.get('feedback_items', []) if cached else []
         if feedback_items:
             current_feedback = f"Current feedback includes {len(feedback_items)} items: " + ", ".join([item.get('category', 'General') for item in feedback_items[:3]])
     
+    excerpt_lines, feedback_lines = build_chat_context(query, current_section, session)
+    
     context_info = f"""
     Current Section: {current_section}
-    Section Content Preview: {section_content[:200]}...
     Current Feedback: {current_feedback}
     Document Type: Full Write-up
+    
+    RELEVANT DOCUMENT EXCERPTS:
+    {chr(10).join(excerpt_lines) or 'None found'}
+    
+    RELATED REVIEW FEEDBACK:
+    {chr(10).join(feedback_lines) or 'None yet'}
     """
     
     prompt = f"""You are an AI assistant helping with document review using the Hawkeye framework.
@@ -848,30 +1545,74 @@ The 20-point Hawkeye checklist includes:
 
 USER QUESTION: {query}
 
-Provide a helpful, specific response that references the Hawkeye guidelines and current section context when relevant. Be concise but thorough."""
+Provide a helpful, specific response that references the Hawkeye guidelines and the document excerpts when relevant. Be concise but thorough."""
     
     system_prompt = "You are an expert assistant for the Hawkeye document review system with deep knowledge of CT EE guidelines."
     
-    response = invoke_aws_semantic_search(system_prompt, prompt, f"Chat Assistant - {query[:50]}")
+    section_name = current_section if current_section != 'None' else None
+    return system_prompt, prompt, section_name, '\n'.join([query, current_section] + excerpt_lines)
+
+def process_chat_query(query, context, session_id):
+    """Process chat query with context awareness, returning (answer, provenance)"""
+    session = document_sessions.get(session_id)
+    if not session:
+        return "No active session found.", {'analysis_source': 'local_heuristic'}
     
-    return response
+    system_prompt, prompt, section_name, retrieval_query = build_chat_prompts(query, context, session)
+    response, provenance = invoke_bedrock(
+        system_prompt, prompt, f"Chat Assistant - {query[:50]}",
+        session_id=session_id, section_name=section_name, retrieval_query=retrieval_query
+    )
+    
+    if provenance.get('analysis_source') != 'bedrock':
+        response = get_direct_chat_response(query)
+    return response, provenance
+
+def stream_chat_response(query, context, session, provenance=None):
+    """Yield a chat answer as Bedrock streams it; the static answer is the instant fallback"""
+    system_prompt, prompt, section_name, retrieval_query = build_chat_prompts(query, context, session)
+    
+    return invoke_aws_semantic_search_stream(
+        system_prompt, prompt, f"Chat Assistant - {query[:50]}",
+        session_id=session.session_id, section_name=section_name, retrieval_query=retrieval_query,
+        provenance=provenance, fallback=lambda: get_direct_chat_response(query)
+    )
+
+def feedback_paragraph_index(paragraph_indices, feedback_item):
+    """Document paragraph a feedback comment is anchored to: the item's source paragraph when known"""
+    position = feedback_item.get('source_paragraph', 0)
+    if not isinstance(position, int) or not 0 <= position < len(paragraph_indices):
+        position = 0
+    return paragraph_indices[position]
+
+def build_feedback_comment(feedback_item):
+    """Format an accepted feedback item as Word comment text"""
+    comment_text = f"[{feedback_item['type'].upper()} - {feedback_item.get('risk_level', 'Low')} Risk]\n"
+    comment_text += f"{feedback_item['description']}\n"
+    if feedback_item.get('suggestion'):
+        comment_text += f"\nSuggestion: {feedback_item['suggestion']}\n"
+    if feedback_item.get('hawkeye_refs'):
+        refs = [f"#{r} {HAWKEYE_SECTIONS.get(r, '')}" for r in feedback_item['hawkeye_refs']]
+        comment_text += f"\nHawkeye References: {', '.join(refs)}"
+    return comment_text
 
 def create_reviewed_document_with_proper_comments(original_doc_path, doc_name, comments_data):
     """Create a copy of the original document with proper Word comments"""
     
     try:
-        doc_with_comments = WordDocumentWithComments(original_doc_path)
-        
-        for comment_data in comments_data:
-            author = comment_data.get('author', 'AI Feedback')
-            doc_with_comments.add_comment(
-                paragraph_index=comment_data['paragraph_index'],
-                comment_text=comment_data['comment'],
-                author=author
-            )
-        
-        output_path = os.path.join(OUTPUT_FOLDER, f'reviewed_{doc_name}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.docx')
-        success = doc_with_comments.save_with_comments(output_path)
+        with STAGE_SECONDS.labels('comment_render').time():
+            doc_with_comments = WordDocumentWithComments(original_doc_path)
+            
+            for comment_data in comments_data:
+                author = comment_data.get('author', 'AI Feedback')
+                doc_with_comments.add_comment(
+                    paragraph_index=comment_data['paragraph_index'],
+                    comment_text=comment_data['comment'],
+                    author=author
+                )
+            
+            output_path = os.path.join(OUTPUT_FOLDER, f'reviewed_{doc_name}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.docx')
+            success = doc_with_comments.save_with_comments(output_path)
         
         if success:
             return output_path
@@ -916,6 +1657,332 @@ def create_simple_reviewed_copy(original_doc_path, doc_name, comments_data):
         print(f"Error creating simple copy: {str(e)}")
         return None
 
+# Batch review of many documents at once
+RISK_LEVEL_RANK = {'Low': 0, 'Medium': 1, 'High': 2}
+
+BATCH_SUMMARY_FIELDS = [
+    'document', 'status', 'sections', 'feedback_items', 'auto_accepted',
+    'accepted_high', 'accepted_medium', 'accepted_low', 'heuristic_sections', 'output_file', 'elapsed_seconds', 'error'
+]
+
+def collect_batch_documents(files, batch_dir):
+    """Save uploaded .docx files and the .docx members of uploaded zips into batch_dir"""
+    documents = []
+    used_names = set()
+    total_bytes = 0
+    
+    def reserve_path(name):
+        filename = secure_filename(os.path.basename(name))
+        if not allowed_file(filename):
+            filename = f"document_{len(documents) + 1}.docx"
+        unique_name = filename
+        counter = 1
+        while unique_name.lower() in used_names:
+            counter += 1
+            unique_name = f"{counter}_{filename}"
+        used_names.add(unique_name.lower())
+        return unique_name, os.path.join(batch_dir, unique_name)
+    
+    def check_limits(size):
+        if len(documents) >= Config.BATCH_MAX_DOCUMENTS:
+            raise ValueError(f'Batch exceeds {Config.BATCH_MAX_DOCUMENTS} documents')
+        if total_bytes + size > Config.BATCH_MAX_EXTRACT_BYTES:
+            raise ValueError(f'Batch exceeds {Config.BATCH_MAX_EXTRACT_BYTES // (1024 * 1024)}MB of documents')
+    
+    for file in files:
+        if not file.filename:
+            continue
+        
+        if file.filename.lower().endswith('.zip'):
+            with zipfile.ZipFile(file.stream) as archive:
+                for info in archive.infolist():
+                    basename = os.path.basename(info.filename)
+                    if info.is_dir() or not allowed_file(basename) or basename.startswith('~$') or '__MACOSX' in info.filename:
+                        continue
+                    check_limits(info.file_size)
+                    name, path = reserve_path(info.filename)
+                    with archive.open(info) as src, open(path, 'wb') as dst:
+                        shutil.copyfileobj(src, dst)
+                    total_bytes += info.file_size
+                    documents.append((name, path))
+        elif allowed_file(file.filename):
+            check_limits(0)
+            name, path = reserve_path(file.filename)
+            file.save(path)
+            total_bytes += os.path.getsize(path)
+            documents.append((name, path))
+    
+    return documents
+
+def select_auto_accepted(feedback_items, min_risk, min_confidence):
+    """Return the feedback items at or above the risk and confidence thresholds"""
+    threshold = RISK_LEVEL_RANK.get(min_risk, RISK_LEVEL_RANK['High'])
+    accepted = []
+    for item in feedback_items:
+        try:
+            confidence = float(item.get('confidence') or 0)
+        except (TypeError, ValueError):
+            confidence = 0.0
+        if RISK_LEVEL_RANK.get(item.get('risk_level', 'Low'), 0) >= threshold and confidence >= min_confidence:
+            accepted.append(item)
+    return accepted
+
+def finish_batch_document(name, path, sections, paragraph_indices, section_results, section_errors,
+                          min_risk, min_confidence, started):
+    """Apply auto-accepted feedback to one batch document and summarize it"""
+    comments = []
+    feedback_count = 0
+    accepted_counts = {'High': 0, 'Medium': 0, 'Low': 0}
+    heuristic_sections = 0
+    
+    for section_name in sections:
+        section_result = section_results.get(section_name, {})
+        feedback_items = section_result.get('feedback_items', [])
+        feedback_count += len(feedback_items)
+        if section_result.get('analysis_source') == 'local_heuristic':
+            heuristic_sections += 1
+        if not paragraph_indices.get(section_name):
+            continue
+        
+        for item in select_auto_accepted(feedback_items, min_risk, min_confidence):
+            risk_level = item.get('risk_level', 'Low')
+            accepted_counts[risk_level] = accepted_counts.get(risk_level, 0) + 1
+            comments.append({
+                'section': section_name,
+                'paragraph_index': feedback_paragraph_index(paragraph_indices[section_name], item),
+                'comment': build_feedback_comment(item),
+                'type': item['type'],
+                'risk_level': risk_level,
+                'author': 'AI Feedback (auto-accepted)'
+            })
+    
+    output_path = create_reviewed_document_with_proper_comments(path, name, comments)
+    
+    return {
+        'document': name,
+        'status': 'reviewed' if output_path else 'failed',
+        'sections': len(sections),
+        'feedback_items': feedback_count,
+        'auto_accepted': len(comments),
+        'accepted_high': accepted_counts.get('High', 0),
+        'accepted_medium': accepted_counts.get('Medium', 0),
+        'accepted_low': accepted_counts.get('Low', 0),
+        'heuristic_sections': heuristic_sections,
+        'output_file': os.path.basename(output_path) if output_path else None,
+        'output_path': output_path,
+        'section_errors': section_errors,
+        'elapsed_seconds': round(time.time() - started, 2),
+        'error': None if output_path else 'Failed to generate reviewed document'
+    }
+
+def run_batch_review(documents, min_risk=None, min_confidence=None, doc_type="Full Write-up",
+                     parse_workers=None, max_concurrency=None):
+    """Parse, analyze and annotate a batch of documents, yielding each summary as it finishes
+    
+    Parsing runs on a process pool and section analyses share a pool capped at
+    BATCH_BEDROCK_CONCURRENCY, so a large batch never floods Bedrock.
+    """
+    min_risk = min_risk or Config.BATCH_AUTO_ACCEPT_RISK
+    min_confidence = Config.BATCH_AUTO_ACCEPT_CONFIDENCE if min_confidence is None else min_confidence
+    parse_workers = parse_workers or Config.BATCH_PARSE_WORKERS
+    max_concurrency = max_concurrency or Config.BATCH_BEDROCK_CONCURRENCY
+    started = time.time()
+    parsed = {}
+    
+    parse_pool = ProcessPoolExecutor(max_workers=max(1, min(parse_workers, len(documents))))
+    bedrock_pool = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix='batch')
+    # Chunk calls share the batch's limit and pool rather than the interactive ones
+    batch_lane = AnalysisLane(max_concurrency, max_concurrency, 'batch')
+    try:
+        parse_futures = {
+            parse_pool.submit(extract_document_sections_from_xml, path, STANDARD_SECTIONS, EXCLUDED_SECTIONS): (name, path)
+            for name, path in documents
+        }
+        section_futures = {}
+        
+        for future in as_completed(parse_futures):
+            name, path = parse_futures[future]
+            try:
+                try:
+                    sections, _, paragraph_indices = future.result()
+                except BrokenProcessPool:
+                    sections, _, paragraph_indices = extract_document_sections_from_xml(path, STANDARD_SECTIONS, EXCLUDED_SECTIONS)
+            except Exception as e:
+                print(f"Error parsing batch document {name}: {str(e)}")
+                yield {
+                    'document': name, 'status': 'failed', 'sections': 0, 'feedback_items': 0,
+                    'auto_accepted': 0, 'output_file': None, 'output_path': None,
+                    'elapsed_seconds': round(time.time() - started, 2),
+                    'error': f'Error processing document: {str(e)}'
+                }
+                continue
+            
+            parsed[name] = {
+                'path': path, 'sections': sections, 'paragraph_indices': paragraph_indices,
+                'results': {}, 'errors': {}, 'pending': len(sections)
+            }
+            for section_future, section_names in submit_section_analyses(bedrock_pool, sections, doc_type, lane=batch_lane).items():
+                section_futures[section_future] = (name, section_names)
+        
+        def finish(name):
+            document = parsed.pop(name)
+            return finish_batch_document(
+                name, document['path'], document['sections'], document['paragraph_indices'],
+                document['results'], document['errors'], min_risk, min_confidence, started
+            )
+        
+        for name in [name for name, document in parsed.items() if not document['pending']]:
+            yield finish(name)
+        
+        for future in as_completed(section_futures):
+            name, section_names = section_futures[future]
+            document = parsed[name]
+            try:
+                document['results'].update(future.result())
+            except Exception as e:
+                for section_name in section_names:
+                    print(f"Error analyzing section {section_name} of {name}: {str(e)}")
+                    document['errors'][section_name] = str(e)
+            
+            document['pending'] -= len(section_names)
+            if not document['pending']:
+                yield finish(name)
+    finally:
+        # Drop queued work if the consumer stops early (client disconnect, Ctrl-C)
+        parse_pool.shutdown(wait=False, cancel_futures=True)
+        bedrock_pool.shutdown(wait=False, cancel_futures=True)
+        batch_lane.shutdown(wait=False)
+
+def build_batch_summary(entries, started, min_risk, min_confidence):
+    """Aggregate per-document batch results"""
+    elapsed = time.time() - started
+    return {
+        'total_documents': len(entries),
+        'reviewed': sum(1 for entry in entries if entry['status'] == 'reviewed'),
+        'failed': sum(1 for entry in entries if entry['status'] != 'reviewed'),
+        'total_feedback': sum(entry['feedback_items'] for entry in entries),
+        'auto_accepted': sum(entry['auto_accepted'] for entry in entries),
+        'heuristic_sections': sum(entry.get('heuristic_sections', 0) for entry in entries),
+        'min_risk': min_risk,
+        'min_confidence': min_confidence,
+        'elapsed_seconds': round(elapsed, 2),
+        'documents_per_minute': round(len(entries) / elapsed * 60, 1) if elapsed else 0.0,
+        'documents': [{k: v for k, v in entry.items() if k != 'output_path'} for entry in entries]
+    }
+
+def batch_summary_csv(entries):
+    """Render per-document batch results as CSV"""
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=BATCH_SUMMARY_FIELDS, extrasaction='ignore')
+    writer.writeheader()
+    writer.writerows(entries)
+    return output.getvalue()
+
+class ZipStreamBuffer:
+    """Write-only file object that collects zip output for a streaming response"""
+    
+    def __init__(self):
+        self.chunks = []
+    
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+    
+    def flush(self):
+        pass
+    
+    def drain(self):
+        data = b''.join(self.chunks)
+        self.chunks = []
+        return data
+
+def stream_batch_review_zip(documents, batch_dir, min_risk, min_confidence):
+    """Yield a zip of reviewed documents as each one finishes, ending with the batch summary"""
+    buffer = ZipStreamBuffer()
+    entries = []
+    started = time.time()
+    
+    try:
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+            for entry in run_batch_review(documents, min_risk, min_confidence):
+                entries.append(entry)
+                if entry['output_path'] and os.path.exists(entry['output_path']):
+                    # .docx files are already compressed
+                    archive.write(entry['output_path'], f"reviewed/{entry['output_file']}", zipfile.ZIP_STORED)
+                yield buffer.drain()
+            
+            summary = build_batch_summary(entries, started, min_risk, min_confidence)
+            archive.writestr('summary.json', json.dumps(summary, indent=2))
+            archive.writestr('summary.csv', batch_summary_csv(entries))
+        yield buffer.drain()
+    finally:
+        shutil.rmtree(batch_dir, ignore_errors=True)
+
+# Request metrics
+METRICS_IGNORED_ENDPOINTS = {'static', 'metrics'}
+
+@app.before_request
+def start_request_metrics():
+    if request.endpoint and request.endpoint not in METRICS_IGNORED_ENDPOINTS:
+        g.metrics_endpoint = request.endpoint
+        g.metrics_start = time.perf_counter()
+        REQUESTS_IN_PROGRESS.labels(request.endpoint).inc()
+
+def observe_request(endpoint, start):
+    REQUESTS_IN_PROGRESS.labels(endpoint).dec()
+    REQUEST_SECONDS.labels(endpoint).observe(time.perf_counter() - start)
+
+@app.after_request
+def defer_streamed_request_metrics(response):
+    # A streamed body is produced after the view returns, so time it until the response is closed
+    if response.is_streamed and 'metrics_endpoint' in g:
+        endpoint, start = g.pop('metrics_endpoint'), g.pop('metrics_start')
+        response.call_on_close(lambda: observe_request(endpoint, start))
+    return response
+
+@app.teardown_request
+def finish_request_metrics(exc=None):
+    endpoint = g.pop('metrics_endpoint', None)
+    if endpoint:
+        observe_request(endpoint, g.pop('metrics_start'))
+
+def collect_state_metrics():
+    """Session, cache and job figures read at scrape time"""
+    session_stats = document_sessions.stats()
+    families = [
+        ('ct_sessions', 'gauge', 'Review sessions currently stored', {(): session_stats['sessions']}),
+        ('ct_sessions_estimated_bytes', 'gauge', 'Estimated memory held by review sessions', {(): session_stats['estimated_bytes']}),
+        ('ct_session_evictions_total', 'counter', 'Review sessions evicted by reason',
+         {(('reason', reason),): count for reason, count in session_stats['evictions'].items()}),
+        ('ct_jobs', 'gauge', 'Background jobs by status',
+         {(('status', status),): count for status, count in job_manager.stats().items()}),
+    ]
+    
+    flight_stats = analysis_flights.stats()
+    breaker_stats = bedrock_breaker.stats()
+    families.extend([
+        ('ct_analysis_in_flight', 'gauge', 'Distinct section analyses currently in flight', {(): flight_stats['in_flight']}),
+        ('ct_analysis_coalesced_total', 'counter', 'Section analyses that shared an identical in-flight call instead of calling Bedrock',
+         {(): flight_stats['coalesced']}),
+        ('ct_bedrock_circuit_open', 'gauge', 'Whether the Bedrock circuit breaker is failing calls fast',
+         {(): int(breaker_stats['state'] != 'closed')}),
+        ('ct_bedrock_circuit_opened_total', 'counter', 'Times the Bedrock circuit breaker has opened',
+         {(): breaker_stats['times_opened']}),
+    ])
+    
+    if analysis_cache is not None:
+        cache_stats = analysis_cache.stats()
+        families.extend([
+            ('ct_analysis_cache_lookups_total', 'counter', 'Persistent analysis cache lookups',
+             {(('result', 'hit'),): cache_stats['hits'], (('result', 'miss'),): cache_stats['misses']}),
+            ('ct_analysis_cache_hit_ratio', 'gauge', 'Persistent analysis cache hit ratio', {(): cache_stats['hit_ratio']}),
+            ('ct_analysis_cache_entries', 'gauge', 'Entries in the persistent analysis cache', {(): cache_stats['entries']}),
+        ])
+    
+    return families
+
+REGISTRY.register_collector(collect_state_metrics)
+
 # Routes
 @app.route('/')
 def index():
@@ -932,26 +1999,47 @@ def upload_file():
     
     if file and allowed_file(file.filename):
         filename = secure_filename(file.filename)
-        file_path = os.path.join(UPLOAD_FOLDER, filename)
-        file.save(file_path)
         
         # Create session
         session_id = str(uuid.uuid4())
+        
+        # Store uploads per session so evicting one session never removes another's file
+        file_path = os.path.join(UPLOAD_FOLDER, f"{session_id}_{filename}")
+        with STAGE_SECONDS.labels('upload_save').time():
+            file.save(file_path)
+        
         review_session = ReviewSession()
         review_session.session_id = session_id
         review_session.document_name = filename
         review_session.document_path = file_path
         
         try:
-            # Open document
-            doc = Document(file_path)
-            review_session.document_object = doc
+            # Extract sections straight from document.xml; python-docx is
+            # only used here if that fails
+            try:
+                with STAGE_SECONDS.labels('section_extraction').time():
+                    sections, section_paragraphs, paragraph_indices = extract_document_sections_from_xml(
+                        file_path, STANDARD_SECTIONS, EXCLUDED_SECTIONS
+                    )
+                review_session.sections = sections
+                review_session.paragraph_indices = paragraph_indices
+            except Exception as e:
+                print(f"Fast section extraction failed, using python-docx: {str(e)}")
+                doc = Document(file_path)
+                review_session.document_object = doc
+                sections, section_paragraphs, paragraph_indices = extract_document_sections_from_docx(doc)
+                review_session.sections = sections
+                review_session.section_paragraphs = section_paragraphs
+                review_session.paragraph_indices = paragraph_indices
+            
+            with STAGE_SECONDS.labels('document_index').time():
+                review_session.get_document_retriever()
             
-            # Extract sections
-            sections, section_paragraphs, paragraph_indices = extract_document_sections_from_docx(doc)
-            review_session.sections = sections
-            review_session.section_paragraphs = section_paragraphs
-            review_session.paragraph_indices = paragraph_indices
+            # A new version of a reviewed document keeps the review of its unchanged sections
+            revision = None
+            previous = find_previous_version(review_session, request.form.get('previous_session_id'))
+            if previous is not None:
+                revision = carry_over_review(previous, review_session)
             
             document_sessions[session_id] = review_session
             session['session_id'] = session_id
@@ -960,14 +2048,48 @@ def upload_file():
                 'success': True,
                 'session_id': session_id,
                 'sections': list(sections.keys()),
-                'document_name': filename
+                'document_name': filename,
+                'revision': revision
             })
             
         except Exception as e:
+            if os.path.exists(file_path):
+                os.remove(file_path)
             return jsonify({'error': f'Error processing document: {str(e)}'}), 500
     
     return jsonify({'error': 'Invalid file type'}), 400
 
+@app.route('/upload_batch', methods=['POST'])
+def upload_batch():
+    files = request.files.getlist('files') + request.files.getlist('file')
+    if not files:
+        return jsonify({'error': 'No file part'}), 400
+    
+    min_risk = request.form.get('min_risk', Config.BATCH_AUTO_ACCEPT_RISK)
+    if min_risk not in RISK_LEVEL_RANK:
+        return jsonify({'error': f'min_risk must be one of {", ".join(RISK_LEVEL_RANK)}'}), 400
+    try:
+        min_confidence = float(request.form.get('min_confidence', Config.BATCH_AUTO_ACCEPT_CONFIDENCE))
+    except ValueError:
+        return jsonify({'error': 'min_confidence must be a number'}), 400
+    
+    batch_dir = os.path.join(UPLOAD_FOLDER, f"batch_{uuid.uuid4()}")
+    os.makedirs(batch_dir, exist_ok=True)
+    
+    try:
+        documents = collect_batch_documents(files, batch_dir)
+    except (zipfile.BadZipFile, ValueError) as e:
+        shutil.rmtree(batch_dir, ignore_errors=True)
+        return jsonify({'error': f'Invalid batch: {str(e)}'}), 400
+    
+    if not documents:
+        shutil.rmtree(batch_dir, ignore_errors=True)
+        return jsonify({'error': 'No .docx documents found in upload'}), 400
+    
+    response = Response(stream_batch_review_zip(documents, batch_dir, min_risk, min_confidence), mimetype='application/zip')
+    response.headers['Content-Disposition'] = f'attachment; filename=reviewed_batch_{datetime.now().strftime("%Y%m%d_%H%M%S")}.zip'
+    return response
+
 @app.route('/analyze_section', methods=['POST'])
 def analyze_section():
     data = request.json
@@ -985,15 +2107,192 @@ def analyze_section():
     section_content = review_session.sections[section_name]
     
     # Check cache first
-    cache_key = f"{section_name}_{hash(section_content)}"
-    if cache_key in review_session.ai_feedback_cache:
-        result = review_session.ai_feedback_cache[cache_key]
+    cache_key = get_section_cache_key(section_name, section_content)
+    result = get_session_feedback(review_session, cache_key)
+    if result is not None:
+        SESSION_CACHE_LOOKUPS.labels('hit').inc()
     else:
-        result = analyze_section_with_ai(section_name, section_content)
-        review_session.ai_feedback_cache[cache_key] = result
+        SESSION_CACHE_LOOKUPS.labels('miss').inc()
+        result = analyze_section_cached(section_name, section_content, session_id=session_id)
+        document_sessions.cache_feedback(review_session, cache_key, result)
     
     return jsonify(result)
 
+def format_sse(event, data):
+    """Format a server-sent event"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+def format_result_events(result, cached, coalesced=False):
+    """SSE events replaying a finished analysis"""
+    for item in result.get('feedback_items', []):
+        yield format_sse('item', item)
+    yield format_sse('done', {
+        'count': len(result.get('feedback_items', [])),
+        'cached': cached,
+        'coalesced': coalesced,
+        'analysis_source': result.get('analysis_source', 'bedrock'),
+        'fallback_reason': result.get('fallback_reason')
+    })
+
+@app.route('/analyze_section_stream')
+def analyze_section_stream():
+    session_id = request.args.get('session_id')
+    section_name = request.args.get('section_name')
+    
+    if not session_id or session_id not in document_sessions:
+        return jsonify({'error': 'Invalid session'}), 400
+    
+    review_session = document_sessions[session_id]
+    
+    if section_name not in review_session.sections:
+        return jsonify({'error': 'Section not found'}), 400
+    
+    section_content = review_session.sections[section_name]
+    cache_key = get_section_cache_key(section_name, section_content)
+    analysis_key = get_analysis_cache_key(section_name, section_content)
+    
+    cached = get_session_feedback(review_session, cache_key)
+    if cached is None and analysis_cache is not None:
+        cached = analysis_cache.get(analysis_key)
+        if cached is not None:
+            document_sessions.cache_feedback(review_session, cache_key, cached)
+    
+    def generate():
+        if cached is not None:
+            yield from format_result_events(cached, cached=True)
+            return
+        
+        # Join an identical analysis already running for another request
+        flight, leader = analysis_flights.begin(analysis_key)
+        if not leader:
+            try:
+                shared = analysis_flights.wait(flight)
+            except Exception as e:
+                print(f"Error in shared analysis for {section_name}: {str(e)}")
+                yield format_sse('error', {'error': 'Analysis failed', 'count': 0})
+                return
+            if shared is not None:
+                shared = copy.deepcopy(shared)
+                document_sessions.cache_feedback(review_session, cache_key, shared)
+                yield from format_result_events(shared, cached=False, coalesced=True)
+                return
+        
+        result = None
+        feedback_items = []
+        provenance = {}
+        try:
+            for item in stream_section_analysis(section_name, section_content, session_id=session_id,
+                                                provenance=provenance):
+                feedback_items.append(item)
+                yield format_sse('item', item)
+            result = dict({'feedback_items': feedback_items}, **provenance)
+        except Exception as e:
+            print(f"Error streaming analysis for {section_name}: {str(e)}")
+            yield format_sse('error', {'error': 'Analysis stream interrupted', 'count': len(feedback_items)})
+            return
+        finally:
+            # Also runs if the client disconnects, so waiters never hang on an abandoned stream
+            if leader:
+                analysis_flights.finish(analysis_key, flight, result=result)
+        
+        document_sessions.cache_feedback(review_session, cache_key, result)
+        if analysis_cache is not None and result.get('analysis_source') == 'bedrock':
+            analysis_cache.set(analysis_key, result)
+        yield format_sse('done', dict({'count': len(feedback_items), 'cached': False}, **provenance))
+    
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+@app.route('/analyze_document', methods=['POST'])
+def analyze_document():
+    data = request.json
+    session_id = data.get('session_id')
+    
+    if not session_id or session_id not in document_sessions:
+        return jsonify({'error': 'Invalid session'}), 400
+    
+    review_session = document_sessions[session_id]
+    
+    start = time.time()
+    result = analyze_document_sections(review_session)
+    result['success'] = not result['errors']
+    result['elapsed_seconds'] = round(time.time() - start, 2)
+    
+    return jsonify(result)
+
+def run_section_analysis_job(job, review_session, section_name):
+    """Job body: analyze one section and fill the session cache"""
+    section_content = review_session.sections[section_name]
+    cache_key = get_section_cache_key(section_name, section_content)
+    
+    job.update(message=f"Analyzing {section_name}")
+    result = get_session_feedback(review_session, cache_key)
+    if result is None:
+        result = analyze_section_cached(section_name, section_content, session_id=review_session.session_id)
+        job.check_cancelled()
+        document_sessions.cache_feedback(review_session, cache_key, result)
+    
+    return result
+
+def run_document_analysis_job(job, review_session):
+    """Job body: analyze every section, reporting per-section progress"""
+    def report(done, total, section_name):
+        job.update(progress=done / total, message=f"Analyzed {section_name} ({done}/{total})")
+    
+    result = analyze_document_sections(review_session, progress_callback=report, cancel_event=job.cancel_event)
+    job.check_cancelled()
+    return result
+
+@app.route('/jobs/analyze', methods=['POST'])
+def submit_analysis_job():
+    data = request.json
+    session_id = data.get('session_id')
+    section_name = data.get('section_name')
+    
+    if not session_id or session_id not in document_sessions:
+        return jsonify({'error': 'Invalid session'}), 400
+    
+    review_session = document_sessions[session_id]
+    
+    if section_name and section_name not in review_session.sections:
+        return jsonify({'error': 'Section not found'}), 400
+    
+    try:
+        if section_name:
+            job = job_manager.submit('analyze_section', run_section_analysis_job, review_session, section_name, owner=session_id)
+        else:
+            job = job_manager.submit('analyze_document', run_document_analysis_job, review_session, owner=session_id)
+    except JobQueueFull:
+        return jsonify({'error': 'Too many analyses in progress. Please retry shortly.'}), 503, {'Retry-After': '5'}
+    
+    return jsonify({'success': True, 'job_id': job.job_id, 'status': job.status}), 202
+
+def get_owned_job(job_id):
+    """Return a job only to the review session that submitted it"""
+    job = job_manager.get(job_id)
+    caller = request.args.get('session_id') or session.get('session_id')
+    if job is None or not caller or job.owner != caller:
+        return None
+    return job
+
+@app.route('/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    job = get_owned_job(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    
+    return jsonify(job.to_dict())
+
+@app.route('/jobs/<job_id>', methods=['DELETE'])
+def cancel_job(job_id):
+    if get_owned_job(job_id) is None:
+        return jsonify({'error': 'Job not found'}), 404
+    
+    job = job_manager.cancel(job_id)
+    return jsonify(job.to_dict(include_result=False))
+
 @app.route('/get_section', methods=['POST'])
 def get_section():
     data = request.json
@@ -1023,32 +2322,25 @@ def accept_feedback():
     if not session_id or session_id not in document_sessions:
         return jsonify({'error': 'Invalid session'}), 400
     
-    review_session = document_sessions[session_id]
-    
-    if section_name not in review_session.accepted_feedback:
-        review_session.accepted_feedback[section_name] = []
-    
-    review_session.accepted_feedback[section_name].append(feedback_item)
-    
     # Prepare comment for Word document
-    comment_text = f"[{feedback_item['type'].upper()} - {feedback_item.get('risk_level', 'Low')} Risk]\n"
-    comment_text += f"{feedback_item['description']}\n"
-    if feedback_item.get('suggestion'):
-        comment_text += f"\nSuggestion: {feedback_item['suggestion']}\n"
-    if feedback_item.get('hawkeye_refs'):
-        refs = [f"#{r} {HAWKEYE_SECTIONS.get(r, '')}" for r in feedback_item['hawkeye_refs']]
-        comment_text += f"\nHawkeye References: {', '.join(refs)}"
+    comment_text = build_feedback_comment(feedback_item)
     
-    # Store comment to be added to document
-    if section_name in review_session.paragraph_indices and review_session.paragraph_indices[section_name]:
-        review_session.document_comments.append({
-            'section': section_name,
-            'paragraph_index': review_session.paragraph_indices[section_name][0],
-            'comment': comment_text,
-            'type': feedback_item['type'],
-            'risk_level': feedback_item.get('risk_level', 'Low'),
-            'author': 'AI Feedback'
-        })
+    with document_sessions.edit(session_id) as review_session:
+        if section_name not in review_session.accepted_feedback:
+            review_session.accepted_feedback[section_name] = []
+        
+        review_session.accepted_feedback[section_name].append(feedback_item)
+        
+        # Store comment to be added to document
+        if section_name in review_session.paragraph_indices and review_session.paragraph_indices[section_name]:
+            review_session.document_comments.append({
+                'section': section_name,
+                'paragraph_index': feedback_paragraph_index(review_session.paragraph_indices[section_name], feedback_item),
+                'comment': comment_text,
+                'type': feedback_item['type'],
+                'risk_level': feedback_item.get('risk_level', 'Low'),
+                'author': 'AI Feedback'
+            })
     
     return jsonify({'success': True})
 
@@ -1062,12 +2354,11 @@ def reject_feedback():
     if not session_id or session_id not in document_sessions:
         return jsonify({'error': 'Invalid session'}), 400
     
-    review_session = document_sessions[session_id]
-    
-    if section_name not in review_session.rejected_feedback:
-        review_session.rejected_feedback[section_name] = []
-        
-    review_session.rejected_feedback[section_name].append(feedback_item)
+    with document_sessions.edit(session_id) as review_session:
+        if section_name not in review_session.rejected_feedback:
+            review_session.rejected_feedback[section_name] = []
+            
+        review_session.rejected_feedback[section_name].append(feedback_item)
     
     return jsonify({'success': True})
 
@@ -1083,8 +2374,6 @@ def add_custom_feedback():
     if not session_id or session_id not in document_sessions:
         return jsonify({'error': 'Invalid session'}), 400
     
-    review_session = document_sessions[session_id]
-    
     # Find Hawkeye reference number
     hawkeye_ref = 1
     for num, name in HAWKEYE_SECTIONS.items():
@@ -1104,34 +2393,49 @@ def add_custom_feedback():
         'user_created': True
     }
     
-    if section_name not in review_session.user_feedback:
-        review_session.user_feedback[section_name] = []
-    
-    review_session.user_feedback[section_name].append(feedback)
-    
-    # Also add as accepted feedback for comment
-    if section_name not in review_session.accepted_feedback:
-        review_session.accepted_feedback[section_name] = []
-    review_session.accepted_feedback[section_name].append(feedback)
-    
     # Prepare comment
     comment_text = f"[USER FEEDBACK - {feedback['type'].upper()}]\n"
     comment_text += f"{feedback['description']}\n"
     comment_text += f"\nHawkeye Reference: #{hawkeye_ref} {category}"
     
-    if section_name in review_session.paragraph_indices and review_session.paragraph_indices[section_name]:
-        review_session.document_comments.append({
-            'section': section_name,
-            'paragraph_index': review_session.paragraph_indices[section_name][0],
-            'comment': comment_text,
-            'type': feedback['type'],
-            'risk_level': feedback['risk_level'],
-            'user_created': True,
-            'author': 'User Feedback'
-        })
+    with document_sessions.edit(session_id) as review_session:
+        if section_name not in review_session.user_feedback:
+            review_session.user_feedback[section_name] = []
+        
+        review_session.user_feedback[section_name].append(feedback)
+        
+        # Also add as accepted feedback for comment
+        if section_name not in review_session.accepted_feedback:
+            review_session.accepted_feedback[section_name] = []
+        review_session.accepted_feedback[section_name].append(feedback)
+        
+        if section_name in review_session.paragraph_indices and review_session.paragraph_indices[section_name]:
+            review_session.document_comments.append({
+                'section': section_name,
+                'paragraph_index': review_session.paragraph_indices[section_name][0],
+                'comment': comment_text,
+                'type': feedback['type'],
+                'risk_level': feedback['risk_level'],
+                'user_created': True,
+                'author': 'User Feedback'
+            })
     
     return jsonify({'success': True, 'feedback': feedback})
 
+def record_chat_exchange(session_id, query, response):
+    """Append a question and its answer to the session's chat history"""
+    with document_sessions.edit(session_id) as review_session:
+        review_session.chat_history.append({
+            'role': 'user',
+            'content': query,
+            'timestamp': datetime.now().isoformat()
+        })
+        review_session.chat_history.append({
+            'role': 'assistant',
+            'content': response,
+            'timestamp': datetime.now().isoformat()
+        })
+
 @app.route('/chat', methods=['POST'])
 def chat():
     try:
@@ -1146,28 +2450,48 @@ def chat():
         if not query:
             return jsonify({'response': 'Please ask a question about the document or Hawkeye guidelines.'})
         
-        review_session = document_sessions[session_id]
+        if data.get('stream'):
+            return Response(generate_chat_events(session_id, query, context), mimetype='text/event-stream', headers={
+                'Cache-Control': 'no-cache',
+                'X-Accel-Buffering': 'no'
+            })
         
-        # Direct chat response
-        response = get_direct_chat_response(query)
+        with STAGE_SECONDS.labels('chat_response').time():
+            response, provenance = process_chat_query(query, context, session_id)
         
-        # Store chat history
-        review_session.chat_history.append({
-            'role': 'user',
-            'content': query,
-            'timestamp': datetime.now().isoformat()
-        })
-        review_session.chat_history.append({
-            'role': 'assistant',
-            'content': response,
-            'timestamp': datetime.now().isoformat()
-        })
-        
-        return jsonify({'response': response})
+        record_chat_exchange(session_id, query, response)
+        return jsonify(dict({'response': response}, **provenance))
         
     except Exception as e:
         return jsonify({'response': f'I encountered an error. Please try asking your question again.'})
 
+def generate_chat_events(session_id, query, context):
+    """SSE events for a streamed chat answer: 'delta' text chunks, then 'done'"""
+    started = time.perf_counter()
+    provenance = {}
+    parts = []
+    try:
+        for text in stream_chat_response(query, context, document_sessions[session_id], provenance):
+            if not parts:
+                STAGE_SECONDS.labels('chat_first_token').observe(time.perf_counter() - started)
+            parts.append(text)
+            yield format_sse('delta', {'text': text})
+    except Exception as e:
+        print(f"Error streaming chat response: {str(e)}")
+        if not parts:
+            # Nothing sent yet, so the static answer can still stand in
+            parts.append(get_direct_chat_response(query))
+            provenance = {'analysis_source': 'local_heuristic', 'fallback_reason': 'error'}
+            yield format_sse('delta', {'text': parts[0]})
+        else:
+            yield format_sse('error', {'error': 'Chat response interrupted'})
+    
+    STAGE_SECONDS.labels('chat_response').observe(time.perf_counter() - started)
+    response = ''.join(parts)
+    if session_id in document_sessions:
+        record_chat_exchange(session_id, query, response)
+    yield format_sse('done', provenance)
+
 def get_direct_chat_response(query):
     """Get direct chat response"""
     query_lower = query.lower()
@@ -1233,6 +2557,66 @@ def complete_review():
 def download_file(filename):
     return send_file(os.path.join(OUTPUT_FOLDER, filename), as_attachment=True)
 
+@app.route('/cache_stats')
+def cache_stats():
+    if analysis_cache is None:
+        return jsonify({'enabled': False, 'single_flight': analysis_flights.stats()})
+    
+    stats = analysis_cache.stats()
+    stats['enabled'] = True
+    stats['single_flight'] = analysis_flights.stats()
+    return jsonify(stats)
+
+@app.route('/usage')
+def usage():
+    if usage_ledger is None:
+        return jsonify({'enabled': False})
+    
+    session_id = request.args.get('session_id')
+    group_by = request.args.get('group_by')
+    
+    try:
+        since = time.time() - float(request.args['since_hours']) * 3600 if request.args.get('since_hours') else None
+        result = {'enabled': True, 'totals': usage_ledger.summary(session_id, since=since)}
+        if group_by:
+            result['group_by'] = group_by
+            result['groups'] = usage_ledger.summary(session_id, group_by, since)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    return jsonify(result)
+
+@app.route('/usage/export')
+def export_usage():
+    if usage_ledger is None:
+        return jsonify({'error': 'Usage ledger is disabled'}), 404
+    
+    session_id = request.args.get('session_id')
+    if request.args.get('format', 'csv') == 'json':
+        return jsonify(usage_ledger.rows(session_id))
+    
+    response = Response(usage_ledger.export_csv(session_id), mimetype='text/csv')
+    response.headers['Content-Disposition'] = f'attachment; filename=bedrock_usage_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
+    return response
+
+@app.route('/metrics')
+def metrics():
+    return Response(REGISTRY.render(), mimetype='text/plain; version=0.0.4')
+
+@app.route('/retrieval_stats')
+def retrieval_stats():
+    retriever = get_checklist_retriever()
+    if retriever is None:
+        return jsonify({'enabled': False, 'checklist_loaded': bool(hawkeye_checklist)})
+    
+    stats = retriever.stats()
+    stats['enabled'] = True
+    return jsonify(stats)
+
+@app.route('/session_stats')
+def session_stats():
+    return jsonify(document_sessions.stats())
+
 @app.route('/get_stats', methods=['POST'])
 def get_stats():
     data = request.json
@@ -1244,7 +2628,7 @@ def get_stats():
     review_session = document_sessions[session_id]
     
     # Calculate statistics
-    total_feedback = sum(len(items) for items in review_session.ai_feedback_cache.values())
+    total_feedback = sum(len(result.get('feedback_items', [])) for result in review_session.ai_feedback_cache.values())
     total_accepted = sum(len(items) for items in review_session.accepted_feedback.values())
     total_rejected = sum(len(items) for items in review_session.rejected_feedback.values())
     total_user = sum(len(items) for items in review_session.user_feedback.values())
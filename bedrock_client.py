@@ -0,0 +1,97 @@
+"""
+Shared AWS Bedrock runtime clients for CT Review Tool
+"""
+
+import json
+import os
+import threading
+
+import boto3
+from botocore.config import Config as BotoConfig
+
+from config import Config
+
+_clients = {}
+_clients_lock = threading.Lock()
+_owner_pid = os.getpid()
+
+
+def _reset_after_fork():
+    """Drop clients inherited from the parent process"""
+    global _clients_lock, _owner_pid
+    # Pooled sockets must never be shared between processes, so every
+    # forked worker builds its own clients on first use.
+    _clients.clear()
+    _clients_lock = threading.Lock()
+    _owner_pid = os.getpid()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def attempt_timeout():
+    """Longest a single Bedrock request can take: connecting plus the read timeout, kept within the call deadline"""
+    read_timeout = max(1, min(Config.BEDROCK_READ_TIMEOUT, Config.BEDROCK_CALL_DEADLINE - Config.BEDROCK_CONNECT_TIMEOUT))
+    return Config.BEDROCK_CONNECT_TIMEOUT + read_timeout
+
+
+def _build_client(service_name, region_name):
+    """Create a boto3 client with a sized, keep-alive connection pool"""
+    boto_config = BotoConfig(
+        region_name=region_name,
+        max_pool_connections=Config.BEDROCK_MAX_POOL_CONNECTIONS,
+        connect_timeout=Config.BEDROCK_CONNECT_TIMEOUT,
+        read_timeout=attempt_timeout() - Config.BEDROCK_CONNECT_TIMEOUT,
+        tcp_keepalive=True,
+        # Retries, backoff and the deadline are handled by bedrock_resilience
+        retries={'mode': 'standard', 'max_attempts': 1},
+    )
+    aws_session = boto3.session.Session()
+    # Resolve the credential chain once here instead of on the first request
+    aws_session.get_credentials()
+    return aws_session.client(service_name, config=boto_config)
+
+
+def get_bedrock_client(service_name='bedrock-runtime', region_name=None):
+    """Return the process-wide client for a Bedrock service"""
+    if os.getpid() != _owner_pid:
+        _reset_after_fork()
+
+    key = (service_name, region_name or Config.AWS_REGION)
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                client = _build_client(service_name, key[1])
+                _clients[key] = client
+    return client
+
+
+def warm_up_bedrock_client():
+    """Create the runtime client and open a pooled connection ahead of traffic"""
+    try:
+        client = get_bedrock_client()
+        # The smallest valid request: one input word and one output token. It
+        # completes the TLS handshake and leaves the connection in the pool
+        # for the first real request.
+        client.invoke_model(
+            body=json.dumps({
+                "anthropic_version": "bedrock-2023-05-31",
+                "max_tokens": 1,
+                "messages": [{"role": "user", "content": "ping"}]
+            }),
+            modelId=Config.BEDROCK_MODEL_ID,
+            accept="application/json",
+            contentType="application/json"
+        )
+        print("Bedrock warm-up finished")
+    except Exception as e:
+        print(f"Bedrock warm-up failed: {type(e).__name__}: {str(e)}")
+
+
+def reset_bedrock_clients():
+    """Discard all cached clients (e.g. after credentials rotate)"""
+    with _clients_lock:
+        _clients.clear()
@@ -0,0 +1,167 @@
+"""
+Retries, deadlines and a circuit breaker for Bedrock calls
+"""
+
+import random
+import threading
+import time
+
+from botocore.exceptions import ClientError, ConnectionError as BotoConnectionError, ReadTimeoutError
+
+THROTTLING_ERROR_CODES = frozenset([
+    'ThrottlingException',
+    'TooManyRequestsException',
+    'ServiceUnavailableException',
+])
+
+# Transient server-side failures that are also worth retrying
+RETRYABLE_ERROR_CODES = THROTTLING_ERROR_CODES | frozenset([
+    'ModelNotReadyException',
+    'ModelTimeoutException',
+    'InternalServerException',
+])
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling Bedrock while the circuit breaker is open"""
+
+
+class DeadlineExceededError(Exception):
+    """Raised when another retry would run past the call's deadline"""
+
+
+def error_code(exc):
+    if isinstance(exc, ClientError):
+        return exc.response.get('Error', {}).get('Code', '')
+    return ''
+
+
+def is_throttling_error(exc):
+    return error_code(exc) in THROTTLING_ERROR_CODES
+
+
+def is_retryable_error(exc):
+    return error_code(exc) in RETRYABLE_ERROR_CODES or isinstance(exc, (BotoConnectionError, ReadTimeoutError))
+
+
+def is_transient_error(exc):
+    """Whether an error says Bedrock itself is unhealthy, rather than that the request was bad"""
+    if is_retryable_error(exc) or isinstance(exc, DeadlineExceededError):
+        return True
+    if isinstance(exc, ClientError):
+        return exc.response.get('ResponseMetadata', {}).get('HTTPStatusCode', 0) >= 500
+    return False
+
+
+def fallback_reason(exc):
+    """Short label for why a call fell back to the local heuristics"""
+    if isinstance(exc, CircuitOpenError):
+        return 'circuit_open'
+    if isinstance(exc, DeadlineExceededError):
+        return 'deadline_exceeded'
+    if is_throttling_error(exc):
+        return 'throttled'
+    return 'error'
+
+
+def backoff_delay(attempt, base_delay, max_delay, rng=random):
+    """Full-jitter exponential backoff for the given retry number (0-based)"""
+    return rng.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """Stop calling a failing dependency until it has had time to recover
+
+    After failure_threshold consecutive failures the breaker opens and every
+    call fails fast. Once reset_seconds have passed a single trial call is let
+    through (half-open); its success closes the breaker, its failure re-opens it.
+    """
+
+    def __init__(self, failure_threshold=5, reset_seconds=30, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.clock = clock
+        self.state = 'closed'
+        self.failures = 0
+        self.opened_at = None
+        self.times_opened = 0
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self.state == 'closed':
+                return True
+            if self.state == 'open' and self.clock() - self.opened_at >= self.reset_seconds:
+                self.state = 'half_open'
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = 'closed'
+            self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == 'half_open' or self.failures >= self.failure_threshold:
+                if self.state != 'open':
+                    self.times_opened += 1
+                self.state = 'open'
+                self.opened_at = self.clock()
+
+    def stats(self):
+        return {
+            'state': self.state,
+            'consecutive_failures': self.failures,
+            'times_opened': self.times_opened,
+            'failure_threshold': self.failure_threshold,
+            'reset_seconds': self.reset_seconds
+        }
+
+
+def call_with_retries(fn, breaker=None, max_attempts=3, deadline_seconds=60.0, base_delay=0.5, max_delay=8.0,
+                      attempt_timeout=0.0, on_retry=None, sleep=time.sleep, clock=time.monotonic):
+    """Call fn(), retrying throttling and transient errors with jittered backoff
+
+    Raises CircuitOpenError without calling fn while the breaker is open, and
+    DeadlineExceededError rather than start an attempt that, taking up to
+    attempt_timeout, could end past the deadline. Only the final outcome of
+    the call counts towards the breaker, and only transient failures count
+    against it: a rejected request still shows Bedrock is answering.
+    """
+    if breaker is not None and not breaker.allow():
+        raise CircuitOpenError('Bedrock circuit breaker is open')
+
+    deadline = clock() + deadline_seconds
+    attempt = 0
+    # Anything that escapes, including GeneratorExit or KeyboardInterrupt during
+    # a half-open trial call, counts as a failure so the breaker never stays half-open
+    failed = True
+    try:
+        while True:
+            try:
+                result = fn()
+            except Exception as e:
+                attempt += 1
+                if not is_retryable_error(e) or attempt >= max_attempts:
+                    failed = is_transient_error(e)
+                    raise
+
+                delay = backoff_delay(attempt - 1, base_delay, max_delay)
+                if clock() + delay + attempt_timeout > deadline:
+                    raise DeadlineExceededError(f'Gave up after {attempt} attempts') from e
+
+                if on_retry is not None:
+                    on_retry(e, attempt, delay)
+                sleep(delay)
+                continue
+
+            failed = False
+            return result
+    finally:
+        if breaker is not None:
+            if failed:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Concurrent load against a running CT Review Tool server
+
+Usage:
+    python run.py production &                 # or: python run.py
+    python benchmarks/load_test.py --url http://localhost:5000 --concurrency 16 --seconds 20
+
+Each client uploads a synthetic write-up, asks a chat question about it and
+loads the home page, in a loop. Reports requests per second and latency
+percentiles per endpoint.
+"""
+
+import argparse
+import io
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+import urllib.request
+import uuid
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(BENCHMARK_DIR))
+
+from synthetic_writeups import generate_writeup
+
+
+def multipart_body(filename, data):
+    boundary = uuid.uuid4().hex
+    body = (
+        f"--{boundary}\r\nContent-Disposition: form-data; name=\"file\"; filename=\"{filename}\"\r\n"
+        "Content-Type: application/vnd.openxmlformats-officedocument.wordprocessingml.document\r\n\r\n"
+    ).encode() + data + f"\r\n--{boundary}--\r\n".encode()
+    return body, f"multipart/form-data; boundary={boundary}"
+
+
+def client_loop(base_url, document, stop_at, timings, errors, lock):
+    body, content_type = multipart_body('load_test.docx', document)
+    while time.perf_counter() < stop_at:
+        upload = urllib.request.Request(f"{base_url}/upload", data=body, headers={'Content-Type': content_type})
+        try:
+            start = time.perf_counter()
+            with urllib.request.urlopen(upload, timeout=60) as response:
+                session_id = json.loads(response.read())['session_id']
+            upload_seconds = time.perf_counter() - start
+
+            chat = urllib.request.Request(
+                f"{base_url}/chat",
+                data=json.dumps({'query': 'What does the root cause section say?', 'session_id': session_id}).encode(),
+                headers={'Content-Type': 'application/json'}
+            )
+            start = time.perf_counter()
+            with urllib.request.urlopen(chat, timeout=60) as response:
+                response.read()
+            chat_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            with urllib.request.urlopen(f"{base_url}/", timeout=60) as response:
+                response.read()
+            index_seconds = time.perf_counter() - start
+        except Exception as e:
+            with lock:
+                errors.append(str(e))
+            continue
+
+        with lock:
+            timings['upload'].append(upload_seconds)
+            timings['chat'].append(chat_seconds)
+            timings['index'].append(index_seconds)
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', default='http://localhost:5000', help='Server base URL')
+    parser.add_argument('--concurrency', type=int, default=16, help='Concurrent clients')
+    parser.add_argument('--seconds', type=float, default=20, help='Test duration')
+    parser.add_argument('--sections', type=int, default=12, help='Sections in the synthetic write-up')
+    args = parser.parse_args()
+
+    buffer = io.BytesIO()
+    generate_writeup(buffer, sections=args.sections, paragraphs=15)
+    document = buffer.getvalue()
+
+    timings = {'upload': [], 'chat': [], 'index': []}
+    errors = []
+    lock = threading.Lock()
+    started = time.perf_counter()
+    stop_at = started + args.seconds
+    clients = [
+        threading.Thread(target=client_loop, args=(args.url.rstrip('/'), document, stop_at, timings, errors, lock))
+        for _ in range(args.concurrency)
+    ]
+    for client in clients:
+        client.start()
+    for client in clients:
+        client.join()
+    elapsed = time.perf_counter() - started
+
+    total = sum(len(values) for values in timings.values())
+    print(f"{total} requests in {elapsed:.1f}s with {args.concurrency} clients: {total / elapsed:.1f} req/s, {len(errors)} errors")
+    for name, values in timings.items():
+        if values:
+            print(f"  {name:<7} {len(values) / elapsed:6.1f} req/s  p50 {statistics.median(values) * 1000:7.1f} ms"
+                  f"  p95 {percentile(values, 0.95) * 1000:7.1f} ms")
+    if errors:
+        print(f"  first error: {errors[0]}")
+
+
+if __name__ == '__main__':
+    main()
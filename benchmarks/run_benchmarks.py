@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for document processing and feedback classification
+
+Usage:
+    python benchmarks/run_benchmarks.py                  # compare against benchmarks/baseline.json
+    python benchmarks/run_benchmarks.py --save-baseline  # record a new baseline on this machine
+    python benchmarks/run_benchmarks.py --quick --only extract
+
+Exits with status 1 when a benchmark's median is slower than the baseline
+by more than --threshold (default 25%).
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(BENCHMARK_DIR))
+
+from docx import Document
+from app import (
+    read_docx, extract_document_sections_from_docx, generate_contextual_feedback,
+    get_hawkeye_reference, classify_risk_level, WordDocumentWithComments,
+    STANDARD_SECTIONS, EXCLUDED_SECTIONS
+)
+from docx_sections import extract_document_sections_from_xml
+from synthetic_writeups import generate_writeup
+
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, 'baseline.json')
+
+CORPUS = {
+    'small': dict(sections=8, paragraphs=10, tables=1, images=0),
+    'large': dict(sections=40, paragraphs=60, tables=2, images=1, image_size=256),
+}
+
+FEEDBACK_SAMPLES = [
+    {"category": "Root Cause Analysis", "description": "The analysis does not identify the fundamental process gap or system failure."},
+    {"category": "Seller Classification", "description": "Seller intent is unclear; classify as good actor or bad actor per guidelines."},
+    {"category": "Funds Management", "description": "Funds held during the investigation were not documented."},
+    {"category": "Communication Standards", "description": "The outreach email should clarify next steps for the seller."},
+    {"category": "Legal and Compliance", "description": "Regulatory implications of the counterfeit finding need legal review."},
+    {"category": "Documentation and Reporting", "description": "Evidence supporting the enforcement decision is missing."},
+    {"category": "Account Hijacking Prevention", "description": "Login history suggests a possible compromised account."},
+    {"category": "Quality Control", "description": "Peer review of the decision has not been recorded."},
+]
+
+
+def measure(fn, repeat):
+    """Run fn once to warm up, then repeat times; return timing stats in seconds"""
+    fn()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return {
+        'median_s': round(statistics.median(timings), 6),
+        'min_s': round(min(timings), 6),
+        'repeat': repeat
+    }
+
+
+def build_benchmarks(corpus_dir, quick=False):
+    """Generate the corpus and return {name: (callable, repeat)}"""
+    paths = {}
+    for size, options in CORPUS.items():
+        paths[size] = os.path.join(corpus_dir, f'writeup_{size}.docx')
+        generate_writeup(paths[size], **options)
+
+    small_sections, _, _ = extract_document_sections_from_xml(paths['small'], STANDARD_SECTIONS, EXCLUDED_SECTIONS)
+    feedback_items = FEEDBACK_SAMPLES * 25
+    output_path = os.path.join(corpus_dir, 'reviewed.docx')
+
+    def generate_feedback():
+        # Repeated so the timing is well above timer noise
+        for _ in range(20):
+            for name, content in small_sections.items():
+                generate_contextual_feedback(name, content)
+
+    def classify_feedback():
+        for item in feedback_items:
+            get_hawkeye_reference(item['category'], item['description'])
+            classify_risk_level(item)
+
+    def save_with_comments():
+        doc = WordDocumentWithComments(paths['large'])
+        for index in range(0, 2000, 20):
+            doc.add_comment(paragraph_index=index, comment_text=f"[IMPORTANT - High Risk]\nComment {index}")
+        doc.save_with_comments(output_path)
+
+    repeat = 3 if quick else 10
+    return {
+        'read_docx[large]': (lambda: read_docx(paths['large']), repeat),
+        'extract_sections_docx[large]': (
+            lambda: extract_document_sections_from_docx(Document(paths['large'])), repeat),
+        'extract_sections_xml[large]': (
+            lambda: extract_document_sections_from_xml(paths['large'], STANDARD_SECTIONS, EXCLUDED_SECTIONS), repeat),
+        'generate_contextual_feedback[small x20]': (generate_feedback, repeat * 5),
+        'hawkeye_classify[200 items]': (classify_feedback, repeat * 5),
+        'save_with_comments[large, 100 comments]': (save_with_comments, repeat),
+    }
+
+
+def compare(results, baseline, threshold):
+    """Print results next to the baseline; return the names that regressed"""
+    regressions = []
+    print(f"{'benchmark':<42} {'baseline':>10} {'current':>10} {'change':>8}")
+    for name, result in results.items():
+        current = result['median_s']
+        previous = baseline.get(name, {}).get('median_s')
+        if previous:
+            change = (current - previous) / previous
+            flag = '  REGRESSION' if change > threshold else ''
+            if change > threshold:
+                regressions.append(name)
+            print(f"{name:<42} {previous * 1000:>8.2f}ms {current * 1000:>8.2f}ms {change:>+7.1%}{flag}")
+        else:
+            print(f"{name:<42} {'-':>10} {current * 1000:>8.2f}ms {'new':>8}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CT Review Tool micro-benchmarks')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='Baseline results file')
+    parser.add_argument('--save-baseline', action='store_true', help='Write these results as the new baseline')
+    parser.add_argument('--threshold', type=float, default=0.25, help='Allowed slowdown before failing (0.25 = 25%%)')
+    parser.add_argument('--output', help='Also write results to this file')
+    parser.add_argument('--only', help='Run only benchmarks whose name contains this text')
+    parser.add_argument('--quick', action='store_true', help='Fewer repetitions')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as corpus_dir:
+        benchmarks = build_benchmarks(corpus_dir, args.quick)
+        results = {}
+        for name, (fn, repeat) in benchmarks.items():
+            if args.only and args.only not in name:
+                continue
+            results[name] = measure(fn, repeat)
+
+    report = {
+        'meta': {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'quick': args.quick
+        },
+        'results': results
+    }
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        for name, result in results.items():
+            print(f"{name:<42} {result['median_s'] * 1000:>8.2f}ms")
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f).get('results', {})
+    else:
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one\n")
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) slower than baseline by more than {args.threshold:.0%}")
+        return 1
+
+    print("\nNo regressions")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Synthetic CT write-up generator for benchmarks
+
+Usage:
+    python benchmarks/synthetic_writeups.py out.docx --sections 40 --paragraphs 60 --tables 2 --images 1
+"""
+
+import argparse
+import io
+import random
+import struct
+import zlib
+
+from docx import Document
+from docx.shared import Inches
+
+SECTION_NAMES = [
+    "Executive Summary",
+    "Background",
+    "Timeline",
+    "Investigation Process",
+    "Seller Classification",
+    "Root Cause",
+    "Resolving Actions",
+    "Preventative Actions",
+    "Impact Assessment",
+    "Documentation and Reporting",
+    "Recommendations",
+    "Original Email",
+]
+
+HEADING_STYLES = ('bold', 'colon', 'caps', 'mixed')
+
+SENTENCES = [
+    "The seller account was flagged after customers reported counterfeit listings.",
+    "Investigation confirmed the detection algorithm missed the restricted keywords.",
+    "Customer trust and satisfaction were impacted across several marketplaces.",
+    "The team consulted Legal and Policy before taking enforcement action.",
+    "Funds were held pending verification of the seller's identity documents.",
+    "Root cause analysis identified a gap between policy updates and detection rules.",
+    "Preventative actions include automated policy sync and additional review checkpoints.",
+    "Appeals from the seller were escalated after repeated rejected submissions.",
+    "Documentation of evidence and decisions was incomplete for the first escalation.",
+    "Account hijacking was ruled out after reviewing login and device history.",
+]
+
+
+def make_png(width, height, seed=0):
+    """Build an uncompressible RGB PNG, so image size tracks width x height"""
+    rng = random.Random(seed)
+    rows = b''.join(b'\x00' + rng.randbytes(width * 3) for _ in range(height))
+
+    def chunk(kind, data):
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data) & 0xffffffff)
+
+    header = struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)
+    return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', header)
+            + chunk(b'IDAT', zlib.compress(rows, 1)) + chunk(b'IEND', b''))
+
+
+def add_heading(doc, name, style):
+    paragraph = doc.add_paragraph()
+    if style == 'bold':
+        paragraph.add_run(name).bold = True
+    elif style == 'colon':
+        paragraph.add_run(f"{name}:").bold = True
+    elif style == 'caps':
+        paragraph.add_run(name.upper()).bold = True
+    else:
+        # Two bold runs and one plain run: still a majority-bold heading
+        words = name.split(' ', 1)
+        paragraph.add_run(words[0]).bold = True
+        paragraph.add_run(' ')
+        paragraph.add_run(words[1] if len(words) > 1 else ':').bold = True
+
+
+def generate_writeup(output, sections=8, paragraphs=10, tables=1, images=0,
+                     heading_style='mixed', image_size=256, seed=0):
+    """Write a synthetic CT write-up to output (a path or binary file object)"""
+    rng = random.Random(seed)
+    doc = Document()
+    doc.add_paragraph("CT EE Write-up (synthetic)")
+
+    for index in range(sections):
+        name = SECTION_NAMES[index % len(SECTION_NAMES)]
+        if index >= len(SECTION_NAMES):
+            name = f"{name} {index // len(SECTION_NAMES) + 1}"
+        style = HEADING_STYLES[index % len(HEADING_STYLES)] if heading_style == 'mixed' else heading_style
+        add_heading(doc, name, style)
+
+        for _ in range(paragraphs):
+            doc.add_paragraph(' '.join(rng.choice(SENTENCES) for _ in range(rng.randint(2, 5))))
+
+        for table_index in range(tables):
+            table = doc.add_table(rows=4, cols=3)
+            for row_index, row in enumerate(table.rows):
+                for col_index, cell in enumerate(row.cells):
+                    cell.text = f"T{table_index} R{row_index} C{col_index}: {rng.choice(SENTENCES)[:40]}"
+
+        for image_index in range(images):
+            picture = make_png(image_size, image_size, seed=seed * 1000 + index * 10 + image_index)
+            doc.add_picture(io.BytesIO(picture), width=Inches(2))
+
+    doc.save(output)
+    return output
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a synthetic CT write-up')
+    parser.add_argument('output')
+    parser.add_argument('--sections', type=int, default=8)
+    parser.add_argument('--paragraphs', type=int, default=10)
+    parser.add_argument('--tables', type=int, default=1)
+    parser.add_argument('--images', type=int, default=0)
+    parser.add_argument('--image-size', type=int, default=256, help='Image width/height in pixels')
+    parser.add_argument('--heading-style', choices=HEADING_STYLES, default='mixed')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    generate_writeup(args.output, args.sections, args.paragraphs, args.tables, args.images,
+                     args.heading_style, args.image_size, args.seed)
+    print(f"Wrote {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -21,9 +21,79 @@ class Config:
     SESSION_COOKIE_HTTPONLY = True
     SESSION_COOKIE_SAMESITE = 'Lax'
     
+    # Review session store limits (idle sessions expire after PERMANENT_SESSION_LIFETIME)
+    SESSION_MAX_COUNT = int(os.environ.get('SESSION_MAX_COUNT', 200))
+    SESSION_MAX_BYTES = int(os.environ.get('SESSION_MAX_MB', 1024)) * 1024 * 1024
+    SESSION_BACKEND = os.environ.get('SESSION_BACKEND', 'memory')  # 'memory' or 'sqlite'
+    SESSION_DB_PATH = os.environ.get('SESSION_DB_PATH', os.path.join('cache', 'sessions.sqlite3'))
+    
     # AWS Bedrock settings
     AWS_REGION = os.environ.get('AWS_DEFAULT_REGION', 'us-east-1')
     BEDROCK_MODEL_ID = 'anthropic.claude-3-sonnet-20240229-v1:0'
+    BEDROCK_MAX_POOL_CONNECTIONS = int(os.environ.get('BEDROCK_MAX_POOL_CONNECTIONS', 50))
+    BEDROCK_CONNECT_TIMEOUT = int(os.environ.get('BEDROCK_CONNECT_TIMEOUT', 5))
+    BEDROCK_READ_TIMEOUT = int(os.environ.get('BEDROCK_READ_TIMEOUT', 60))
+    BEDROCK_WARMUP = os.environ.get('BEDROCK_WARMUP', 'false').lower() == 'true'
+    
+    # Bedrock resilience: retries with jittered backoff, a per-call deadline and a circuit breaker
+    BEDROCK_MAX_ATTEMPTS = int(os.environ.get('BEDROCK_MAX_ATTEMPTS', 3))
+    BEDROCK_RETRY_BASE_DELAY = float(os.environ.get('BEDROCK_RETRY_BASE_DELAY', 0.5))
+    BEDROCK_RETRY_MAX_DELAY = float(os.environ.get('BEDROCK_RETRY_MAX_DELAY', 8))
+    BEDROCK_CALL_DEADLINE = float(os.environ.get('BEDROCK_CALL_DEADLINE', 90))
+    BEDROCK_BREAKER_THRESHOLD = int(os.environ.get('BEDROCK_BREAKER_THRESHOLD', 5))
+    BEDROCK_BREAKER_RESET_SECONDS = float(os.environ.get('BEDROCK_BREAKER_RESET_SECONDS', 30))
+    
+    # Bedrock usage ledger (prices in USD per 1K tokens, Claude 3 Sonnet on-demand)
+    USAGE_LEDGER_ENABLED = os.environ.get('USAGE_LEDGER_ENABLED', 'true').lower() == 'true'
+    USAGE_DB_PATH = os.environ.get('USAGE_DB_PATH', os.path.join('cache', 'usage.sqlite3'))
+    USAGE_RETENTION = timedelta(days=int(os.environ.get('USAGE_RETENTION_DAYS', 90)))
+    BEDROCK_INPUT_COST_PER_1K = float(os.environ.get('BEDROCK_INPUT_COST_PER_1K', 0.003))
+    BEDROCK_OUTPUT_COST_PER_1K = float(os.environ.get('BEDROCK_OUTPUT_COST_PER_1K', 0.015))
+    
+    # Hawkeye checklist retrieval (passages sent with each Bedrock call)
+    CHECKLIST_RETRIEVAL_ENABLED = os.environ.get('CHECKLIST_RETRIEVAL_ENABLED', 'true').lower() == 'true'
+    CHECKLIST_TOP_K = int(os.environ.get('CHECKLIST_TOP_K', 6))
+    CHECKLIST_TOKEN_BUDGET = int(os.environ.get('CHECKLIST_TOKEN_BUDGET', 3000))
+    
+    # Document paragraphs and cached feedback sent with each chat question
+    CHAT_CONTEXT_TOP_K = int(os.environ.get('CHAT_CONTEXT_TOP_K', 6))
+    CHAT_CONTEXT_TOKEN_BUDGET = int(os.environ.get('CHAT_CONTEXT_TOKEN_BUDGET', 1500))
+    
+    # Guideline documents are parsed once into JSON snapshots and re-checked periodically
+    GUIDELINES_SNAPSHOT_DIR = os.environ.get('GUIDELINES_SNAPSHOT_DIR', os.path.join('cache', 'guidelines'))
+    GUIDELINES_RECHECK_SECONDS = float(os.environ.get('GUIDELINES_RECHECK_SECONDS', 30))
+    
+    # Concurrency settings
+    ANALYSIS_MAX_WORKERS = int(os.environ.get('ANALYSIS_MAX_WORKERS', 8))
+    
+    # Sections longer than this many estimated tokens are analyzed in parallel chunks and merged
+    SECTION_CHUNK_TOKENS = int(os.environ.get('SECTION_CHUNK_TOKENS', 1500))
+    SECTION_CHUNK_WORKERS = int(os.environ.get('SECTION_CHUNK_WORKERS', 8))
+    
+    # Short sections are packed together into one Bedrock request
+    SECTION_PACKING_ENABLED = os.environ.get('SECTION_PACKING_ENABLED', 'true').lower() == 'true'
+    SECTION_PACK_SMALL_TOKENS = int(os.environ.get('SECTION_PACK_SMALL_TOKENS', 300))
+    SECTION_PACK_TOKEN_BUDGET = int(os.environ.get('SECTION_PACK_TOKEN_BUDGET', 1500))
+    SECTION_PACK_MAX_SECTIONS = int(os.environ.get('SECTION_PACK_MAX_SECTIONS', 4))
+    
+    # Background job settings
+    JOB_MAX_WORKERS = int(os.environ.get('JOB_MAX_WORKERS', 4))
+    JOB_MAX_PENDING = int(os.environ.get('JOB_MAX_PENDING', 32))
+    JOB_RETENTION = timedelta(hours=1)
+    
+    # Batch review settings
+    BATCH_MAX_DOCUMENTS = int(os.environ.get('BATCH_MAX_DOCUMENTS', 100))
+    BATCH_MAX_EXTRACT_BYTES = int(os.environ.get('BATCH_MAX_EXTRACT_MB', 500)) * 1024 * 1024
+    BATCH_PARSE_WORKERS = int(os.environ.get('BATCH_PARSE_WORKERS', os.cpu_count() or 2))
+    BATCH_BEDROCK_CONCURRENCY = int(os.environ.get('BATCH_BEDROCK_CONCURRENCY', 4))
+    BATCH_AUTO_ACCEPT_RISK = os.environ.get('BATCH_AUTO_ACCEPT_RISK', 'High')  # 'High', 'Medium' or 'Low'
+    BATCH_AUTO_ACCEPT_CONFIDENCE = float(os.environ.get('BATCH_AUTO_ACCEPT_CONFIDENCE', 0.85))
+    
+    # Persistent analysis cache settings
+    ANALYSIS_CACHE_ENABLED = os.environ.get('ANALYSIS_CACHE_ENABLED', 'true').lower() == 'true'
+    ANALYSIS_CACHE_PATH = os.environ.get('ANALYSIS_CACHE_PATH', os.path.join('cache', 'analysis_cache.sqlite3'))
+    ANALYSIS_CACHE_MAX_ENTRIES = int(os.environ.get('ANALYSIS_CACHE_MAX_ENTRIES', 5000))
+    ANALYSIS_CACHE_TTL = timedelta(days=int(os.environ.get('ANALYSIS_CACHE_TTL_DAYS', 7)))
     
     # Application settings
     HAWKEYE_SECTIONS = {
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+CT Review Tool - Hawkeye AI Analysis
+Command-line batch reviewer for directories of write-ups
+
+Usage:
+    python -m ct_review batch <directory> [--workers N] [--recursive]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+from werkzeug.utils import secure_filename
+
+from config import Config
+
+MANIFEST_NAME = 'ct_review_manifest.jsonl'
+
+
+def file_digest(path):
+    """sha256 of a file's contents, so edited documents are reviewed again"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def find_documents(directory, recursive=False):
+    """Return (name, path) for every .docx in directory, skipping Word lock files"""
+    paths = []
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for filename in sorted(files):
+            if filename.lower().endswith('.docx') and not filename.startswith('~$'):
+                paths.append(os.path.join(root, filename))
+        if not recursive:
+            break
+
+    # Names double as output file names, so flatten sub-directories into them
+    documents = []
+    used_names = set()
+    for path in paths:
+        name = secure_filename(os.path.relpath(path, directory))
+        unique_name = name
+        counter = 1
+        while unique_name.lower() in used_names:
+            counter += 1
+            unique_name = f"{counter}_{name}"
+        used_names.add(unique_name.lower())
+        documents.append((unique_name, path))
+    return documents
+
+
+def load_manifest(manifest_path):
+    """Return {digest: entry} for documents already reviewed successfully"""
+    completed = {}
+    if not os.path.exists(manifest_path):
+        return completed
+
+    with open(manifest_path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # A run killed mid-write can leave a partial last line
+                continue
+            if entry.get('status') == 'reviewed':
+                completed[entry['digest']] = entry
+    return completed
+
+
+def run_batch(args):
+    # Imported here so `--help` does not have to load the Flask app
+    from app import run_batch_review, build_batch_summary, batch_summary_csv, OUTPUT_FOLDER
+
+    if not os.path.isdir(args.directory):
+        print(f"Error: {args.directory} is not a directory")
+        return 1
+
+    os.makedirs(OUTPUT_FOLDER, exist_ok=True)
+    manifest_path = os.path.join(OUTPUT_FOLDER, MANIFEST_NAME)
+    completed = {} if args.fresh else load_manifest(manifest_path)
+
+    documents = find_documents(args.directory, args.recursive)
+    digests = {path: file_digest(path) for _, path in documents}
+    pending = [(name, path) for name, path in documents if digests[path] not in completed]
+    previous = [completed[digests[path]] for _, path in documents if digests[path] in completed]
+
+    print(f"Found {len(documents)} documents: {len(previous)} already reviewed, {len(pending)} to review")
+
+    entries = []
+    started = time.time()
+    if pending:
+        try:
+            with open(manifest_path, 'a', encoding='utf-8') as manifest:
+                batch = run_batch_review(
+                    pending, args.min_risk, args.min_confidence,
+                    parse_workers=args.workers, max_concurrency=args.workers
+                )
+                paths = dict(pending)
+                for entry in batch:
+                    entry['source'] = paths[entry['document']]
+                    entry['digest'] = digests[entry['source']]
+                    entries.append(entry)
+                    manifest.write(json.dumps(entry) + '\n')
+                    manifest.flush()
+
+                    status = entry['output_file'] if entry['status'] == 'reviewed' else f"FAILED: {entry['error']}"
+                    print(f"[{len(entries)}/{len(pending)}] {entry['document']}: "
+                          f"{entry['feedback_items']} feedback, {entry['auto_accepted']} accepted -> {status}")
+        except KeyboardInterrupt:
+            print(f"\nInterrupted after {len(entries)} documents; run the same command again to resume")
+
+    elapsed = time.time() - started
+    report_entries = previous + entries
+    summary = build_batch_summary(report_entries, started, args.min_risk, args.min_confidence)
+    summary['resumed'] = len(previous)
+    summary['documents_per_minute'] = round(len(entries) / elapsed * 60, 1) if elapsed else 0.0
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    report_path = os.path.join(OUTPUT_FOLDER, f'batch_report_{timestamp}')
+    with open(report_path + '.json', 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2)
+    with open(report_path + '.csv', 'w', encoding='utf-8', newline='') as f:
+        f.write(batch_summary_csv(report_entries))
+
+    sections = sum(entry['sections'] for entry in entries)
+    print(f"\nReviewed {len(entries)} documents ({sections} sections) in {elapsed:.1f}s")
+    if entries and elapsed:
+        print(f"Throughput: {len(entries) / elapsed * 60:.1f} docs/min, {sections / elapsed:.2f} sections/s")
+    print(f"Report: {report_path}.json, {report_path}.csv")
+
+    return 0 if all(entry['status'] == 'reviewed' for entry in entries) else 2
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='ct_review', description='CT Review Tool - Hawkeye AI Analysis')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    batch = commands.add_parser('batch', help='Review every .docx write-up in a directory')
+    batch.add_argument('directory', help='Directory containing .docx write-ups')
+    batch.add_argument('--workers', type=int, default=Config.BATCH_BEDROCK_CONCURRENCY,
+                       help='Parallel parse processes and Bedrock calls (default %(default)s)')
+    batch.add_argument('--recursive', action='store_true', help='Include sub-directories')
+    batch.add_argument('--min-risk', choices=['High', 'Medium', 'Low'], default=Config.BATCH_AUTO_ACCEPT_RISK,
+                       help='Lowest risk level that is auto-accepted (default %(default)s)')
+    batch.add_argument('--min-confidence', type=float, default=Config.BATCH_AUTO_ACCEPT_CONFIDENCE,
+                       help='Lowest confidence that is auto-accepted (default %(default)s)')
+    batch.add_argument('--fresh', action='store_true', help='Ignore the resume manifest and review everything')
+    batch.set_defaults(handler=run_batch)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
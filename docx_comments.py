@@ -0,0 +1,124 @@
+"""
+Zip-to-zip writer that adds Word comments to a .docx without unpacking it
+"""
+
+import copy
+import shutil
+import zipfile
+
+from lxml import etree
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+CT_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
+COMMENTS_REL_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/comments"
+COMMENTS_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.comments+xml"
+
+DOCUMENT_RELS_PART = "word/_rels/document.xml.rels"
+CONTENT_TYPES_PART = "[Content_Types].xml"
+DEFAULT_COMMENTS_PART = "word/comments.xml"
+
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
+def _w(tag):
+    return f"{{{W_NS}}}{tag}"
+
+
+def build_comments_xml(comments, existing_xml=None):
+    """Serialize comments into a comments part, appending to any existing one"""
+    if existing_xml:
+        root = etree.fromstring(existing_xml)
+    else:
+        root = etree.Element(_w('comments'), nsmap={'w': W_NS})
+
+    existing_ids = [int(c.get(_w('id'))) for c in root.findall(_w('comment')) if (c.get(_w('id')) or '').isdigit()]
+    next_id = max(existing_ids) + 1 if existing_ids else 0
+
+    for offset, comment in enumerate(comments):
+        element = etree.SubElement(root, _w('comment'))
+        element.set(_w('id'), str(next_id + offset))
+        element.set(_w('author'), comment['author'])
+        element.set(_w('date'), comment['date'].strftime('%Y-%m-%dT%H:%M:%SZ'))
+        # lxml escapes the text, and each line becomes its own paragraph
+        for line in str(comment['text']).split('\n'):
+            paragraph = etree.SubElement(element, _w('p'))
+            run = etree.SubElement(paragraph, _w('r'))
+            text = etree.SubElement(run, _w('t'))
+            text.set('{http://www.w3.org/XML/1998/namespace}space', 'preserve')
+            text.text = line
+
+    return etree.tostring(root, xml_declaration=True, encoding='UTF-8', standalone=True)
+
+
+def _ensure_comments_relationship(rels_xml):
+    """Return (rels xml, comments part name), adding the relationship if missing"""
+    root = etree.fromstring(rels_xml)
+    relationships = root.findall(f"{{{REL_NS}}}Relationship")
+
+    for rel in relationships:
+        if rel.get('Type') == COMMENTS_REL_TYPE:
+            return None, "word/" + rel.get('Target').lstrip('/').replace('word/', '', 1)
+
+    used_ids = {rel.get('Id') for rel in relationships}
+    rel_id = 'rIdComments'
+    suffix = 1
+    while rel_id in used_ids:
+        suffix += 1
+        rel_id = f'rIdComments{suffix}'
+
+    etree.SubElement(root, f"{{{REL_NS}}}Relationship", Id=rel_id, Type=COMMENTS_REL_TYPE, Target="comments.xml")
+    return etree.tostring(root, xml_declaration=True, encoding='UTF-8', standalone=True), DEFAULT_COMMENTS_PART
+
+
+def _ensure_comments_content_type(content_types_xml, part_name):
+    """Return updated content types xml, or None when nothing changes"""
+    root = etree.fromstring(content_types_xml)
+    part_uri = '/' + part_name
+    for override in root.findall(f"{{{CT_NS}}}Override"):
+        if override.get('PartName') == part_uri:
+            return None
+
+    etree.SubElement(root, f"{{{CT_NS}}}Override", PartName=part_uri, ContentType=COMMENTS_CONTENT_TYPE)
+    return etree.tostring(root, xml_declaration=True, encoding='UTF-8', standalone=True)
+
+
+def _copy_member(source, target, info):
+    """Stream a member into the target archive through the public zipfile API"""
+    with source.open(info) as src, target.open(copy.copy(info), 'w') as dst:
+        shutil.copyfileobj(src, dst, COPY_CHUNK_SIZE)
+
+
+def write_docx_with_comments(source_file, output_file, comments):
+    """Copy a .docx to output_file, regenerating only the comment-related parts
+
+    source_file and output_file may be paths or binary file objects, so the
+    result can be written to disk, an in-memory buffer or a spooled temp file.
+    """
+    with zipfile.ZipFile(source_file) as source:
+        names = set(source.namelist())
+
+        rels_xml, comments_part = None, DEFAULT_COMMENTS_PART
+        if DOCUMENT_RELS_PART in names:
+            rels_xml, comments_part = _ensure_comments_relationship(source.read(DOCUMENT_RELS_PART))
+
+        content_types_xml = None
+        if CONTENT_TYPES_PART in names:
+            content_types_xml = _ensure_comments_content_type(source.read(CONTENT_TYPES_PART), comments_part)
+
+        existing_comments = source.read(comments_part) if comments_part in names else None
+        replacements = {comments_part: build_comments_xml(comments, existing_comments)}
+        if rels_xml is not None:
+            replacements[DOCUMENT_RELS_PART] = rels_xml
+        if content_types_xml is not None:
+            replacements[CONTENT_TYPES_PART] = content_types_xml
+
+        with zipfile.ZipFile(output_file, 'w', zipfile.ZIP_DEFLATED) as target:
+            for info in source.infolist():
+                if info.filename in replacements:
+                    target.writestr(copy.copy(info), replacements.pop(info.filename), compress_type=zipfile.ZIP_DEFLATED)
+                else:
+                    _copy_member(source, target, info)
+
+            for name, data in replacements.items():
+                target.writestr(name, data)
@@ -0,0 +1,147 @@
+"""
+Fast section extraction that streams word/document.xml with lxml
+"""
+
+import posixpath
+import zipfile
+
+from lxml import etree
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+OFFICE_DOCUMENT_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+
+W_BODY = f"{{{W_NS}}}body"
+W_P = f"{{{W_NS}}}p"
+W_R = f"{{{W_NS}}}r"
+W_RPR = f"{{{W_NS}}}rPr"
+W_B = f"{{{W_NS}}}b"
+W_VAL = f"{{{W_NS}}}val"
+W_T = f"{{{W_NS}}}t"
+W_TAB = f"{{{W_NS}}}tab"
+W_BREAKS = (f"{{{W_NS}}}br", f"{{{W_NS}}}cr")
+
+BOLD_OFF_VALUES = ('0', 'false', 'off')
+
+
+def _main_document_part(archive):
+    """Find the main document part from the package relationships"""
+    try:
+        rels = etree.fromstring(archive.read('_rels/.rels'))
+        for rel in rels.iter(f"{{{REL_NS}}}Relationship"):
+            if rel.get('Type') == OFFICE_DOCUMENT_REL:
+                return posixpath.normpath(rel.get('Target').lstrip('/'))
+    except KeyError:
+        pass
+    return 'word/document.xml'
+
+
+def _run_is_bold(run):
+    """Direct bold formatting of a run, as python-docx's Run.bold reports it"""
+    rpr = run.find(W_RPR)
+    if rpr is None:
+        return False
+    bold = rpr.find(W_B)
+    if bold is None:
+        return False
+    return bold.get(W_VAL) not in BOLD_OFF_VALUES
+
+
+def _run_text(run):
+    text = ''
+    for child in run:
+        tag = child.tag
+        if tag == W_T:
+            text += child.text or ''
+        elif tag == W_TAB:
+            text += '\t'
+        elif tag in W_BREAKS:
+            text += '\n'
+    return text
+
+
+def iter_body_paragraphs(docx_file):
+    """Yield (text, is_bold) for each top-level body paragraph
+
+    Mirrors python-docx's Document.paragraphs / Paragraph.text / Run.bold
+    without building proxy objects or reading any part besides the main
+    document. Paragraphs inside tables and content controls are skipped,
+    exactly as python-docx skips them.
+    """
+    with zipfile.ZipFile(docx_file) as archive:
+        with archive.open(_main_document_part(archive)) as document_xml:
+            for _, element in etree.iterparse(document_xml, events=('end',), tag=W_P, huge_tree=True):
+                parent = element.getparent()
+                if parent is not None and parent.tag == W_BODY:
+                    runs = element.findall(W_R)
+                    text = ''.join(_run_text(run) for run in runs)
+                    bold_runs = sum(1 for run in runs if _run_is_bold(run))
+                    yield text, bool(runs) and bold_runs > len(runs) / 2
+
+                    # Free everything parsed so far at body level
+                    element.clear()
+                    while element.getprevious() is not None:
+                        del parent[0]
+                else:
+                    element.clear()
+
+
+def extract_document_sections_from_xml(docx_file, standard_sections, excluded_sections):
+    """Extract sections straight from document.xml
+
+    Returns the same (sections, section_paragraphs, paragraph_indices) shape as
+    the python-docx based extractor; section_paragraphs holds paragraph text
+    instead of Paragraph objects.
+    """
+    standard_lower = [name.lower() for name in standard_sections]
+    excluded_lower = [name.lower() for name in excluded_sections]
+
+    sections = {}
+    section_paragraphs = {}
+    paragraph_indices = {}
+    all_paragraphs = []
+    current_section = None
+    current_content = []
+    current_paragraphs = []
+    current_indices = []
+
+    def close_section():
+        if current_section and current_content:
+            section_lower = current_section.lower()
+            if not any(excluded in section_lower for excluded in excluded_lower):
+                sections[current_section] = '\n'.join(current_content)
+                section_paragraphs[current_section] = current_paragraphs
+                paragraph_indices[current_section] = current_indices
+
+    for idx, (raw_text, is_bold) in enumerate(iter_body_paragraphs(docx_file)):
+        text = raw_text.strip()
+        if text:
+            all_paragraphs.append((idx, raw_text))
+
+        is_section_header = False
+        if is_bold and text and len(text) < 100:
+            text_lower = text.lower()
+            is_section_header = (
+                any(name in text_lower for name in standard_lower)
+                or text.endswith(':') or text.isupper()
+            )
+
+        if is_section_header:
+            close_section()
+            current_section = text.rstrip(':')
+            current_content = []
+            current_paragraphs = []
+            current_indices = []
+        elif text:
+            current_content.append(text)
+            current_paragraphs.append(raw_text)
+            current_indices.append(idx)
+
+    close_section()
+
+    if not sections:
+        sections = {"Main Content": '\n'.join(raw for _, raw in all_paragraphs)}
+        section_paragraphs = {"Main Content": [raw for _, raw in all_paragraphs]}
+        paragraph_indices = {"Main Content": [idx for idx, _ in all_paragraphs]}
+
+    return sections, section_paragraphs, paragraph_indices
@@ -0,0 +1,80 @@
+"""
+Incremental parser for streamed feedback JSON
+"""
+
+import json
+
+
+class FeedbackItemStreamParser:
+    """Pull complete objects out of a "feedback_items" array as text arrives"""
+
+    def __init__(self, array_key="feedback_items"):
+        self.marker = f'"{array_key}"'
+        self.buffer = ""
+        self.pos = 0
+        self.in_array = False
+        self.finished = False
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.item_start = None
+
+    def feed(self, text):
+        """Consume a chunk of model output and return newly completed items"""
+        self.buffer += text
+        items = []
+
+        if not self.in_array:
+            marker_at = self.buffer.find(self.marker, self.pos)
+            if marker_at == -1:
+                # Keep enough of the tail to match a marker split across chunks
+                self.pos = max(self.pos, len(self.buffer) - len(self.marker))
+                return items
+            bracket_at = self.buffer.find('[', marker_at + len(self.marker))
+            if bracket_at == -1:
+                self.pos = marker_at
+                return items
+            self.in_array = True
+            self.pos = bracket_at + 1
+
+        while self.pos < len(self.buffer) and not self.finished:
+            char = self.buffer[self.pos]
+
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == '\\':
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = True
+            elif char == '{':
+                if self.depth == 0:
+                    self.item_start = self.pos
+                self.depth += 1
+            elif char == '}':
+                self.depth -= 1
+                if self.depth == 0 and self.item_start is not None:
+                    item = self._decode(self.buffer[self.item_start:self.pos + 1])
+                    if item is not None:
+                        items.append(item)
+                    self.item_start = None
+            elif char == ']' and self.depth == 0:
+                self.finished = True
+
+            self.pos += 1
+
+        # Drop text that can no longer be part of an item
+        if self.item_start is None:
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+
+        return items
+
+    def _decode(self, text):
+        try:
+            item = json.loads(text)
+        except ValueError:
+            return None
+        return item if isinstance(item, dict) else None
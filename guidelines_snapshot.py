@@ -0,0 +1,133 @@
+"""
+Parsed guideline documents cached as snapshots that survive restarts
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+SNAPSHOT_VERSION = 1
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def paragraph_offsets(text):
+    """Start offset of every line (paragraph) in text"""
+    offsets = [0]
+    position = text.find('\n')
+    while position != -1:
+        offsets.append(position + 1)
+        position = text.find('\n', position + 1)
+    return offsets
+
+
+class GuidelineSource:
+    """One guideline document, parsed at most once per change
+
+    get() returns the document text, or None while the file is missing or
+    unreadable. The file is stat'ed at most every recheck_seconds, so a
+    missing document costs nothing per call; a changed mtime or size is
+    confirmed against the content hash before the document is re-parsed.
+    """
+
+    def __init__(self, path, snapshot_dir, reader, recheck_seconds=30):
+        self.path = path
+        self.reader = reader
+        self.recheck_seconds = recheck_seconds
+        self.snapshot_path = os.path.join(snapshot_dir, os.path.basename(path) + '.json')
+        self.text = None
+        self.offsets = []
+        self.sha256 = None
+        self.parses = 0
+        self._stamp = None
+        self._checked_at = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        now = time.monotonic()
+        if self._checked_at is not None and now - self._checked_at < self.recheck_seconds:
+            return self.text
+
+        with self._lock:
+            if self._checked_at is None or now - self._checked_at >= self.recheck_seconds:
+                self._refresh()
+                self._checked_at = time.monotonic()
+        return self.text
+
+    def invalidate(self):
+        """Force the next get() to re-check the source file"""
+        self._checked_at = None
+
+    def _refresh(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            # Negative result: remembered until the next recheck
+            self._set(None, None, None)
+            return
+
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp == self._stamp:
+            return
+
+        snapshot = self._read_snapshot()
+        if snapshot and (snapshot['mtime_ns'], snapshot['size']) == stamp:
+            self._set(snapshot, stamp, snapshot['sha256'])
+            return
+
+        try:
+            sha256 = file_sha256(self.path)
+            if snapshot and snapshot['sha256'] == sha256:
+                # Touched or copied without changing content: keep the parsed text
+                snapshot.update(mtime_ns=stamp[0], size=stamp[1])
+            else:
+                text = self.reader(self.path)
+                self.parses += 1
+                snapshot = {
+                    'version': SNAPSHOT_VERSION,
+                    'sha256': sha256,
+                    'text': text,
+                    'offsets': paragraph_offsets(text),
+                    'mtime_ns': stamp[0],
+                    'size': stamp[1]
+                }
+            self._write_snapshot(snapshot)
+            self._set(snapshot, stamp, sha256)
+        except Exception as e:
+            print(f"Error loading guidelines from {self.path}: {str(e)}")
+            self._set(None, stamp, None)
+
+    def _set(self, snapshot, stamp, sha256):
+        self.text = snapshot['text'] if snapshot else None
+        self.offsets = snapshot['offsets'] if snapshot else []
+        self.sha256 = sha256
+        self._stamp = stamp
+
+    def _read_snapshot(self):
+        try:
+            with open(self.snapshot_path, encoding='utf-8') as f:
+                snapshot = json.load(f)
+            if snapshot.get('version') == SNAPSHOT_VERSION:
+                return snapshot
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def _write_snapshot(self, snapshot):
+        try:
+            os.makedirs(os.path.dirname(self.snapshot_path) or '.', exist_ok=True)
+            temp_path = f"{self.snapshot_path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f)
+            # Atomic, so concurrent workers never read a half-written snapshot
+            os.replace(temp_path, self.snapshot_path)
+        except OSError as e:
+            print(f"Could not write guidelines snapshot {self.snapshot_path}: {str(e)}")
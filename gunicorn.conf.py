@@ -0,0 +1,52 @@
+"""
+Gunicorn settings for CT Review Tool (used by `python run.py production`)
+"""
+
+import multiprocessing
+import os
+import threading
+
+from config import Config
+
+
+def default_workers():
+    # In-memory sessions live in one process, so several workers need the shared SQLite store
+    if Config.SESSION_BACKEND != 'sqlite':
+        return 1
+    return min(multiprocessing.cpu_count() * 2 + 1, 8)
+
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+workers = int(os.environ.get('WEB_CONCURRENCY', default_workers()))
+
+# Most request time is spent waiting on Bedrock, so each worker serves many requests on threads
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
+
+# Load the app, guidelines and matchers once in the master and fork workers from it
+preload_app = os.environ.get('GUNICORN_PRELOAD', 'true').lower() == 'true'
+
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 120))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', 30))
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 5))
+
+# Recycle workers now and then so slow leaks cannot build up; never with in-memory sessions,
+# which would be lost with the worker
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 1000 if Config.SESSION_BACKEND == 'sqlite' else 0))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', 100))
+
+accesslog = '-'
+errorlog = '-'
+
+
+def post_fork(server, worker):
+    """Each worker opens its own Bedrock connections; pools and SQLite connections reset on fork by themselves"""
+    if Config.BEDROCK_WARMUP:
+        from bedrock_client import warm_up_bedrock_client
+        threading.Thread(target=warm_up_bedrock_client, daemon=True).start()
+
+
+def worker_exit(server, worker):
+    """Stop background jobs and thread pools once the worker has finished its requests"""
+    from app import shutdown_pools
+    shutdown_pools(wait=False)
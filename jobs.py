@@ -0,0 +1,156 @@
+"""
+Background job execution for long-running analyses
+"""
+
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+
+class JobQueueFull(Exception):
+    """Raised when no more jobs can be accepted"""
+
+
+class JobCancelled(Exception):
+    """Raised inside a job function once cancellation has been requested"""
+
+
+class Job:
+    """State of one background job"""
+
+    def __init__(self, kind, owner=None):
+        self.job_id = str(uuid.uuid4())
+        self.kind = kind
+        self.owner = owner
+        self.status = 'queued'
+        self.progress = 0.0
+        self.message = ''
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.cancel_event = threading.Event()
+        self.future = None
+
+    @property
+    def finished(self):
+        return self.status in ('succeeded', 'failed', 'cancelled')
+
+    def update(self, progress=None, message=None):
+        """Report progress from inside the job function"""
+        if progress is not None:
+            self.progress = max(0.0, min(1.0, progress))
+        if message is not None:
+            self.message = message
+
+    def check_cancelled(self):
+        """Stop the job function if cancellation was requested"""
+        if self.cancel_event.is_set():
+            raise JobCancelled()
+
+    def to_dict(self, include_result=True):
+        data = {
+            'job_id': self.job_id,
+            'kind': self.kind,
+            'status': self.status,
+            'progress': round(self.progress, 3),
+            'message': self.message,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at
+        }
+        if self.error:
+            data['error'] = self.error
+        if include_result and self.status == 'succeeded':
+            data['result'] = self.result
+        return data
+
+
+class JobManager:
+    """Run job functions on a bounded pool and track their status"""
+
+    def __init__(self, max_workers=4, max_pending=32, retention_seconds=3600):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.retention_seconds = retention_seconds
+        self.jobs = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='job')
+
+    def submit(self, kind, fn, *args, owner=None, **kwargs):
+        """Queue fn(job, *args, **kwargs) and return its Job"""
+        with self._lock:
+            self._prune()
+            active = sum(1 for job in self.jobs.values() if not job.finished)
+            if active >= self.max_workers + self.max_pending:
+                raise JobQueueFull(f"{active} jobs already queued or running")
+
+            job = Job(kind, owner=owner)
+            self.jobs[job.job_id] = job
+            job.future = self._executor.submit(self._run, job, fn, args, kwargs)
+        return job
+
+    def _run(self, job, fn, args, kwargs):
+        if job.cancel_event.is_set():
+            job.status = 'cancelled'
+            job.finished_at = time.time()
+            return
+
+        job.status = 'running'
+        job.started_at = time.time()
+        try:
+            job.result = fn(job, *args, **kwargs)
+            job.progress = 1.0
+            job.status = 'succeeded'
+        except JobCancelled:
+            job.status = 'cancelled'
+        except Exception as e:
+            print(f"Job {job.job_id} failed: {str(e)}")
+            job.error = str(e)
+            job.status = 'failed'
+        finally:
+            job.finished_at = time.time()
+
+    def get(self, job_id):
+        return self.jobs.get(job_id)
+
+    def cancel(self, job_id):
+        """Request cancellation; queued jobs never start, running jobs stop at their next check"""
+        job = self.jobs.get(job_id)
+        if job is None or job.finished:
+            return job
+
+        job.cancel_event.set()
+        if job.future is not None and job.future.cancel():
+            job.status = 'cancelled'
+            job.finished_at = time.time()
+        return job
+
+    def shutdown(self, wait=True):
+        """Ask running jobs to stop, drop queued ones and stop the pool"""
+        for job in list(self.jobs.values()):
+            if not job.finished:
+                job.cancel_event.set()
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def reset_after_fork(self):
+        """Start a forked child with no jobs and its own pool; the parent's pool threads do not exist there"""
+        self.jobs = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='job')
+
+    def _prune(self):
+        """Forget finished jobs older than the retention window"""
+        cutoff = time.time() - self.retention_seconds
+        expired = [job_id for job_id, job in self.jobs.items()
+                   if job.finished and job.finished_at and job.finished_at < cutoff]
+        for job_id in expired:
+            del self.jobs[job_id]
+
+    def stats(self):
+        counts = {}
+        for job in list(self.jobs.values()):
+            counts[job.status] = counts.get(job.status, 0) + 1
+        return counts
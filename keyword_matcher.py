@@ -0,0 +1,97 @@
+"""
+Precompiled keyword matching for Hawkeye references and risk classification
+"""
+
+from collections import deque
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton that reports every keyword occurrence in one pass"""
+
+    def __init__(self, keywords):
+        # keywords: mapping of keyword -> list of labels it stands for
+        self.transitions = [{}]
+        self.outputs = [[]]
+        fail = [0]
+
+        for keyword, labels in keywords.items():
+            state = 0
+            for char in keyword:
+                next_state = self.transitions[state].get(char)
+                if next_state is None:
+                    next_state = len(self.transitions)
+                    self.transitions[state][char] = next_state
+                    self.transitions.append({})
+                    self.outputs.append([])
+                    fail.append(0)
+                state = next_state
+            self.outputs[state].extend((len(keyword), label) for label in labels)
+
+        # Breadth-first pass: link each state to its longest proper suffix and
+        # inherit that state's outputs and transitions, producing a full DFA
+        # so scanning never has to follow failure links.
+        queue = deque(self.transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.transitions[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in self.transitions[fallback]:
+                    fallback = fail[fallback]
+                link = self.transitions[fallback].get(char, 0)
+                fail[next_state] = link if link != next_state else 0
+                self.outputs[next_state].extend(self.outputs[fail[next_state]])
+            for char, next_state in self.transitions[fail[state]].items():
+                self.transitions[state].setdefault(char, next_state)
+
+    def scan(self, text):
+        """Yield (start, end, label) for every keyword occurrence in text"""
+        transitions = self.transitions
+        outputs = self.outputs
+        state = 0
+        for index, char in enumerate(text):
+            state = transitions[state].get(char, 0)
+            if outputs[state]:
+                end = index + 1
+                for length, label in outputs[state]:
+                    yield end - length, end, label
+
+
+class HawkeyeMatcher:
+    """Match Hawkeye checkpoints and risk tiers for feedback text in a single scan"""
+
+    def __init__(self, checkpoint_keywords, high_risk_indicators, medium_risk_indicators):
+        keywords = {}
+        for number, words in checkpoint_keywords.items():
+            for word in words:
+                keywords.setdefault(word, []).append(('checkpoint', number))
+        for word in high_risk_indicators:
+            keywords.setdefault(word, []).append(('risk', 2))
+        for word in medium_risk_indicators:
+            keywords.setdefault(word, []).append(('risk', 1))
+        self.automaton = KeywordAutomaton(keywords)
+
+    def match(self, category, description):
+        """Return (sorted checkpoint numbers, risk tier) for one feedback item"""
+        # Risk indicators are matched against "description category" as a whole;
+        # checkpoint keywords must fall entirely inside one of the two fields.
+        description = description.lower()
+        text = f"{description} {category.lower()}"
+        boundary = len(description)
+
+        checkpoints = set()
+        risk = 0
+        for start, end, (kind, value) in self.automaton.scan(text):
+            if kind == 'risk':
+                risk = max(risk, value)
+            elif end <= boundary or start > boundary:
+                checkpoints.add(value)
+
+        return sorted(checkpoints), ('Low', 'Medium', 'High')[risk]
+
+    def match_items(self, feedback_items):
+        """Match a batch of feedback items"""
+        return [
+            self.match(item.get('category', ''), item.get('description', ''))
+            for item in feedback_items
+        ]
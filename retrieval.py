@@ -0,0 +1,198 @@
+"""
+BM25 retrieval over Hawkeye checklist passages
+"""
+
+import math
+import re
+import threading
+
+import numpy as np
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = frozenset("""
+a an and are as at be been but by can could did do does for from had has have how if in into is it its
+may might must no not of on or our should so such than that the their them then there these they this
+those to was we were what when where which while who why will with would you your
+""".split())
+
+# Lines like "1. Initial Assessment", "#11 - Root Cause", "Hawkeye #4: ..." or "Checkpoint 7)"
+CHECKPOINT_HEADING = re.compile(r"^\s*(?:hawkeye\s*|checkpoint\s*)?#?\s*(\d{1,2})\s*[\.\):\-]\s*\S", re.IGNORECASE)
+
+# Rough size of an English token for Anthropic models
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text):
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def tokenize(text):
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
+
+
+def _chunk_lines(lines, max_chars, prefix=''):
+    """Group lines into chunks of at most max_chars, each starting with prefix"""
+    chunks = []
+    current = prefix
+    for line in lines:
+        if current != prefix and len(current) + len(line) + 1 > max_chars:
+            chunks.append(current.strip())
+            current = prefix
+        current += line + '\n'
+    if current != prefix:
+        chunks.append(current.strip())
+    return chunks
+
+
+def split_checklist_passages(text, max_chars=1500):
+    """Split checklist text into per-checkpoint passages
+
+    A passage starts at each numbered checkpoint heading and runs to the next
+    one. Overlong checkpoints are split further, repeating the heading line so
+    each piece stays attributable. Text without recognizable headings is
+    chunked by paragraph.
+    """
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    headings = [index for index, line in enumerate(lines) if CHECKPOINT_HEADING.match(line)]
+
+    if len(headings) < 2:
+        return _chunk_lines(lines, max_chars)
+
+    passages = []
+    if headings[0] > 0:
+        passages.extend(_chunk_lines(lines[:headings[0]], max_chars))
+
+    for position, start in enumerate(headings):
+        end = headings[position + 1] if position + 1 < len(headings) else len(lines)
+        heading, body = lines[start], lines[start + 1:end]
+        if len(heading) + sum(len(line) + 1 for line in body) <= max_chars:
+            passages.append('\n'.join([heading] + body))
+        else:
+            passages.extend(_chunk_lines(body, max_chars, prefix=heading + '\n'))
+
+    return passages
+
+
+class BM25Index:
+    """Okapi BM25 over a list of passages, with per-term postings held in NumPy arrays"""
+
+    def __init__(self, passages, k1=1.5, b=0.75):
+        self.passages = list(passages)
+        self.size = len(self.passages)
+
+        postings = {}
+        lengths = np.zeros(self.size, dtype=np.float32)
+        for doc_id, passage in enumerate(self.passages):
+            tokens = tokenize(passage)
+            lengths[doc_id] = len(tokens)
+            counts = {}
+            for token in tokens:
+                counts[token] = counts.get(token, 0) + 1
+            for token, count in counts.items():
+                postings.setdefault(token, ([], []))
+                postings[token][0].append(doc_id)
+                postings[token][1].append(count)
+
+        average_length = float(lengths.mean()) if self.size and lengths.sum() else 1.0
+        norms = k1 * (1 - b + b * lengths / average_length)
+
+        # Precompute each term's BM25 contribution per passage so a query is
+        # just a scatter-add of the query terms' postings
+        self.postings = {}
+        for token, (doc_ids, counts) in postings.items():
+            doc_ids = np.array(doc_ids, dtype=np.int32)
+            tf = np.array(counts, dtype=np.float32)
+            idf = math.log(1 + (self.size - len(doc_ids) + 0.5) / (len(doc_ids) + 0.5))
+            self.postings[token] = (doc_ids, idf * tf * (k1 + 1) / (tf + norms[doc_ids]))
+
+    def scores(self, query):
+        scores = np.zeros(self.size, dtype=np.float32)
+        for token in set(tokenize(query)):
+            entry = self.postings.get(token)
+            if entry is not None:
+                # A term lists each passage at most once, so plain fancy-index add is safe
+                scores[entry[0]] += entry[1]
+        return scores
+
+    def search(self, query, top_k=5):
+        """Return [(passage index, score)] for the best matching passages, best first"""
+        if not self.size:
+            return []
+        scores = self.scores(query)
+        top_k = min(top_k, self.size)
+        candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+        ranked = candidates[np.argsort(-scores[candidates], kind='stable')]
+        return [(int(index), float(scores[index])) for index in ranked if scores[index] > 0]
+
+
+class ChecklistRetriever:
+    """Select the checklist passages relevant to a prompt within a token budget"""
+
+    def __init__(self, checklist_text, top_k=6, token_budget=3000, full_prompt_chars=30000):
+        self.source = checklist_text
+        self.top_k = top_k
+        self.token_budget = token_budget
+        self.index = BM25Index(split_checklist_passages(checklist_text))
+        # What every call used to send: the first full_prompt_chars of the checklist
+        self.full_tokens = estimate_tokens(checklist_text[:full_prompt_chars])
+        self.calls = 0
+        self.tokens_included = 0
+        self.tokens_saved = 0
+        self._stats_lock = threading.Lock()
+
+    def select(self, query):
+        """Return the relevant passages in checklist order, within the token budget"""
+        chosen = []
+        used = 0
+        for index, _ in self.index.search(query, self.top_k):
+            tokens = estimate_tokens(self.index.passages[index])
+            if used + tokens > self.token_budget:
+                continue
+            chosen.append(index)
+            used += tokens
+
+        with self._stats_lock:
+            self.calls += 1
+            self.tokens_included += used
+            self.tokens_saved += max(self.full_tokens - used, 0)
+
+        return [self.index.passages[index] for index in sorted(chosen)]
+
+    def stats(self):
+        return {
+            'passages': self.index.size,
+            'top_k': self.top_k,
+            'token_budget': self.token_budget,
+            'full_checklist_tokens': self.full_tokens,
+            'calls': self.calls,
+            'tokens_included': self.tokens_included,
+            'tokens_saved': self.tokens_saved,
+            'avg_tokens_per_call': round(self.tokens_included / self.calls, 1) if self.calls else 0.0
+        }
+
+
+class DocumentRetriever:
+    """BM25 index over the paragraphs of one uploaded document, for grounding chat answers"""
+
+    def __init__(self, sections):
+        # Each passage is one non-empty paragraph; the section name is indexed
+        # with it so questions naming a section find that section's paragraphs
+        self.paragraphs = []
+        for section_name, content in sections.items():
+            for position, text in enumerate(content.split('\n')):
+                if text.strip():
+                    self.paragraphs.append((section_name, position, text.strip()))
+        self.index = BM25Index(f"{name}\n{text}" for name, _, text in self.paragraphs)
+
+    def select(self, query, top_k=6, token_budget=1500):
+        """Return [(section name, paragraph position, text)] relevant to query, in document order, within token_budget"""
+        chosen = []
+        used = 0
+        for index, _ in self.index.search(query, top_k):
+            tokens = estimate_tokens(self.paragraphs[index][2])
+            if used + tokens > token_budget:
+                continue
+            chosen.append(index)
+            used += tokens
+        return [self.paragraphs[index] for index in sorted(chosen)]
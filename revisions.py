@@ -0,0 +1,58 @@
+"""
+Recognizing revised uploads of a write-up and diffing their sections
+"""
+
+import hashlib
+import os
+import re
+
+# "Writeup_v2.docx", "writeup (1).docx", "Writeup_1.docx", "Writeup-rev3-final.docx" -> "writeup"
+VERSION_SUFFIX = re.compile(
+    r"(?:[\s_\-]*\(\d+\)|[\s_\-]+(?:\d+|v\d+|rev(?:ision)?\s*\d*|r\d+|draft|final|updated|new|copy))+$",
+    re.IGNORECASE
+)
+
+
+def document_base_name(filename):
+    """Document name without extension or trailing version markers"""
+    stem = os.path.splitext(filename or '')[0].strip().lower()
+    return VERSION_SUFFIX.sub('', stem) or stem
+
+
+def section_digest(content):
+    """Digest of a section's text that ignores whitespace-only edits"""
+    return hashlib.sha256(' '.join(content.split()).encode('utf-8')).hexdigest()[:16]
+
+
+def diff_sections(previous_sections, sections):
+    """Compare two versions' sections (name -> content) by content digest
+
+    Returns {'unchanged', 'changed', 'added', 'removed'}, each a list of
+    section names in document order.
+    """
+    diff = {'unchanged': [], 'changed': [], 'added': [], 'removed': []}
+    for name, content in sections.items():
+        if name not in previous_sections:
+            diff['added'].append(name)
+        elif section_digest(previous_sections[name]) == section_digest(content):
+            diff['unchanged'].append(name)
+        else:
+            diff['changed'].append(name)
+    diff['removed'] = [name for name in previous_sections if name not in sections]
+    return diff
+
+
+def is_revision(previous_name, previous_sections, name, sections, min_unchanged=0.5, require_both=False):
+    """Whether an upload looks like a new version of a previously reviewed document
+
+    The file names match once version markers are dropped, or at least
+    min_unchanged of the earlier version's sections are unchanged; with
+    require_both, both must hold. Section names alone prove nothing, as
+    every write-up uses the same ones.
+    """
+    if not previous_sections or not sections:
+        return False
+    same_name = document_base_name(previous_name) == document_base_name(name)
+    unchanged = len(diff_sections(previous_sections, sections)['unchanged'])
+    overlapping = unchanged >= min_unchanged * len(previous_sections)
+    return same_name and overlapping if require_both else same_name or overlapping
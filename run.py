@@ -6,7 +6,33 @@ Deployment script for the web application
 
 import os
 import sys
-from app import app
+import threading
+
+def start_bedrock_warm_up():
+    """Open a Bedrock connection in the background when BEDROCK_WARMUP is set (gunicorn workers do this in post_fork)"""
+    from config import Config
+    if Config.BEDROCK_WARMUP:
+        from bedrock_client import warm_up_bedrock_client
+        threading.Thread(target=warm_up_bedrock_client, daemon=True).start()
+
+def run_production(port):
+    """Serve with gunicorn (settings in gunicorn.conf.py), or the Flask server where gunicorn is unavailable"""
+    try:
+        import gunicorn  # noqa: F401
+    except ImportError:
+        gunicorn = None
+
+    if gunicorn is None or not hasattr(os, 'fork'):
+        print("Warning: gunicorn is not available, falling back to the Flask development server")
+        from app import app
+        start_bedrock_warm_up()
+        app.config['DEBUG'] = False
+        app.run(host='0.0.0.0', port=port, debug=False, threaded=True)
+        return
+
+    # Replace this process with the gunicorn master so it receives the platform's stop signals
+    config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'gunicorn.conf.py')
+    os.execvp(sys.executable, [sys.executable, '-m', 'gunicorn', '--config', config_path, 'wsgi:app'])
 
 if __name__ == '__main__':
     # Create necessary directories
@@ -15,21 +41,21 @@ if __name__ == '__main__':
         os.makedirs('outputs', exist_ok=True)
     except Exception as e:
         print(f"Warning: Could not create directories: {e}")
-    
+
     # Get port from environment (Railway, Heroku) or default to 5000
     port = int(os.environ.get('PORT', 5000))
-    
+
     # Set environment variables for production
     if len(sys.argv) > 1 and sys.argv[1] == 'production':
-        app.config['DEBUG'] = False
-        app.config['ENV'] = 'production'
         print("Starting CT Review Tool in PRODUCTION mode...")
         print(f"Access the application at: http://localhost:{port}")
-        app.run(host='0.0.0.0', port=port, debug=False)
+        run_production(port)
     else:
+        from app import app
+        start_bedrock_warm_up()
         app.config['DEBUG'] = True
         app.config['ENV'] = 'development'
         print("Starting CT Review Tool in DEVELOPMENT mode...")
         print(f"Access the application at: http://localhost:{port}")
         print("Debug mode is enabled - changes will auto-reload")
-        app.run(host='0.0.0.0', port=port, debug=True)
\ No newline at end of file
+        app.run(host='0.0.0.0', port=port, debug=True)
@@ -0,0 +1,166 @@
+"""
+Paragraph-aligned chunking of long sections and merging of per-chunk feedback
+"""
+
+from retrieval import estimate_tokens, tokenize
+
+RISK_ORDER = {'High': 0, 'Medium': 1, 'Low': 2}
+TYPE_ORDER = {'critical': 0, 'important': 1, 'suggestion': 2, 'positive': 3}
+
+
+def split_section_chunks(paragraphs, token_budget):
+    """Group consecutive paragraphs into chunks of roughly token_budget tokens
+
+    Returns [{'text': ..., 'paragraphs': [paragraph positions]}]. Chunks only
+    break between paragraphs, so a single paragraph larger than the budget
+    becomes a chunk of its own rather than being cut.
+    """
+    chunks = []
+    current = []
+    current_tokens = 0
+    for position, text in enumerate(paragraphs):
+        tokens = estimate_tokens(text) + 1
+        if current and current_tokens + tokens > token_budget:
+            chunks.append(_make_chunk(paragraphs, current))
+            current = []
+            current_tokens = 0
+        current.append(position)
+        current_tokens += tokens
+    if current:
+        chunks.append(_make_chunk(paragraphs, current))
+    return chunks
+
+
+def _make_chunk(paragraphs, positions):
+    return {'text': '\n'.join(paragraphs[position] for position in positions), 'paragraphs': positions}
+
+
+def _item_words(item):
+    return set(tokenize(f"{item.get('description', '')} {item.get('suggestion', '')}"))
+
+
+def attach_source_paragraphs(feedback_items, paragraphs, positions):
+    """Record which section paragraphs each item came from
+
+    source_paragraphs lists the chunk's paragraph positions within the
+    section; source_paragraph is the one sharing the most words with the
+    item, or the chunk's first paragraph when nothing matches.
+    """
+    if not positions:
+        return feedback_items
+
+    paragraph_words = [set(tokenize(paragraphs[position])) for position in positions]
+    for item in feedback_items:
+        words = _item_words(item)
+        overlaps = [len(words & candidate) for candidate in paragraph_words]
+        item['source_paragraph'] = positions[overlaps.index(max(overlaps))]
+        item['source_paragraphs'] = list(positions)
+    return feedback_items
+
+
+def _similarity(first, second):
+    if not first or not second:
+        return 0.0
+    return len(first & second) / len(first | second)
+
+
+def _union(first, second):
+    merged = list(first or [])
+    for value in second or []:
+        if value not in merged:
+            merged.append(value)
+    return merged
+
+
+def _confidence(item):
+    """The item's confidence as a float, 0.0 when the model returned something non-numeric"""
+    try:
+        return float(item.get('confidence') or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def rank_key(item):
+    """Sort key placing higher-risk, more severe and more confident items first"""
+    return (
+        RISK_ORDER.get(item.get('risk_level'), len(RISK_ORDER)),
+        TYPE_ORDER.get(item.get('type'), len(TYPE_ORDER)),
+        -_confidence(item)
+    )
+
+
+def merge_feedback_items(item_lists, similarity=0.6):
+    """Merge feedback from several chunks, collapsing near-duplicates and ranking the rest
+
+    Items in the same category whose descriptions share at least similarity
+    of their words (Jaccard) are treated as one finding: the more confident
+    item is kept, and the references, questions and source paragraphs of
+    both are combined.
+    """
+    merged = []
+    for items in item_lists:
+        for item in items:
+            words = _item_words(item)
+            duplicate = None
+            for entry in merged:
+                if entry[0].get('category') == item.get('category') and _similarity(entry[1], words) >= similarity:
+                    duplicate = entry
+                    break
+
+            if duplicate is None:
+                merged.append([dict(item), words])
+                continue
+
+            kept = duplicate[0]
+            combined = {
+                'hawkeye_refs': _union(kept.get('hawkeye_refs'), item.get('hawkeye_refs')),
+                'questions': _union(kept.get('questions'), item.get('questions')),
+                'source_paragraphs': sorted(set(kept.get('source_paragraphs', [])) | set(item.get('source_paragraphs', []))),
+            }
+            if _confidence(item) > _confidence(kept):
+                duplicate[0] = kept = dict(item)
+                duplicate[1] = words
+            for key, value in combined.items():
+                if value:
+                    kept[key] = value
+
+    ranked = sorted((entry[0] for entry in merged), key=rank_key)
+
+    # Chunks are analyzed independently, so their item ids can collide
+    seen = set()
+    for index, item in enumerate(ranked):
+        if item.get('id') in seen or not item.get('id'):
+            item['id'] = f"{item.get('id') or 'item'}_{index}"
+        seen.add(item['id'])
+    return ranked
+
+
+def drop_duplicate_items(seen_items, feedback_items, similarity=0.6):
+    """Return the feedback_items that are not near-duplicates of seen_items or of each other"""
+    seen = [(item.get('category'), _item_words(item)) for item in seen_items]
+    fresh = []
+    for item in feedback_items:
+        words = _item_words(item)
+        if any(category == item.get('category') and _similarity(known, words) >= similarity for category, known in seen):
+            continue
+        seen.append((item.get('category'), words))
+        fresh.append(item)
+    return fresh
+
+
+def pack_sections(sections, token_budget, max_sections):
+    """Group sections (name -> content), in order, into packs of at most max_sections within token_budget"""
+    packs = []
+    current = []
+    used = 0
+    for name, content in sections.items():
+        tokens = estimate_tokens(content)
+        if current and (used + tokens > token_budget or len(current) >= max_sections):
+            packs.append(current)
+            current = []
+            used = 0
+        current.append(name)
+        used += tokens
+    if current:
+        packs.append(current)
+    return packs
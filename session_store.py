@@ -0,0 +1,394 @@
+"""
+Review session stores: bounded in-memory and shared SQLite backends
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from sqlite_utils import ThreadLocalConnection
+
+# Rough in-memory size of a python-docx object tree relative to the .docx on disk
+DOCX_MEMORY_FACTOR = 12
+
+
+def estimate_session_bytes(review_session):
+    """Approximate the memory held by a ReviewSession"""
+    total = len(getattr(review_session, 'document_content', '') or '')
+    total += sum(len(text) for text in getattr(review_session, 'sections', {}).values())
+
+    document_path = getattr(review_session, 'document_path', '')
+    if getattr(review_session, 'document_object', None) is not None and document_path:
+        try:
+            total += os.path.getsize(document_path) * DOCX_MEMORY_FACTOR
+        except OSError:
+            pass
+
+    for name in ('ai_feedback_cache', 'accepted_feedback', 'rejected_feedback', 'user_feedback'):
+        try:
+            total += len(json.dumps(getattr(review_session, name, {}), default=str))
+        except (TypeError, ValueError):
+            pass
+
+    total += sum(len(comment.get('comment', '')) for comment in getattr(review_session, 'document_comments', []))
+    total += sum(len(message.get('content', '')) for message in getattr(review_session, 'chat_history', []))
+    return total
+
+
+class SessionManager:
+    """Dict-like session store with idle TTL and LRU eviction by count and size"""
+
+    def __init__(self, ttl_seconds, max_sessions=200, max_bytes=1024 * 1024 * 1024,
+                 on_evict=None, sweep_interval=60):
+        self.ttl_seconds = ttl_seconds
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+        self.on_evict = on_evict
+        self.sweep_interval = sweep_interval
+        self.evictions = {'expired': 0, 'max_sessions': 0, 'max_bytes': 0}
+        self._sessions = OrderedDict()
+        self._last_access = {}
+        self._sizes = {}
+        self._lock = threading.RLock()
+        self._last_sweep = time.time()
+
+    def _is_expired(self, session_id, now):
+        return now - self._last_access.get(session_id, now) > self.ttl_seconds
+
+    def _evict(self, session_id, reason):
+        review_session = self._sessions.pop(session_id, None)
+        self._last_access.pop(session_id, None)
+        self._sizes.pop(session_id, None)
+        if review_session is None:
+            return
+
+        self.evictions[reason] += 1
+        if self.on_evict:
+            try:
+                self.on_evict(review_session, reason)
+            except Exception as e:
+                print(f"Error cleaning up session {session_id}: {str(e)}")
+
+    def _maybe_sweep(self, now):
+        if now - self._last_sweep >= self.sweep_interval:
+            self.cleanup_expired()
+
+    def __contains__(self, session_id):
+        with self._lock:
+            now = time.time()
+            self._maybe_sweep(now)
+            if session_id not in self._sessions:
+                return False
+            if self._is_expired(session_id, now):
+                self._evict(session_id, 'expired')
+                return False
+            return True
+
+    def __getitem__(self, session_id):
+        review_session = self.get(session_id)
+        if review_session is None:
+            raise KeyError(session_id)
+        return review_session
+
+    def get(self, session_id, default=None):
+        """Return a live session and mark it as recently used"""
+        with self._lock:
+            if session_id not in self:
+                return default
+            self._sessions.move_to_end(session_id)
+            self._last_access[session_id] = time.time()
+            return self._sessions[session_id]
+
+    def __setitem__(self, session_id, review_session):
+        with self._lock:
+            self._sessions[session_id] = review_session
+            self._sessions.move_to_end(session_id)
+            self._last_access[session_id] = time.time()
+            self._sizes[session_id] = estimate_session_bytes(review_session)
+            self.cleanup_expired()
+            self.enforce_limits(keep=session_id)
+
+    def __delitem__(self, session_id):
+        with self._lock:
+            if session_id not in self._sessions:
+                raise KeyError(session_id)
+            self._sessions.pop(session_id)
+            self._last_access.pop(session_id, None)
+            self._sizes.pop(session_id, None)
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def save(self, review_session):
+        """Persist changes made to a session (sessions live in memory, so only re-measure it)"""
+        with self._lock:
+            if review_session.session_id in self._sessions:
+                self._sizes[review_session.session_id] = estimate_session_bytes(review_session)
+
+    @contextmanager
+    def edit(self, session_id):
+        """Yield a session for modification; changes are saved on exit"""
+        with self._lock:
+            review_session = self[session_id]
+            yield review_session
+            self.save(review_session)
+
+    def cache_feedback(self, review_session, cache_key, result):
+        """Store an analysis result on a session"""
+        review_session.ai_feedback_cache[cache_key] = result
+
+    def values(self):
+        with self._lock:
+            return list(self._sessions.values())
+
+    def cleanup_expired(self):
+        """Evict every session idle for longer than the TTL"""
+        with self._lock:
+            now = time.time()
+            self._last_sweep = now
+            expired = [session_id for session_id in self._sessions if self._is_expired(session_id, now)]
+            for session_id in expired:
+                self._evict(session_id, 'expired')
+            return len(expired)
+
+    def enforce_limits(self, keep=None):
+        """Evict least recently used sessions until count and size fit the budget"""
+        with self._lock:
+            # Sessions grow as feedback and chat accumulate, so re-measure them
+            for session_id, review_session in self._sessions.items():
+                self._sizes[session_id] = estimate_session_bytes(review_session)
+
+            for session_id in list(self._sessions):
+                if session_id == keep:
+                    continue
+                if len(self._sessions) > self.max_sessions:
+                    self._evict(session_id, 'max_sessions')
+                elif sum(self._sizes.values()) > self.max_bytes:
+                    self._evict(session_id, 'max_bytes')
+                else:
+                    break
+
+    def stats(self):
+        with self._lock:
+            return {
+                'sessions': len(self._sessions),
+                'estimated_bytes': sum(self._sizes.values()),
+                'max_sessions': self.max_sessions,
+                'max_bytes': self.max_bytes,
+                'evictions': dict(self.evictions)
+            }
+
+
+class SQLiteSessionStore:
+    """Session store shared by every worker process on the host through SQLite"""
+
+    def __init__(self, db_path, session_factory, ttl_seconds, max_sessions=200,
+                 max_bytes=1024 * 1024 * 1024, on_evict=None, sweep_interval=60):
+        self.session_factory = session_factory
+        self.ttl_seconds = ttl_seconds
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+        self.on_evict = on_evict
+        self.sweep_interval = sweep_interval
+        self.evictions = {'expired': 0, 'max_sessions': 0, 'max_bytes': 0}
+        self._connections = ThreadLocalConnection(db_path)
+        self._last_sweep = time.time()
+
+        conn = self._connections.get()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS review_sessions (
+                session_id TEXT PRIMARY KEY,
+                state TEXT NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        # Analysis results are kept in their own rows so background analyses
+        # never overwrite feedback decisions saved by other requests.
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS session_feedback_cache (
+                session_id TEXT NOT NULL,
+                cache_key TEXT NOT NULL,
+                result TEXT NOT NULL,
+                PRIMARY KEY (session_id, cache_key)
+            )
+        """)
+
+    def _load(self, conn, session_id):
+        row = conn.execute("SELECT state FROM review_sessions WHERE session_id = ?", (session_id,)).fetchone()
+        if row is None:
+            return None
+
+        data = json.loads(row[0])
+        data['ai_feedback_cache'] = {
+            cache_key: json.loads(result) for cache_key, result in conn.execute(
+                "SELECT cache_key, result FROM session_feedback_cache WHERE session_id = ?", (session_id,)
+            )
+        }
+        return self.session_factory(data)
+
+    def _write(self, conn, review_session):
+        data = review_session.to_dict()
+        feedback_cache = data.pop('ai_feedback_cache', {})
+        conn.execute(
+            "INSERT OR REPLACE INTO review_sessions (session_id, state, last_access) VALUES (?, ?, ?)",
+            (review_session.session_id, json.dumps(data), time.time())
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO session_feedback_cache (session_id, cache_key, result) VALUES (?, ?, ?)",
+            [(review_session.session_id, key, json.dumps(result)) for key, result in feedback_cache.items()]
+        )
+
+    def _evict(self, conn, session_id, reason):
+        review_session = self._load(conn, session_id)
+        conn.execute("DELETE FROM review_sessions WHERE session_id = ?", (session_id,))
+        conn.execute("DELETE FROM session_feedback_cache WHERE session_id = ?", (session_id,))
+        if review_session is None:
+            return
+
+        self.evictions[reason] += 1
+        if self.on_evict:
+            try:
+                self.on_evict(review_session, reason)
+            except Exception as e:
+                print(f"Error cleaning up session {session_id}: {str(e)}")
+
+    def __contains__(self, session_id):
+        conn = self._connections.get()
+        if time.time() - self._last_sweep >= self.sweep_interval:
+            self.cleanup_expired()
+
+        row = conn.execute("SELECT last_access FROM review_sessions WHERE session_id = ?", (session_id,)).fetchone()
+        if row is None:
+            return False
+        if time.time() - row[0] > self.ttl_seconds:
+            self._evict(conn, session_id, 'expired')
+            return False
+        return True
+
+    def __getitem__(self, session_id):
+        review_session = self.get(session_id)
+        if review_session is None:
+            raise KeyError(session_id)
+        return review_session
+
+    def get(self, session_id, default=None):
+        """Load a live session and mark it as recently used"""
+        if session_id not in self:
+            return default
+
+        conn = self._connections.get()
+        conn.execute("UPDATE review_sessions SET last_access = ? WHERE session_id = ?", (time.time(), session_id))
+        review_session = self._load(conn, session_id)
+        return review_session if review_session is not None else default
+
+    def __setitem__(self, session_id, review_session):
+        self.save(review_session)
+        self.cleanup_expired()
+        self.enforce_limits(keep=session_id)
+
+    def __delitem__(self, session_id):
+        conn = self._connections.get()
+        conn.execute("DELETE FROM review_sessions WHERE session_id = ?", (session_id,))
+        conn.execute("DELETE FROM session_feedback_cache WHERE session_id = ?", (session_id,))
+
+    def __len__(self):
+        return self._connections.get().execute("SELECT COUNT(*) FROM review_sessions").fetchone()[0]
+
+    def values(self):
+        conn = self._connections.get()
+        session_ids = [row[0] for row in conn.execute("SELECT session_id FROM review_sessions")]
+        return [review_session for review_session in (self._load(conn, sid) for sid in session_ids) if review_session]
+
+    def save(self, review_session):
+        """Write the full session state"""
+        conn = self._connections.get()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._write(conn, review_session)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    @contextmanager
+    def edit(self, session_id):
+        """Load, modify and save a session inside one write transaction"""
+        conn = self._connections.get()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            review_session = self._load(conn, session_id)
+            if review_session is None:
+                raise KeyError(session_id)
+            yield review_session
+            self._write(conn, review_session)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def cache_feedback(self, review_session, cache_key, result):
+        """Store an analysis result without rewriting the rest of the session"""
+        review_session.ai_feedback_cache[cache_key] = result
+        self._connections.get().execute(
+            "INSERT OR REPLACE INTO session_feedback_cache (session_id, cache_key, result) VALUES (?, ?, ?)",
+            (review_session.session_id, cache_key, json.dumps(result))
+        )
+
+    def cleanup_expired(self):
+        """Evict every session idle for longer than the TTL"""
+        conn = self._connections.get()
+        self._last_sweep = time.time()
+        expired = [row[0] for row in conn.execute(
+            "SELECT session_id FROM review_sessions WHERE last_access < ?", (time.time() - self.ttl_seconds,)
+        ).fetchall()]
+        for session_id in expired:
+            self._evict(conn, session_id, 'expired')
+        return len(expired)
+
+    def _sizes(self, conn):
+        return conn.execute("""
+            SELECT s.session_id, LENGTH(s.state) + COALESCE(SUM(LENGTH(f.result)), 0)
+            FROM review_sessions s LEFT JOIN session_feedback_cache f ON f.session_id = s.session_id
+            GROUP BY s.session_id ORDER BY s.last_access ASC
+        """).fetchall()
+
+    def enforce_limits(self, keep=None):
+        """Evict least recently used sessions until count and size fit the budget"""
+        conn = self._connections.get()
+        sizes = self._sizes(conn)
+        count = len(sizes)
+        total = sum(size for _, size in sizes)
+
+        for session_id, size in sizes:
+            if session_id == keep:
+                continue
+            if count > self.max_sessions:
+                self._evict(conn, session_id, 'max_sessions')
+            elif total > self.max_bytes:
+                self._evict(conn, session_id, 'max_bytes')
+            else:
+                break
+            count -= 1
+            total -= size
+
+    def stats(self):
+        sizes = self._sizes(self._connections.get())
+        return {
+            'sessions': len(sizes),
+            'estimated_bytes': sum(size for _, size in sizes),
+            'max_sessions': self.max_sessions,
+            'max_bytes': self.max_bytes,
+            'evictions': dict(self.evictions)
+        }
+
+
+def create_session_store(backend, session_factory, db_path=None, **limits):
+    """Build the configured session store ('memory' or 'sqlite')"""
+    if backend == 'sqlite':
+        return SQLiteSessionStore(db_path, session_factory, **limits)
+    if backend != 'memory':
+        raise ValueError(f"Unknown session backend: {backend}")
+    return SessionManager(**limits)
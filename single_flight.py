@@ -0,0 +1,88 @@
+"""
+Coalescing of identical concurrent work into a single call
+"""
+
+import threading
+
+
+class Flight:
+    """One in-flight call that later callers can wait on"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Run at most one call per key at a time and share its result with every concurrent caller
+
+    The first caller for a key becomes the leader and does the work; callers
+    arriving while it runs wait and receive the same result (or exception).
+    A leader that gives up without a result finishes with None, and waiters
+    then do the work themselves.
+    """
+
+    def __init__(self):
+        self._flights = {}
+        self._lock = threading.Lock()
+        self.leaders = 0
+        self.coalesced = 0
+
+    def begin(self, key):
+        """Return (flight, is_leader) for key"""
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                flight.waiters += 1
+                self.coalesced += 1
+                return flight, False
+
+            flight = Flight()
+            self._flights[key] = flight
+            self.leaders += 1
+            return flight, True
+
+    def finish(self, key, flight, result=None, error=None):
+        """Publish the leader's outcome and release the waiters"""
+        flight.result = result
+        flight.error = error
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+        flight.done.set()
+
+    def wait(self, flight, timeout=None):
+        """Block until the leader finishes and return its result, re-raising its exception"""
+        if not flight.done.wait(timeout):
+            raise TimeoutError('Timed out waiting for an in-flight call')
+        if flight.error is not None:
+            raise flight.error
+        return flight.result
+
+    def do(self, key, fn):
+        """Return (result, shared), calling fn() only if no call for key is in flight"""
+        flight, leader = self.begin(key)
+        if not leader:
+            result = self.wait(flight)
+            if result is not None:
+                return result, True
+            return fn(), False
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self.finish(key, flight, error=e)
+            raise
+        self.finish(key, flight, result=result)
+        return result, False
+
+    def stats(self):
+        with self._lock:
+            in_flight = len(self._flights)
+        return {
+            'in_flight': in_flight,
+            'calls': self.leaders,
+            'coalesced': self.coalesced
+        }
@@ -0,0 +1,31 @@
+"""
+SQLite connection helpers shared by the on-disk stores
+"""
+
+import os
+import sqlite3
+import threading
+
+
+class ThreadLocalConnection:
+    """Hand out one SQLite connection per thread, reopened after a fork"""
+
+    def __init__(self, db_path, timeout=10):
+        self.db_path = db_path
+        self.timeout = timeout
+        self._local = threading.local()
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def get(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            # isolation_level=None lets callers issue BEGIN IMMEDIATE themselves
+            conn = sqlite3.connect(self.db_path, timeout=self.timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Test script for the persistent analysis cache
+"""
+
+import sys
+import os
+import tempfile
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from analysis_cache import AnalysisCache, make_cache_key
+
+def test_cache_key_is_stable():
+    """Test that keys depend only on their inputs"""
+    print("Testing cache key stability...")
+
+    key = make_cache_key("Root Cause", "The detection algorithm failed.", "model-a", "1")
+    assert key == make_cache_key("Root Cause", "The detection algorithm failed.", "model-a", "1")
+    assert key != make_cache_key("Root Cause", "The detection algorithm failed.", "model-b", "1")
+    assert make_cache_key("ab", "c") != make_cache_key("a", "bc")
+
+    print("[PASS] Cache key stability test completed\n")
+
+def test_round_trip_and_counters():
+    """Test that stored results are returned and counted"""
+    print("Testing cache round trip...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = AnalysisCache(os.path.join(tmp, 'cache.sqlite3'))
+        result = {"feedback_items": [{"id": "rc_1", "risk_level": "High"}]}
+
+        assert cache.get("missing") is None
+        cache.set("key", result)
+        assert cache.get("key") == result
+
+        # A second instance sees the same data, as another worker would
+        other = AnalysisCache(os.path.join(tmp, 'cache.sqlite3'))
+        assert other.get("key") == result
+
+        stats = cache.stats()
+        print(f"Stats: {stats}")
+        assert stats['hits'] == 1 and stats['misses'] == 1 and stats['entries'] == 1
+
+    print("[PASS] Cache round trip test completed\n")
+
+def test_eviction():
+    """Test TTL expiry and LRU eviction"""
+    print("Testing cache eviction...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = AnalysisCache(os.path.join(tmp, 'cache.sqlite3'), max_entries=2, evict_every=1000)
+        cache.set("a", {"n": 1})
+        time.sleep(0.01)
+        cache.set("b", {"n": 2})
+        time.sleep(0.01)
+        cache.get("a")
+        cache.set("c", {"n": 3})
+
+        assert cache.evict() == 1
+        assert cache.get("b") is None
+        assert cache.get("a") == {"n": 1}
+
+        cache.ttl_seconds = 0
+        time.sleep(0.01)
+        assert cache.get("a") is None
+        assert cache.evict() == 2
+
+    print("[PASS] Cache eviction test completed\n")
+
+if __name__ == "__main__":
+    print("Testing Analysis Cache\n")
+    print("=" * 50)
+
+    test_cache_key_is_stable()
+    test_round_trip_and_counters()
+    test_eviction()
+
+    print("=" * 50)
+    print("All tests completed!")
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test script for the batch review pipeline
+"""
+
+import sys
+import os
+import io
+import zipfile
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from werkzeug.datastructures import FileStorage
+from app import collect_batch_documents, select_auto_accepted, batch_summary_csv
+from config import Config
+
+def make_zip(members):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    buffer.seek(0)
+    return buffer
+
+def test_collect_batch_documents():
+    """Test extracting .docx files from zips and plain uploads"""
+    print("Testing batch document collection...")
+    
+    archive = make_zip({
+        'team_a/report.docx': b'a',
+        'team_b/report.docx': b'b',
+        '__MACOSX/team_a/._report.docx': b'junk',
+        'team_a/~$report.docx': b'lock file',
+        'notes.txt': b'not a document',
+    })
+    files = [
+        FileStorage(stream=archive, filename='batch.zip'),
+        FileStorage(stream=io.BytesIO(b'c'), filename='single.docx'),
+        FileStorage(stream=io.BytesIO(b'd'), filename='ignored.pdf'),
+    ]
+    
+    with tempfile.TemporaryDirectory() as batch_dir:
+        documents = collect_batch_documents(files, batch_dir)
+        names = [name for name, _ in documents]
+        print(f"Collected: {names}")
+        
+        assert names == ['report.docx', '2_report.docx', 'single.docx']
+        with open(documents[1][1], 'rb') as f:
+            assert f.read() == b'b'
+    
+    original_limit = Config.BATCH_MAX_DOCUMENTS
+    Config.BATCH_MAX_DOCUMENTS = 1
+    try:
+        with tempfile.TemporaryDirectory() as batch_dir:
+            collect_batch_documents([FileStorage(stream=make_zip({'a.docx': b'a', 'b.docx': b'b'}), filename='batch.zip')], batch_dir)
+        assert False, "Expected the document limit to be enforced"
+    except ValueError:
+        pass
+    finally:
+        Config.BATCH_MAX_DOCUMENTS = original_limit
+    
+    print("[PASS] Batch document collection test completed\n")
+
+def test_auto_accept_threshold():
+    """Test that only feedback at or above the thresholds is auto-accepted"""
+    print("Testing auto-accept thresholds...")
+    
+    items = [
+        {'id': 'a', 'risk_level': 'High', 'confidence': 0.95},
+        {'id': 'b', 'risk_level': 'High', 'confidence': 0.5},
+        {'id': 'c', 'risk_level': 'Medium', 'confidence': 0.9},
+        {'id': 'd', 'risk_level': 'Low', 'confidence': 0.99},
+        {'id': 'e', 'risk_level': 'Medium', 'confidence': 'n/a'},
+    ]
+    
+    assert [i['id'] for i in select_auto_accepted(items, 'High', 0.85)] == ['a']
+    assert [i['id'] for i in select_auto_accepted(items, 'Medium', 0.85)] == ['a', 'c']
+    assert [i['id'] for i in select_auto_accepted(items, 'Low', 0.0)] == ['a', 'b', 'c', 'd', 'e']
+    
+    csv_text = batch_summary_csv([{'document': 'x.docx', 'status': 'reviewed', 'auto_accepted': 1, 'output_path': '/tmp/x'}])
+    assert csv_text.splitlines()[1].startswith('x.docx,reviewed,')
+    assert '/tmp/x' not in csv_text
+    
+    print("[PASS] Auto-accept threshold test completed\n")
+
+if __name__ == "__main__":
+    print("Testing Batch Review\n")
+    print("=" * 50)
+    
+    test_collect_batch_documents()
+    test_auto_accept_threshold()
+    
+    print("=" * 50)
+    print("All tests completed!")
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared Bedrock runtime clients
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import bedrock_client
+from bedrock_client import get_bedrock_client, reset_bedrock_clients
+
+def test_one_client_per_process():
+    """Test that clients are shared within a process and rebuilt after a fork"""
+    print("Testing per-process Bedrock clients...")
+
+    reset_bedrock_clients()
+    client = get_bedrock_client(region_name='us-east-1')
+    assert get_bedrock_client(region_name='us-east-1') is client
+    assert get_bedrock_client(region_name='us-west-2') is not client
+
+    # A process that did not create the client (e.g. forked without the hook) builds its own
+    bedrock_client._owner_pid = -1
+    rebuilt = get_bedrock_client(region_name='us-east-1')
+    assert rebuilt is not client
+    assert bedrock_client._owner_pid == os.getpid()
+
+    if hasattr(os, 'fork'):
+        pid = os.fork()
+        if pid == 0:
+            # The at-fork hook has already dropped the parent's clients
+            ok = not bedrock_client._clients and get_bedrock_client(region_name='us-east-1') is not rebuilt
+            os._exit(0 if ok else 1)
+        assert os.waitpid(pid, 0)[1] == 0
+        assert get_bedrock_client(region_name='us-east-1') is rebuilt
+
+    print("[PASS] Per-process Bedrock clients test completed\n")
+
+if __name__ == "__main__":
+    print("Testing Bedrock Clients\n")
+    print("=" * 50)
+
+    test_one_client_per_process()
+
+    print("=" * 50)
+    print("All tests completed!")
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Test script for Bedrock retries, deadlines and circuit breaker
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from botocore.exceptions import ClientError
+
+from bedrock_resilience import (
+    CircuitBreaker, CircuitOpenError, DeadlineExceededError,
+    backoff_delay, call_with_retries, fallback_reason
+)
+
+def client_error(code):
+    return ClientError({'Error': {'Code': code, 'Message': code}}, 'InvokeModel')
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+def flaky(errors, result='ok'):
+    """Return a callable that raises each error in turn, then returns result"""
+    calls = []
+    def fn():
+        calls.append(1)
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return result
+    fn.calls = calls
+    return fn
+
+def test_retries_and_deadline():
+    """Test that throttling is retried with bounded backoff and non-retryable errors are not"""
+    print("Testing Bedrock retries...")
+
+    for attempt in range(10):
+        assert 0 <= backoff_delay(attempt, 0.5, 8) <= min(8, 0.5 * 2 ** attempt)
+
+    clock = FakeClock()
+    fn = flaky([client_error('ThrottlingException'), client_error('ServiceUnavailableException')])
+    assert call_with_retries(fn, max_attempts=3, sleep=clock.sleep, clock=clock) == 'ok'
+    assert len(fn.calls) == 3
+
+    fn = flaky([client_error('ValidationException')])
+    try:
+        call_with_retries(fn, max_attempts=3, sleep=clock.sleep, clock=clock)
+        assert False, "ValidationException should not be retried"
+    except ClientError as e:
+        assert fallback_reason(e) == 'error'
+    assert len(fn.calls) == 1
+
+    fn = flaky([client_error('ThrottlingException')] * 3)
+    try:
+        call_with_retries(fn, max_attempts=3, sleep=clock.sleep, clock=clock)
+        assert False, "Exhausted retries should raise"
+    except ClientError as e:
+        assert fallback_reason(e) == 'throttled'
+    assert len(fn.calls) == 3
+
+    # No retry is started once the deadline has passed (each attempt takes 0.4s, no backoff)
+    fn = flaky([client_error('ThrottlingException')] * 5)
+    def slow_fn():
+        clock.now += 0.4
+        return fn()
+    try:
+        call_with_retries(slow_fn, max_attempts=5, deadline_seconds=1.0, base_delay=0, max_delay=0,
+                          sleep=clock.sleep, clock=clock)
+        assert False, "Deadline should be exceeded"
+    except DeadlineExceededError as e:
+        assert fallback_reason(e) == 'deadline_exceeded'
+    assert len(fn.calls) == 3
+
+    # ... counting the time the retried attempt itself may take
+    fn = flaky([client_error('ThrottlingException')])
+    try:
+        call_with_retries(fn, deadline_seconds=90, attempt_timeout=90, sleep=clock.sleep, clock=clock)
+        assert False, "A retry that could run past the deadline should not start"
+    except DeadlineExceededError:
+        pass
+    assert len(fn.calls) == 1
+
+    print("[PASS] Bedrock retries test completed\n")
+
+def test_circuit_breaker():
+    """Test that the breaker opens after repeated failures and recovers through a trial call"""
+    print("Testing circuit breaker...")
+
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=30, clock=clock)
+    failing = flaky([client_error('InternalServerException')] * 10)
+
+    for _ in range(2):
+        try:
+            call_with_retries(failing, breaker=breaker, sleep=clock.sleep, clock=clock)
+        except ClientError:
+            pass
+    assert breaker.state == 'open'
+    assert breaker.times_opened == 1
+
+    calls_before = len(failing.calls)
+    try:
+        call_with_retries(failing, breaker=breaker, sleep=clock.sleep, clock=clock)
+        assert False, "Open breaker should fail fast"
+    except CircuitOpenError as e:
+        assert fallback_reason(e) == 'circuit_open'
+    assert len(failing.calls) == calls_before
+
+    # After the reset period one trial call is allowed; failure re-opens immediately
+    clock.now += 31
+    assert breaker.allow()
+    assert breaker.state == 'half_open'
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == 'open'
+    assert breaker.times_opened == 2
+
+    clock.now += 31
+    assert call_with_retries(lambda: 'ok', breaker=breaker, sleep=clock.sleep, clock=clock) == 'ok'
+    assert breaker.state == 'closed'
+    assert breaker.failures == 0
+
+    # Rejected requests show Bedrock is answering and never open the breaker
+    for _ in range(5):
+        try:
+            call_with_retries(flaky([client_error('ValidationException')]), breaker=breaker, sleep=clock.sleep, clock=clock)
+        except ClientError:
+            pass
+    assert breaker.state == 'closed'
+
+    # A trial call abandoned with a BaseException re-opens the breaker instead of leaving it half-open
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=30, clock=clock)
+    breaker.record_failure()
+    clock.now += 31
+    def interrupted():
+        raise KeyboardInterrupt()
+    try:
+        call_with_retries(interrupted, breaker=breaker, sleep=clock.sleep, clock=clock)
+    except KeyboardInterrupt:
+        pass
+    assert breaker.state == 'open'
+
+    print("[PASS] Circuit breaker test completed\n")
+
+if __name__ == "__main__":
+    print("Testing Bedrock Resilience\n")
+    print("=" * 50)
+
+    test_retries_and_deadline()
+    test_circuit_breaker()
+
+    print("=" * 50)
+    print("All tests completed!")
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Test script for the command-line batch reviewer
+"""
+
+import sys
+import os
+import json
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from ct_review import find_documents, load_manifest
+
+def test_find_documents():
+    """Test document discovery and output name flattening"""
+    print("Testing document discovery...")
+    
+    with tempfile.TemporaryDirectory() as directory:
+        os.makedirs(os.path.join(directory, 'team'))
+        for name in ['b.docx', 'a.docx', '~$a.docx', 'notes.txt', os.path.join('team', 'a.docx')]:
+            open(os.path.join(directory, name), 'wb').close()
+        
+        assert [name for name, _ in find_documents(directory)] == ['a.docx', 'b.docx']
+        
+        documents = find_documents(directory, recursive=True)
+        print(f"Found: {documents}")
+        assert [name for name, _ in documents] == ['a.docx', 'b.docx', 'team_a.docx']
+        assert documents[2][1] == os.path.join(directory, 'team', 'a.docx')
+    
+    print("[PASS] Document discovery test completed\n")
+
+def test_load_manifest():
+    """Test that only successful reviews are skipped on resume"""
+    print("Testing resume manifest...")
+    
+    with tempfile.TemporaryDirectory() as directory:
+        manifest_path = os.path.join(directory, 'manifest.jsonl')
+        assert load_manifest(manifest_path) == {}
+        
+        with open(manifest_path, 'w') as f:
+            f.write(json.dumps({'digest': 'aaa', 'status': 'reviewed'}) + '\n')
+            f.write(json.dumps({'digest': 'bbb', 'status': 'failed'}) + '\n')
+            f.write('{"digest": "ccc", "sta')
+        
+        assert list(load_manifest(manifest_path)) == ['aaa']
+    
+    print("[PASS] Resume manifest test completed\n")
+
+if __name__ == "__main__":
+    print("Testing CT Review CLI\n")
+    print("=" * 50)
+    
+    test_find_documents()
+    test_load_manifest()
+    
+    print("=" * 50)
+    print("All tests completed!")
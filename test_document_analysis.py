@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Test script for parallel analysis of every section of a document
+"""
+
+import sys
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import app
+from config import Config
+
+SECTIONS = {f"Section {i}": f"Content of section {i}." for i in range(6)}
+
+def run_with_stub(review_session, workers, progress_callback=None, cancel_event=None):
+    """Run analyze_document_sections with a stubbed analyzer on a pool of the given size"""
+    calls = []
+    lock = threading.Lock()
+
+    def fake_group(sections, doc_type="Full Write-up", session_id=None, lane=None):
+        name = next(iter(sections))
+        with lock:
+            calls.append(name)
+        # Later sections finish first, so completion order differs from document order
+        time.sleep(0.01 * (len(SECTIONS) - int(name.split()[-1])))
+        return {name: {'feedback_items': [{'id': name}], 'analysis_source': 'bedrock'}}
+
+    originals = (app.analyze_section_group, app.analysis_executor, Config.SECTION_PACKING_ENABLED)
+    app.analyze_section_group = fake_group
+    app.analysis_executor = ThreadPoolExecutor(max_workers=workers)
+    Config.SECTION_PACKING_ENABLED = False
+    try:
+        result = app.analyze_document_sections(review_session, progress_callback=progress_callback, cancel_event=cancel_event)
+    finally:
+        app.analysis_executor.shutdown(wait=True, cancel_futures=True)
+        app.analyze_section_group, app.analysis_executor, Config.SECTION_PACKING_ENABLED = originals
+    return result, calls
+
+def make_session():
+    review_session = app.ReviewSession()
+    review_session.sections = dict(SECTIONS)
+    return review_session
+
+def test_results_in_document_order_with_progress():
+    """Test that results come back in document order and progress is reported once per section"""
+    print("Testing document analysis order and progress...")
+
+    progress = []
+    result, calls = run_with_stub(make_session(), workers=6, progress_callback=lambda done, total, name: progress.append((done, total, name)))
+
+    assert list(result['sections']) == list(SECTIONS)
+    assert result['analyzed_count'] == 6 and result['total_feedback'] == 6 and not result['errors']
+    assert [done for done, _, _ in progress] == [1, 2, 3, 4, 5, 6]
+    assert all(total == 6 for _, total, _ in progress)
+    assert sorted(name for _, _, name in progress) == sorted(SECTIONS)
+    assert progress[0][2] != "Section 0"  # completion order, not document order
+
+    print("[PASS] Document analysis order and progress test completed\n")
+
+def test_cancel_stops_early():
+    """Test that setting cancel_event stops the analysis before the remaining sections run"""
+    print("Testing document analysis cancellation...")
+
+    cancel_event = threading.Event()
+    result, calls = run_with_stub(make_session(), workers=1, progress_callback=lambda *args: cancel_event.set(),
+                                  cancel_event=cancel_event)
+
+    assert len(result['sections']) == 1
+    assert len(calls) < len(SECTIONS)
+
+    print("[PASS] Document analysis cancellation test completed\n")
+
+if __name__ == "__main__":
+    print("Testing Document Analysis\n")
+    print("=" * 50)
+
+    test_results_in_document_order_with_progress()
+    test_cancel_stops_early()
+
+    print("=" * 50)
+    print("All tests completed!")
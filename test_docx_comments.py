@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Test script for zip-to-zip comment injection
+"""
+
+import sys
+import os
+import io
+import tempfile
+import zipfile
+from datetime import datetime
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from docx import Document
+from docx_comments import write_docx_with_comments
+
+def make_document(path):
+    doc = Document()
+    doc.add_paragraph("Root Cause:").runs[0].bold = True
+    doc.add_paragraph("The detection algorithm failed to identify prohibited keywords.")
+    doc.save(path)
+
+def make_comment(text):
+    return {'author': 'AI Feedback', 'text': text, 'date': datetime(2024, 1, 1)}
+
+def test_untouched_parts_are_copied():
+    """Test that only comment-related parts change"""
+    print("Testing comment injection...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source_path = os.path.join(tmp, 'source.docx')
+        make_document(source_path)
+
+        output = io.BytesIO()
+        write_docx_with_comments(source_path, output, [make_comment('Risk <High> & "urgent"\nSecond line')])
+
+        with zipfile.ZipFile(source_path) as source, zipfile.ZipFile(output) as result:
+            assert result.testzip() is None
+            for name in source.namelist():
+                if name not in ('word/_rels/document.xml.rels', '[Content_Types].xml'):
+                    assert source.read(name) == result.read(name), name
+
+            comments = result.read('word/comments.xml').decode('utf-8')
+            assert 'Risk &lt;High&gt; &amp; "urgent"' in comments
+            assert comments.count('<w:p>') == 2
+            assert b'comments.xml' in result.read('word/_rels/document.xml.rels')
+            assert b'/word/comments.xml' in result.read('[Content_Types].xml')
+
+        # The output is still a valid Word document
+        Document(output)
+
+    print("[PASS] Comment injection test completed\n")
+
+def test_existing_comments_are_kept():
+    """Test that a second pass appends to existing comments"""
+    print("Testing repeated comment injection...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source_path = os.path.join(tmp, 'source.docx')
+        first_path = os.path.join(tmp, 'first.docx')
+        make_document(source_path)
+
+        write_docx_with_comments(source_path, first_path, [make_comment('first')])
+        output = io.BytesIO()
+        write_docx_with_comments(first_path, output, [make_comment('second')])
+
+        with zipfile.ZipFile(output) as result:
+            comments = result.read('word/comments.xml').decode('utf-8')
+            assert 'w:id="0"' in comments and 'w:id="1"' in comments
+            assert result.read('word/_rels/document.xml.rels').count(b'comments.xml') == 1
+
+    print("[PASS] Repeated comment injection test completed\n")
+
+if __name__ == "__main__":
+    print("Testing Word Comment Injection\n")
+    print("=" * 50)
+
+    test_untouched_parts_are_copied()
+    test_existing_comments_are_kept()
+
+    print("=" * 50)
+    print("All tests completed!")
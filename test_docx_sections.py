@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test script checking the lxml section extractor against the python-docx one
+"""
+
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from docx import Document
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+from app import extract_document_sections_from_docx, STANDARD_SECTIONS, EXCLUDED_SECTIONS
+from docx_sections import extract_document_sections_from_xml
+
+def add_heading(doc, text):
+    doc.add_paragraph().add_run(text).bold = True
+
+def build_writeup(path):
+    doc = Document()
+    doc.add_paragraph("Preamble text before any heading.")
+    add_heading(doc, "Executive Summary")
+    doc.add_paragraph("Customer trust was impacted by counterfeit products.")
+    para = doc.add_paragraph()
+    para.add_run("Mixed ").bold = True
+    para.add_run("formatting\twith a tab")
+    para.add_run().add_break()
+    para.add_run("and a break")
+    add_heading(doc, "Background:")
+    doc.add_paragraph("   ")
+    doc.add_paragraph("The seller account was flagged.")
+    table = doc.add_table(rows=1, cols=2)
+    table.cell(0, 0).text = "Table text is not a body paragraph"
+    add_heading(doc, "ORIGINAL EMAIL")
+    doc.add_paragraph("Excluded email body.")
+    add_heading(doc, "ROOT CAUSE ANALYSIS")
+    doc.add_paragraph("The detection algorithm failed.")
+    # Explicitly un-bolded run and a heading candidate that is too long
+    doc.add_paragraph()._p.append(parse_xml(
+        f'<w:r {nsdecls("w")}><w:rPr><w:b w:val="0"/></w:rPr><w:t>Not bold:</w:t></w:r>'
+    ))
+    add_heading(doc, "A bold sentence that is far too long to be a heading because it keeps going and going on.")
+    add_heading(doc, "Timeline")
+    doc.add_paragraph("Day 1: detection. Day 2: escalation.")
+    doc.save(path)
+
+def build_plain(path):
+    doc = Document()
+    doc.add_paragraph("Just one paragraph")
+    doc.add_paragraph("")
+    doc.add_paragraph("  and another  ")
+    doc.save(path)
+
+def assert_same_sections(path):
+    sections, paragraphs, indices = extract_document_sections_from_docx(Document(path))
+    fast_sections, fast_paragraphs, fast_indices = extract_document_sections_from_xml(path, STANDARD_SECTIONS, EXCLUDED_SECTIONS)
+
+    assert list(fast_sections) == list(sections)
+    assert fast_sections == sections
+    assert fast_indices == indices
+    assert fast_paragraphs == {name: [p.text for p in paras] for name, paras in paragraphs.items()}
+    return sections
+
+def test_parity_with_python_docx():
+    """Test that both extractors produce identical sections"""
+    print("Testing section extraction parity...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        writeup = os.path.join(tmp, 'writeup.docx')
+        build_writeup(writeup)
+        sections = assert_same_sections(writeup)
+        print(f"Sections: {list(sections)}")
+        assert "ORIGINAL EMAIL" not in sections
+
+        plain = os.path.join(tmp, 'plain.docx')
+        build_plain(plain)
+        assert list(assert_same_sections(plain)) == ["Main Content"]
+
+    print("[PASS] Section extraction parity test completed\n")
+
+if __name__ == "__main__":
+    print("Testing Section Extraction\n")
+    print("=" * 50)
+
+    test_parity_with_python_docx()
+
+    print("=" * 50)
+    print("All tests completed!")
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Test script for the incremental feedback JSON parser
+"""
+
+import sys
+import os
+import json
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from feedback_stream import FeedbackItemStreamParser
+
+def feed_in_chunks(text, size):
+    """Feed text to a fresh parser size characters at a time and collect every item"""
+    parser = FeedbackItemStreamParser()
+    items = []
+    for start in range(0, len(text), size):
+        items.extend(parser.feed(text[start:start + size]))
+    return parser, items
+
+def test_items_split_across_chunks():
+    """Test that objects split at any chunk boundary, including inside the marker, are parsed once"""
+    print("Testing chunk boundaries...")
+
+    expected = [
+        {'id': 'a', 'category': 'Root Cause Analysis', 'confidence': 0.8},
+        {'id': 'b', 'category': 'Funds Management', 'hawkeye_refs': [8, 13]},
+    ]
+    text = 'Here is my analysis:\n{"feedback_items": ' + json.dumps(expected) + '}\nDone.'
+
+    for size in (1, 2, 3, 7, 16, len(text)):
+        parser, items = feed_in_chunks(text, size)
+        assert items == expected, f"chunk size {size}: {items}"
+        assert parser.finished
+
+    print("[PASS] Chunk boundaries test completed\n")
+
+def test_strings_and_nesting():
+    """Test that quotes, backslashes and braces inside strings and nested objects do not end an item early"""
+    print("Testing strings and nesting...")
+
+    expected = [
+        {'id': 'a', 'description': 'The seller said "funds {held}" and left } unmatched', 'suggestion': 'Use C:\\path\\'},
+        {'id': 'b', 'evidence': {'source': {'paragraph': 3, 'quote': '[see ] below]'}}, 'questions': ['Why {now}?']},
+    ]
+    text = '{"feedback_items": ' + json.dumps(expected) + '}'
+
+    for size in (1, 5, len(text)):
+        _, items = feed_in_chunks(text, size)
+        assert items == expected, f"chunk size {size}: {items}"
+
+    print("[PASS] Strings and nesting test completed\n")
+
+def test_truncated_and_invalid_output():
+    """Test that complete items are kept when an item is invalid or the stream stops mid-item"""
+    print("Testing truncated and invalid output...")
+
+    text = '{"feedback_items": [{"id": "a"}, {"id": "b", "risk_level": }, "stray", {"id": "c"}, {"id": "d", "descr'
+    parser, items = feed_in_chunks(text, 4)
+    assert items == [{'id': 'a'}, {'id': 'c'}]
+    assert not parser.finished
+
+    # Nothing is returned without the array, and text after the array is ignored
+    _, items = feed_in_chunks('I could not analyze this section.', 3)
+    assert items == []
+    _, items = feed_in_chunks('{"feedback_items": []} {"id": "later"}', 2)
+    assert items == []
+
+    print("[PASS] Truncated and invalid output test completed\n")
+
+if __name__ == "__main__":
+    print("Testing Feedback Stream Parser\n")
+    print("=" * 50)
+
+    test_items_split_across_chunks()
+    test_strings_and_nesting()
+    test_truncated_and_invalid_output()
+
+    print("=" * 50)
+    print("All tests completed!")
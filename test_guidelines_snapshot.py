@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test script for the guidelines snapshot loader
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from guidelines_snapshot import GuidelineSource, paragraph_offsets
+
+def counting_reader(calls):
+    def reader(path):
+        calls.append(path)
+        with open(path, encoding='utf-8') as f:
+            return f.read()
+    return reader
+
+def test_snapshot_reuse_and_invalidation():
+    """Test that a document is parsed once, reused across restarts and re-parsed only on change"""
+    print("Testing guidelines snapshot reuse...")
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(temp_dir, 'checklist.docx')
+        snapshot_dir = os.path.join(temp_dir, 'snapshots')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("1. Initial Assessment\nCustomer impact\n2. Root Cause")
+
+        calls = []
+        source = GuidelineSource(path, snapshot_dir, counting_reader(calls), recheck_seconds=0)
+        assert source.get() == "1. Initial Assessment\nCustomer impact\n2. Root Cause"
+        assert source.offsets == [0, 22, 38]
+        assert source.get() is source.get()
+        assert len(calls) == 1
+
+        # A new worker loads the snapshot instead of parsing
+        restarted = GuidelineSource(path, snapshot_dir, counting_reader(calls), recheck_seconds=0)
+        assert restarted.get() == source.text
+        assert len(calls) == 1
+
+        # Touching the file without changing it is confirmed by hash, not re-parsed
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        assert restarted.get() == source.text
+        assert len(calls) == 1
+
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("Updated checklist")
+        assert restarted.get() == "Updated checklist"
+        assert len(calls) == 2
+
+        print("[PASS] Guidelines snapshot reuse test completed\n")
+    finally:
+        shutil.rmtree(temp_dir)
+
+def test_missing_and_unreadable_documents():
+    """Test that missing or unreadable documents are cached as None until the next recheck"""
+    print("Testing missing guideline documents...")
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(temp_dir, 'missing.docx')
+        calls = []
+        source = GuidelineSource(path, temp_dir, counting_reader(calls), recheck_seconds=3600)
+        assert source.get() is None
+
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("Now present")
+        assert source.get() is None  # Negative result held until the recheck interval passes
+        source.invalidate()
+        assert source.get() == "Now present"
+
+        failures = []
+        def failing_reader(path):
+            failures.append(path)
+            raise ValueError("not a docx")
+
+        broken = GuidelineSource(path, os.path.join(temp_dir, 'other'), failing_reader, recheck_seconds=0)
+        assert broken.get() is None
+        assert broken.get() is None
+        assert len(failures) == 1  # The failure is remembered until the file changes
+
+        assert paragraph_offsets("") == [0]
+        print("[PASS] Missing guideline documents test completed\n")
+    finally:
+        shutil.rmtree(temp_dir)
+
+if __name__ == "__main__":
+    print("Testing Guidelines Snapshot\n")
+    print("=" * 50)
+
+    test_snapshot_reuse_and_invalidation()
+    test_missing_and_unreadable_documents()
+
+    print("=" * 50)
+    print("All tests completed!")
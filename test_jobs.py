@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test script for background analysis jobs
+"""
+
+import sys
+import os
+import threading
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from jobs import JobManager, JobQueueFull
+import app
+
+def blocking_job(release):
+    """Job body that runs until release is set, stopping early when cancelled"""
+    def run(job):
+        while not release.wait(0.01):
+            job.check_cancelled()
+        return 'done'
+    return run
+
+def test_admission_and_cancellation():
+    """Test that submissions beyond workers plus queue are rejected and cancellation stops jobs"""
+    print("Testing job admission and cancellation...")
+
+    manager = JobManager(max_workers=1, max_pending=1)
+    release = threading.Event()
+    running = manager.submit('test', blocking_job(release))
+    queued = manager.submit('test', blocking_job(release))
+    try:
+        manager.submit('test', blocking_job(release))
+        assert False, "A third job should not be admitted"
+    except JobQueueFull:
+        pass
+
+    # A queued job never starts; a running one stops at its next check
+    assert manager.cancel(queued.job_id).status == 'cancelled'
+    manager.cancel(running.job_id)
+    running.future.result(timeout=5)
+    assert running.status == 'cancelled'
+
+    finished = manager.submit('test', lambda job: 'ok')
+    finished.future.result(timeout=5)
+    assert finished.status == 'succeeded' and finished.to_dict()['result'] == 'ok'
+    manager.shutdown()
+
+    print("[PASS] Job admission and cancellation test completed\n")
+
+def test_pruning_and_fork_reset():
+    """Test that old finished jobs are forgotten and a forked child starts with an empty, working pool"""
+    print("Testing job pruning and fork reset...")
+
+    manager = JobManager(max_workers=1, max_pending=1, retention_seconds=60)
+    old = manager.submit('test', lambda job: 'ok')
+    old.future.result(timeout=5)
+    old.finished_at -= 120
+    manager.submit('test', lambda job: 'ok').future.result(timeout=5)
+    assert old.job_id not in manager.jobs
+    assert len(manager.jobs) == 1
+
+    manager.reset_after_fork()
+    assert manager.jobs == {}
+    job = manager.submit('test', lambda job: 'after fork')
+    job.future.result(timeout=5)
+    assert job.result == 'after fork'
+    manager.shutdown()
+
+    print("[PASS] Job pruning and fork reset test completed\n")
+
+def test_jobs_visible_only_to_owner():
+    """Test that another session cannot read or cancel a job"""
+    print("Testing job ownership...")
+
+    release = threading.Event()
+    job = app.job_manager.submit('test', blocking_job(release), owner='owner-session')
+    client = app.app.test_client()
+    try:
+        assert client.get(f'/jobs/{job.job_id}?session_id=other-session').status_code == 404
+        assert client.delete(f'/jobs/{job.job_id}?session_id=other-session').status_code == 404
+        assert client.get(f'/jobs/{job.job_id}').status_code == 404
+        assert not job.cancel_event.is_set()
+
+        assert client.get(f'/jobs/{job.job_id}?session_id=owner-session').status_code == 200
+        assert client.delete(f'/jobs/{job.job_id}?session_id=owner-session').status_code == 200
+        assert job.cancel_event.is_set()
+    finally:
+        release.set()
+
+    print("[PASS] Job ownership test completed\n")
+
+if __name__ == "__main__":
+    print("Testing Background Jobs\n")
+    print("=" * 50)
+
+    test_admission_and_cancellation()
+    test_pruning_and_fork_reset()
+    test_jobs_visible_only_to_owner()
+
+    print("=" * 50)
+    print("All tests completed!")
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Test script for the Prometheus metrics registry
+"""
+
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from metrics import MetricsRegistry
+import app
+
+def test_metrics_rendering():
+    """Test counters, gauges and histograms in Prometheus text format"""
+    print("Testing metrics rendering...")
+    
+    registry = MetricsRegistry()
+    calls = registry.counter('test_calls_total', 'Calls', ['outcome'])
+    in_flight = registry.gauge('test_in_flight', 'In flight')
+    latency = registry.histogram('test_seconds', 'Latency', ['stage'], buckets=(0.1, 1.0))
+    
+    calls.labels('ok').inc()
+    calls.labels('ok').inc(2)
+    calls.labels('fallback').inc()
+    with in_flight.track_inprogress():
+        in_flight_during = registry.render()
+    latency.labels('parse').observe(0.05)
+    latency.labels('parse').observe(0.5)
+    latency.labels('parse').observe(5)
+    registry.register_collector(lambda: [('test_sessions', 'gauge', 'Sessions', {(): 3, (('kind', 'a"b'),): 1})])
+    
+    output = registry.render()
+    print(output)
+    
+    assert 'test_in_flight 1' in in_flight_during
+    assert 'test_in_flight 0' in output
+    assert '# TYPE test_calls_total counter' in output
+    assert 'test_calls_total{outcome="ok"} 3' in output
+    assert 'test_calls_total{outcome="fallback"} 1' in output
+    assert 'test_seconds_bucket{stage="parse",le="0.1"} 1' in output
+    assert 'test_seconds_bucket{stage="parse",le="1"} 2' in output
+    assert 'test_seconds_bucket{stage="parse",le="+Inf"} 3' in output
+    assert 'test_seconds_sum{stage="parse"} 5.55' in output
+    assert 'test_seconds_count{stage="parse"} 3' in output
+    assert 'test_sessions 3' in output
+    assert 'test_sessions{kind="a\\"b"} 1' in output
+    
+    print("[PASS] Metrics rendering test completed\n")
+
+def test_streamed_request_latency():
+    """Test that a streamed response is timed until its body has been sent, not when the view returns"""
+    print("Testing streamed request latency...")
+    
+    review_session = app.ReviewSession()
+    app.document_sessions[review_session.session_id] = review_session
+    
+    def slow_events(*args):
+        time.sleep(0.2)
+        yield "event: done\ndata: {}\n\n"
+    
+    latency = app.REQUEST_SECONDS.labels('chat')
+    in_progress = app.REQUESTS_IN_PROGRESS.labels('chat')
+    sum_before, count_before = latency.sum, sum(latency.counts)
+    original = app.generate_chat_events
+    app.generate_chat_events = slow_events
+    try:
+        response = app.app.test_client().post('/chat', json={
+            'session_id': review_session.session_id, 'query': 'Why?', 'stream': True
+        }, buffered=False)
+        assert sum(latency.counts) == count_before
+        assert in_progress.value == 1
+        response.get_data()
+        response.close()
+    finally:
+        app.generate_chat_events = original
+        del app.document_sessions[review_session.session_id]
+    
+    assert sum(latency.counts) == count_before + 1
+    assert latency.sum - sum_before >= 0.2
+    assert in_progress.value == 0
+    
+    print("[PASS] Streamed request latency test completed\n")
+
+if __name__ == "__main__":
+    print("Testing Metrics\n")
+    print("=" * 50)
+    
+    test_metrics_rendering()
+    test_streamed_request_latency()
+    
+    print("=" * 50)
+    print("All tests completed!")
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Test script for Hawkeye checklist retrieval
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import app
+from retrieval import split_checklist_passages, BM25Index, ChecklistRetriever, DocumentRetriever, estimate_tokens
+
+CHECKLIST = """Hawkeye Investigation Checklist
+Use these mental models on every CT EE write-up.
+1. Initial Assessment
+Evaluate the customer experience impact and customer trust.
+2. Investigation Process
+Challenge SOPs and document the methodology used.
+3. Seller Classification
+Classify the seller as a good actor, bad actor or confused actor.
+7. Account Hijacking Prevention
+Review login history, device changes and compromised credentials.
+8. Funds Management
+Document funds held, released or withdrawn during enforcement.
+11. Root Cause Analysis
+Use the 5 Whys to find the process gap or system failure.
+"""
+
+def test_checklist_passages():
+    """Test that the checklist splits into one passage per checkpoint"""
+    print("Testing checklist passage splitting...")
+    
+    passages = split_checklist_passages(CHECKLIST)
+    print(f"Passages: {[p.splitlines()[0] for p in passages]}")
+    
+    assert len(passages) == 7
+    assert passages[0].startswith("Hawkeye Investigation Checklist")
+    assert passages[4] == "7. Account Hijacking Prevention\nReview login history, device changes and compromised credentials."
+    
+    long_checkpoint = "1. Initial Assessment\n" + "\n".join(f"Line {i} about customer impact" for i in range(100)) + "\n2. Next\nBody"
+    pieces = split_checklist_passages(long_checkpoint, max_chars=300)
+    assert len(pieces) > 3
+    assert all(piece.startswith("1. Initial Assessment") for piece in pieces[:-1])
+    assert all(len(piece) <= 300 for piece in pieces)
+    
+    print("[PASS] Checklist passage splitting test completed\n")
+
+def test_bm25_retrieval():
+    """Test ranking and the token budget"""
+    print("Testing BM25 retrieval...")
+    
+    index = BM25Index(split_checklist_passages(CHECKLIST))
+    results = index.search("The account was hijacked after a credential compromise", top_k=3)
+    assert results[0][0] == 4
+    assert index.search("zzz unknown words", top_k=3) == []
+    
+    retriever = ChecklistRetriever(CHECKLIST, top_k=3, token_budget=40)
+    selected = retriever.select("seller funds were withdrawn; root cause was a process gap")
+    print(f"Selected: {[p.splitlines()[0] for p in selected]}")
+    assert sum(estimate_tokens(p) for p in selected) <= 40
+    assert selected and all(p in retriever.index.passages for p in selected)
+    
+    stats = retriever.stats()
+    assert stats['calls'] == 1
+    assert stats['tokens_saved'] == stats['full_checklist_tokens'] - stats['tokens_included']
+    
+    print("[PASS] BM25 retrieval test completed\n")
+
+def test_document_retrieval():
+    """Test that chat context comes from any section, in document order, within the budget"""
+    print("Testing document retrieval...")
+    
+    retriever = DocumentRetriever({
+        "Executive Summary": "Seller accounts were suspended in error.\n\nImpact reached 120 sellers.",
+        "Background": "The detection rule was updated in March.",
+        "Root Cause": "The restricted keyword list was not synced after the policy change.\nNo owner reviewed the sync job.",
+    })
+    assert len(retriever.paragraphs) == 5
+    
+    selected = retriever.select("why was the keyword list not synced", top_k=2, token_budget=100)
+    print(f"Selected: {selected}")
+    assert selected[0] == ("Root Cause", 0, "The restricted keyword list was not synced after the policy change.")
+    assert all(section == "Root Cause" for section, _, _ in selected)
+    
+    # Naming a section retrieves its paragraphs; a small budget drops what does not fit
+    assert retriever.select("background", top_k=3)[0][0] == "Background"
+    assert retriever.select("keyword synced policy sync", top_k=2, token_budget=5) == []
+    
+    print("[PASS] Document retrieval test completed\n")
+
+def test_prompt_without_relevant_passages():
+    """Test that the checklist heading is only added when passages were selected"""
+    print("Testing system prompt without relevant passages...")
+    
+    retriever = ChecklistRetriever(CHECKLIST, top_k=2, token_budget=200)
+    originals = (app.load_guidelines, app.get_checklist_retriever, app.hawkeye_checklist)
+    app.load_guidelines = lambda: None
+    app.get_checklist_retriever = lambda: retriever
+    app.hawkeye_checklist = CHECKLIST
+    try:
+        relevant = app.build_enhanced_system_prompt("Review this.", "funds held withdrawn")
+        unrelated = app.build_enhanced_system_prompt("Review this.", "zzz qqq")
+    finally:
+        app.load_guidelines, app.get_checklist_retriever, app.hawkeye_checklist = originals
+    
+    assert "HAWKEYE INVESTIGATION CHECKLIST:" in relevant and "Funds Management" in relevant
+    assert unrelated == "Review this."
+    
+    print("[PASS] Prompt without relevant passages test completed\n")
+
+if __name__ == "__main__":
+    print("Testing Checklist Retrieval\n")
+    print("=" * 50)
+    
+    test_checklist_passages()
+    test_bm25_retrieval()
+    test_document_retrieval()
+    test_prompt_without_relevant_passages()
+    
+    print("=" * 50)
+    print("All tests completed!")
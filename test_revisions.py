@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Test script for incremental re-review of revised write-ups
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from revisions import diff_sections, is_revision, document_base_name
+import app
+
+PREVIOUS_SECTIONS = {
+    "Executive Summary": "Seller accounts were suspended in error.",
+    "Background": "The detection rule was updated in March.",
+    "Root Cause": "The keyword list was not synced.\nNo owner reviewed the sync job.",
+    "Appendix": "Ticket links.",
+}
+
+def revised_sections():
+    return {
+        "Executive Summary": "Seller accounts were suspended in error.",
+        "Background": "The detection rule was  updated in March. ",  # whitespace-only edit
+        "Root Cause": "The keyword list was not synced after the policy change.\nNo owner reviewed the sync job.",
+        "Preventative Actions": "Add an owner to the sync job.",
+    }
+
+def test_diff_and_recognition():
+    """Test that sections are diffed by content and revisions are recognized by name or content"""
+    print("Testing revision diff...")
+
+    diff = diff_sections(PREVIOUS_SECTIONS, revised_sections())
+    assert diff == {
+        'unchanged': ["Executive Summary", "Background"],
+        'changed': ["Root Cause"],
+        'added': ["Preventative Actions"],
+        'removed': ["Appendix"],
+    }
+
+    assert document_base_name("Writeup_v3-final.docx") == document_base_name("writeup.docx")
+    assert is_revision("Writeup.docx", PREVIOUS_SECTIONS, "Writeup_v2.docx", {"Root Cause": "Rewritten."})
+    assert is_revision("Writeup.docx", PREVIOUS_SECTIONS, "Other.docx", revised_sections())
+    assert not is_revision("Writeup.docx", PREVIOUS_SECTIONS, "Other.docx", {name: "New text." for name in PREVIOUS_SECTIONS})
+    assert is_revision("Writeup.docx", PREVIOUS_SECTIONS, "Writeup_v2.docx", revised_sections(), require_both=True)
+    assert not is_revision("Writeup.docx", PREVIOUS_SECTIONS, "Writeup_v2.docx", {"Root Cause": "Rewritten."}, require_both=True)
+    assert not is_revision("Writeup.docx", PREVIOUS_SECTIONS, "Other.docx", revised_sections(), require_both=True)
+
+    print("[PASS] Revision diff test completed\n")
+
+def test_carry_over_unchanged_sections():
+    """Test that unchanged sections keep their analysis, decisions and comments, and changed ones do not"""
+    print("Testing review carry-over...")
+
+    previous = app.ReviewSession()
+    previous.document_name = "Writeup.docx"
+    previous.sections = dict(PREVIOUS_SECTIONS)
+    previous.paragraph_indices = {"Executive Summary": [3], "Background": [5], "Root Cause": [7, 8], "Appendix": [10]}
+    for name, content in previous.sections.items():
+        previous.ai_feedback_cache[app.get_section_cache_key(name, content)] = {
+            'feedback_items': [{'id': f"{name}-1", 'category': 'Root Cause Analysis'}]
+        }
+    previous.accepted_feedback["Executive Summary"].append({'id': "Executive Summary-1"})
+    previous.rejected_feedback["Background"].append({'id': "Background-1"})
+    previous.accepted_feedback["Root Cause"].append({'id': "Root Cause-1"})
+    previous.document_comments = [
+        {'section': "Executive Summary", 'paragraph_index': 3, 'comment': "Quantify impact"},
+        {'section': "Root Cause", 'paragraph_index': 8, 'comment': "Name the owner"},
+    ]
+
+    revision = app.ReviewSession()
+    revision.document_name = "Writeup_v2.docx"
+    revision.sections = revised_sections()
+    revision.paragraph_indices = {"Executive Summary": [2], "Background": [4], "Root Cause": [6, 7], "Preventative Actions": [9]}
+
+    result = app.carry_over_review(previous, revision)
+    assert result['round'] == 2 and revision.revision_of == previous.session_id
+    assert result['decisions'] == {
+        "Executive Summary": {"Executive Summary-1": 'accepted'},
+        "Background": {"Background-1": 'rejected'},
+    }
+
+    cached_sections = sorted(key.rsplit('_', 1)[0] for key in revision.ai_feedback_cache)
+    assert cached_sections == ["Background", "Executive Summary"]
+    assert app.get_section_cache_key("Background", revision.sections["Background"]) in revision.ai_feedback_cache
+    assert "Root Cause" not in revision.accepted_feedback
+    assert revision.document_comments == [{'section': "Executive Summary", 'paragraph_index': 2, 'comment': "Quantify impact"}]
+
+    # Carried state is a copy, not shared with the previous session
+    revision.accepted_feedback["Executive Summary"].append({'id': 'new'})
+    assert len(previous.accepted_feedback["Executive Summary"]) == 1
+
+    print("[PASS] Review carry-over test completed\n")
+
+def test_find_previous_version():
+    """Test that the browser's current review needs a matching name and content, and an explicit link either"""
+    print("Testing previous version lookup...")
+
+    previous = app.ReviewSession()
+    previous.document_name = "Writeup.docx"
+    previous.sections = dict(PREVIOUS_SECTIONS)
+    app.document_sessions[previous.session_id] = previous
+
+    def upload(name, sections):
+        review_session = app.ReviewSession()
+        review_session.document_name = name
+        review_session.sections = sections
+        return review_session
+
+    rewritten = {"Root Cause": "Rewritten."}
+    try:
+        with app.app.test_request_context():
+            app.session['session_id'] = previous.session_id
+            assert app.find_previous_version(upload("Writeup_v2.docx", revised_sections())) is previous
+            assert app.find_previous_version(upload("Writeup_v2.docx", rewritten)) is None
+            assert app.find_previous_version(upload("Other.docx", revised_sections())) is None
+            assert app.find_previous_version(upload("Writeup_v2.docx", rewritten), previous.session_id) is previous
+            assert app.find_previous_version(upload("Other.docx", revised_sections()), previous.session_id) is previous
+            assert app.find_previous_version(upload("Other.docx", rewritten), previous.session_id) is None
+    finally:
+        del app.document_sessions[previous.session_id]
+
+    print("[PASS] Previous version lookup test completed\n")
+
+if __name__ == "__main__":
+    print("Testing Revisions\n")
+    print("=" * 50)
+
+    test_diff_and_recognition()
+    test_find_previous_version()
+    test_carry_over_unchanged_sections()
+
+    print("=" * 50)
+    print("All tests completed!")
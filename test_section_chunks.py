@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Test script for long-section chunking and feedback merging
+"""
+
+import sys
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import app
+from section_chunks import (
+    split_section_chunks, attach_source_paragraphs, merge_feedback_items, drop_duplicate_items, pack_sections
+)
+
+def test_split_on_paragraph_boundaries():
+    """Test that chunks respect the token budget, keep paragraphs whole and cover every paragraph"""
+    print("Testing section chunking...")
+
+    paragraphs = [f"Paragraph {i} " + "word " * 40 for i in range(30)]
+    chunks = split_section_chunks(paragraphs, token_budget=200)
+    print(f"Chunks: {[chunk['paragraphs'] for chunk in chunks]}")
+
+    assert len(chunks) > 1
+    assert [p for chunk in chunks for p in chunk['paragraphs']] == list(range(30))
+    for chunk in chunks:
+        assert chunk['text'] == '\n'.join(paragraphs[p] for p in chunk['paragraphs'])
+
+    assert len(split_section_chunks(["short", "section"], token_budget=200)) == 1
+    oversized = split_section_chunks(["x" * 5000, "tail"], token_budget=200)
+    assert [chunk['paragraphs'] for chunk in oversized] == [[0], [1]]
+
+    print("[PASS] Section chunking test completed\n")
+
+def test_merge_and_map_to_paragraphs():
+    """Test that duplicate findings merge with their source paragraphs and ranking puts high risk first"""
+    print("Testing feedback merge...")
+
+    paragraphs = [
+        "The seller was notified on March 3.",
+        "Root cause: the detection rule missed restricted keywords after the policy update.",
+        "Funds were held pending review.",
+        "Policy sync lagged so the detection rule missed restricted keywords again.",
+    ]
+    first = attach_source_paragraphs([{
+        'id': 'a', 'type': 'important', 'category': 'Root Cause Analysis', 'risk_level': 'Medium',
+        'description': 'Explain why the detection rule missed restricted keywords', 'confidence': 0.7,
+        'hawkeye_refs': [11], 'questions': ['Why was the rule stale?']
+    }], paragraphs, [0, 1])
+    second = attach_source_paragraphs([{
+        'id': 'a', 'type': 'important', 'category': 'Root Cause Analysis', 'risk_level': 'Medium',
+        'description': 'Explain why the detection rule missed restricted keywords again', 'confidence': 0.9,
+        'hawkeye_refs': [12], 'questions': ['Who owns policy sync?']
+    }, {
+        'id': 'b', 'type': 'critical', 'category': 'Funds Management', 'risk_level': 'High',
+        'description': 'Document why funds were held', 'confidence': 0.8
+    }], paragraphs, [2, 3])
+
+    assert first[0]['source_paragraph'] == 1
+    assert second[1]['source_paragraph'] == 2
+
+    merged = merge_feedback_items([first, second])
+    print(f"Merged: {[(item['id'], item['category'], item['source_paragraphs']) for item in merged]}")
+
+    assert [item['category'] for item in merged] == ['Funds Management', 'Root Cause Analysis']
+    root_cause = merged[1]
+    assert root_cause['confidence'] == 0.9
+    assert root_cause['source_paragraphs'] == [0, 1, 2, 3]
+    assert root_cause['hawkeye_refs'] == [11, 12]
+    assert root_cause['questions'] == ['Why was the rule stale?', 'Who owns policy sync?']
+    assert len({item['id'] for item in merged}) == 2
+
+    assert drop_duplicate_items(first, second) == [second[1]]
+
+    print("[PASS] Feedback merge test completed\n")
+
+def test_merge_with_non_numeric_confidence():
+    """Test that a confidence the model returned as text ranks as zero instead of failing the merge"""
+    print("Testing feedback merge with non-numeric confidence...")
+
+    worded = {
+        'id': 'a', 'type': 'important', 'category': 'Root Cause Analysis', 'risk_level': 'Medium',
+        'description': 'Explain why the detection rule missed restricted keywords', 'confidence': 'high'
+    }
+    scored = dict(worded, description='Explain why the detection rule missed restricted keywords again', confidence=0.4)
+    other = dict(worded, id='b', category='Funds Management', description='Document why funds were held', confidence=None)
+
+    merged = merge_feedback_items([[worded, other], [scored]])
+    assert [item['category'] for item in merged] == ['Root Cause Analysis', 'Funds Management']
+    assert merged[0]['confidence'] == 0.4
+
+    print("[PASS] Non-numeric confidence merge test completed\n")
+
+def test_pack_short_sections():
+    """Test that short sections are packed in order within the token and section limits"""
+    print("Testing section packing...")
+
+    sections = {f"Section {i}": "x" * 400 for i in range(7)}  # 100 tokens each
+    assert pack_sections(sections, token_budget=300, max_sections=4) == [
+        ["Section 0", "Section 1", "Section 2"], ["Section 3", "Section 4", "Section 5"], ["Section 6"]
+    ]
+    assert [len(pack) for pack in pack_sections(sections, token_budget=10000, max_sections=4)] == [4, 3]
+    assert pack_sections({}, token_budget=300, max_sections=4) == []
+
+    print("[PASS] Section packing test completed\n")
+
+def test_chunks_share_the_callers_limit():
+    """Test that chunk calls of long sections count against the caller's Bedrock limit"""
+    print("Testing chunk concurrency limit...")
+
+    state = {'active': 0, 'peak': 0, 'calls': 0}
+    lock = threading.Lock()
+
+    def fake_invoke(*args, **kwargs):
+        with lock:
+            state['active'] += 1
+            state['calls'] += 1
+            state['peak'] = max(state['peak'], state['active'])
+        time.sleep(0.05)
+        with lock:
+            state['active'] -= 1
+        return '{"feedback_items": []}', {'analysis_source': 'bedrock'}
+
+    marker = uuid.uuid4().hex
+    sections = {f"Section {i}": '\n'.join(f"{marker} paragraph {p} " + "word " * 200 for p in range(12)) for i in range(3)}
+    lane = app.AnalysisLane(max_calls=2, chunk_workers=6, name='test')
+    executor = ThreadPoolExecutor(max_workers=2)
+
+    original = app.invoke_bedrock
+    app.invoke_bedrock = fake_invoke
+    try:
+        futures = app.submit_section_analyses(executor, sections, lane=lane)
+        results = {}
+        for future in futures:
+            results.update(future.result())
+    finally:
+        app.invoke_bedrock = original
+        executor.shutdown()
+        lane.shutdown()
+
+    print(f"Calls: {state['calls']}, peak concurrency: {state['peak']}")
+    assert sorted(results) == sorted(sections)
+    assert all(result['chunks'] > 1 for result in results.values())
+    assert state['peak'] <= 2
+
+    print("[PASS] Chunk concurrency limit test completed\n")
+
+def test_packed_sections_split_per_section():
+    """Test that a packed request's keyed response is split back into per-section results"""
+    print("Testing packed section analysis...")
+
+    sections = {
+        'Executive Summary': 'Seller flagged for counterfeit listings.',
+        'Background': 'The seller account was reported by customers.\nFunds were held.',
+        'Timeline': 'March 3: detected. March 5: escalated.',
+    }
+    prompts = []
+
+    def local_only(system_prompt, user_prompt, operation_name, **kwargs):
+        prompts.append(user_prompt)
+        return app.generate_section_specific_response(user_prompt, operation_name), {'analysis_source': 'local_heuristic'}
+
+    original = app.invoke_bedrock
+    app.invoke_bedrock = local_only
+    try:
+        results = app.analyze_packed_sections(sections)
+    finally:
+        app.invoke_bedrock = original
+
+    assert len(prompts) == 1
+    assert list(results) == list(sections)
+    for name, result in results.items():
+        assert result['packed'] == 3
+        assert result['analysis_source'] == 'local_heuristic'
+        for item in result['feedback_items']:
+            assert name in item['description']
+            assert 0 <= item['source_paragraph'] < len(sections[name].split('\n'))
+    assert results['Executive Summary']['feedback_items'][0]['category'] == 'Initial Assessment'
+
+    print("[PASS] Packed section analysis test completed\n")
+
+def test_packed_reply_that_is_not_an_object():
+    """Test that a packed reply parsing to a JSON list leaves every section to the per-section fallback"""
+    print("Testing packed analysis with a non-object reply...")
+
+    original = app.invoke_bedrock
+    app.invoke_bedrock = lambda *args, **kwargs: ('[{"feedback_items": []}]', {'analysis_source': 'bedrock'})
+    try:
+        results = app.analyze_packed_sections({'Executive Summary': 'Short.', 'Timeline': 'March 3.'})
+    finally:
+        app.invoke_bedrock = original
+
+    assert results == {}
+
+    print("[PASS] Packed non-object reply test completed\n")
+
+if __name__ == "__main__":
+    print("Testing Section Chunks\n")
+    print("=" * 50)
+
+    test_split_on_paragraph_boundaries()
+    test_merge_and_map_to_paragraphs()
+    test_merge_with_non_numeric_confidence()
+    test_pack_short_sections()
+    test_chunks_share_the_callers_limit()
+    test_packed_sections_split_per_section()
+    test_packed_reply_that_is_not_an_object()
+
+    print("=" * 50)
+    print("All tests completed!")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Test script for the bounded review session store
+"""
+
+import sys
+import os
+import tempfile
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from session_store import SessionManager, SQLiteSessionStore
+
+class FakeSession:
+    def __init__(self, session_id, content=""):
+        self.session_id = session_id
+        self.sections = {"Main Content": content}
+        self.accepted_feedback = {}
+        self.ai_feedback_cache = {}
+
+    def to_dict(self):
+        return dict(self.__dict__)
+
+    @classmethod
+    def from_dict(cls, data):
+        review_session = cls(data['session_id'])
+        review_session.__dict__.update(data)
+        return review_session
+
+def test_idle_ttl():
+    """Test that idle sessions expire"""
+    print("Testing idle session expiry...")
+
+    evicted = []
+    store = SessionManager(ttl_seconds=0.05, on_evict=lambda s, reason: evicted.append((s.session_id, reason)))
+    store["a"] = FakeSession("a")
+    assert "a" in store
+
+    time.sleep(0.1)
+    assert "a" not in store
+    assert evicted == [("a", "expired")]
+    assert store.stats()['evictions']['expired'] == 1
+
+    print("[PASS] Idle session expiry test completed\n")
+
+def test_lru_eviction():
+    """Test that the least recently used sessions are evicted first"""
+    print("Testing LRU eviction...")
+
+    store = SessionManager(ttl_seconds=3600, max_sessions=2)
+    store["a"] = FakeSession("a")
+    store["b"] = FakeSession("b")
+    store.get("a")
+    store["c"] = FakeSession("c")
+
+    assert "a" in store and "c" in store
+    assert "b" not in store
+    assert store.stats()['evictions']['max_sessions'] == 1
+
+    store = SessionManager(ttl_seconds=3600, max_bytes=150)
+    store["a"] = FakeSession("a", "x" * 100)
+    store["b"] = FakeSession("b", "x" * 100)
+    assert "a" not in store and "b" in store
+    assert store.stats()['evictions']['max_bytes'] == 1
+
+    print("[PASS] LRU eviction test completed\n")
+
+def test_sqlite_store_shared_between_instances():
+    """Test that a second store instance (another worker) sees saved changes"""
+    print("Testing SQLite session store...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'sessions.sqlite3')
+        worker_a = SQLiteSessionStore(db_path, FakeSession.from_dict, ttl_seconds=3600)
+        worker_b = SQLiteSessionStore(db_path, FakeSession.from_dict, ttl_seconds=3600)
+
+        worker_a["a"] = FakeSession("a", "Root cause text")
+        assert "a" in worker_b
+        stale = worker_a["a"]
+
+        with worker_b.edit("a") as review_session:
+            review_session.accepted_feedback["Root Cause"] = [{"id": "rc_1"}]
+
+        # A stale copy caching an analysis must not undo the accepted feedback
+        worker_a.cache_feedback(stale, "Root Cause_abc", {"feedback_items": []})
+
+        loaded = worker_b["a"]
+        assert loaded.accepted_feedback == {"Root Cause": [{"id": "rc_1"}]}
+        assert loaded.ai_feedback_cache == {"Root Cause_abc": {"feedback_items": []}}
+
+        del worker_b["a"]
+        assert "a" not in worker_a
+
+    print("[PASS] SQLite session store test completed\n")
+
+if __name__ == "__main__":
+    print("Testing Session Store\n")
+    print("=" * 50)
+
+    test_idle_ttl()
+    test_lru_eviction()
+    test_sqlite_store_shared_between_instances()
+
+    print("=" * 50)
+    print("All tests completed!")
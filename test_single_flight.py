@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Test script for single-flight coalescing of identical analyses
+"""
+
+import sys
+import os
+import threading
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from single_flight import SingleFlight
+
+def run_concurrently(flights, key, fn, count):
+    """Call flights.do(key, fn) from count threads and collect (result, shared) or exceptions"""
+    outcomes = []
+    lock = threading.Lock()
+
+    def worker():
+        try:
+            outcome = flights.do(key, fn)
+        except Exception as e:
+            outcome = e
+        with lock:
+            outcomes.append(outcome)
+
+    threads = [threading.Thread(target=worker) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+def test_concurrent_calls_share_one_result():
+    """Test that concurrent identical calls run once and all receive the result"""
+    print("Testing single-flight coalescing...")
+
+    flights = SingleFlight()
+    calls = []
+
+    def slow_analysis():
+        calls.append(1)
+        time.sleep(0.2)
+        return {'feedback_items': [{'id': 'a'}]}
+
+    outcomes = run_concurrently(flights, 'digest-1', slow_analysis, 8)
+    assert len(calls) == 1
+    assert all(result == {'feedback_items': [{'id': 'a'}]} for result, _ in outcomes)
+    assert sum(1 for _, shared in outcomes if shared) == 7
+
+    stats = flights.stats()
+    assert stats == {'in_flight': 0, 'calls': 1, 'coalesced': 7}
+
+    # Once finished, the next call for the same key runs again
+    flights.do('digest-1', slow_analysis)
+    assert len(calls) == 2
+
+    print("[PASS] Single-flight coalescing test completed\n")
+
+def test_errors_and_abandoned_leaders():
+    """Test that a leader's exception reaches its waiters and an abandoned flight lets waiters run"""
+    print("Testing single-flight failures...")
+
+    flights = SingleFlight()
+
+    def failing():
+        time.sleep(0.1)
+        raise RuntimeError("Bedrock unavailable")
+
+    outcomes = run_concurrently(flights, 'digest-2', failing, 4)
+    assert all(isinstance(outcome, RuntimeError) for outcome in outcomes)
+    assert flights.stats()['in_flight'] == 0
+
+    # A leader that gives up without a result (e.g. a closed stream) releases waiters to do the work
+    flight, leader = flights.begin('digest-3')
+    assert leader
+    results = []
+    waiter = threading.Thread(target=lambda: results.append(flights.do('digest-3', lambda: 'own result')))
+    waiter.start()
+    time.sleep(0.05)
+    flights.finish('digest-3', flight, result=None)
+    waiter.join()
+    assert results == [('own result', False)]
+
+    print("[PASS] Single-flight failures test completed\n")
+
+if __name__ == "__main__":
+    print("Testing Single-Flight Coalescing\n")
+    print("=" * 50)
+
+    test_concurrent_calls_share_one_result()
+    test_errors_and_abandoned_leaders()
+
+    print("=" * 50)
+    print("All tests completed!")
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Test script for the Bedrock usage ledger
+"""
+
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from usage_ledger import UsageLedger, operation_kind
+
+def test_usage_summary():
+    """Test per-session totals, grouping and cost calculation"""
+    print("Testing usage ledger summaries...")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = UsageLedger(os.path.join(tmp, 'usage.sqlite3'), input_cost_per_1k=0.003, output_cost_per_1k=0.015)
+        
+        ledger.record('Detailed Hawkeye Analysis', 'model-a', 1000, 500, 2.0, session_id='s1', section='Background')
+        ledger.record('Detailed Hawkeye Analysis', 'model-a', 2000, 1000, 4.0, session_id='s1', section='Root Cause')
+        ledger.record('Chat Assistant', 'model-a', 300, 100, 1.0, session_id='s2')
+        ledger.record('Chat Assistant', 'model-a', 0, 0, 0.5, outcome='fallback', session_id='s2')
+        
+        totals = ledger.summary()
+        print(f"Totals: {totals}")
+        assert totals['calls'] == 3
+        assert totals['input_tokens'] == 3300
+        assert totals['output_tokens'] == 1600
+        assert totals['fallbacks'] == 1
+        assert totals['avg_latency_ms'] == 2333.3
+        assert abs(totals['cost_usd'] - (3.3 * 0.003 + 1.6 * 0.015)) < 1e-9
+        
+        session = ledger.summary('s1')
+        assert session['calls'] == 2
+        assert session['avg_latency_ms'] == 3000.0
+        
+        by_operation = {group['key']: group for group in ledger.summary(group_by='operation')}
+        assert by_operation['Detailed Hawkeye Analysis']['input_tokens'] == 3000
+        assert by_operation['Chat Assistant']['calls'] == 1
+        assert by_operation['Chat Assistant']['max_latency_ms'] == 1000.0
+        
+        empty = UsageLedger(os.path.join(tmp, 'empty.sqlite3')).summary()
+        assert empty['calls'] == 0 and empty['cost_usd'] == 0.0
+        
+        try:
+            ledger.summary(group_by='not_a_column')
+            assert False, "Expected invalid group_by to be rejected"
+        except ValueError:
+            pass
+        
+        csv_text = ledger.export_csv('s2')
+        assert len(csv_text.strip().splitlines()) == 3
+        assert csv_text.startswith('created_at,session_id,operation')
+    
+    assert operation_kind("Detailed Hawkeye Analysis: Background") == "Detailed Hawkeye Analysis"
+    assert operation_kind("Chat Assistant - what is risk") == "Chat Assistant"
+    
+    print("[PASS] Usage ledger test completed\n")
+
+def test_retention_pruned_while_recording():
+    """Test that expired calls are deleted every prune_every inserts, not only at startup"""
+    print("Testing usage ledger pruning...")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = UsageLedger(os.path.join(tmp, 'usage.sqlite3'), retention_seconds=3600, prune_every=3)
+        ledger.record('Chat Assistant', 'model-a', 10, 10, 0.1)
+        ledger._connections.get().execute("UPDATE bedrock_usage SET created_at = created_at - 7200")
+        
+        ledger.record('Chat Assistant', 'model-a', 10, 10, 0.1)
+        assert len(ledger.rows()) == 2
+        ledger.record('Chat Assistant', 'model-a', 10, 10, 0.1)
+        assert len(ledger.rows()) == 2
+    
+    print("[PASS] Usage ledger pruning test completed\n")
+
+if __name__ == "__main__":
+    print("Testing Usage Ledger\n")
+    print("=" * 50)
+    
+    test_usage_summary()
+    test_retention_pruned_while_recording()
+    
+    print("=" * 50)
+    print("All tests completed!")
@@ -0,0 +1,159 @@
+"""
+Ledger of Bedrock token usage, cost and latency per call
+"""
+
+import csv
+import io
+import threading
+import time
+
+from sqlite_utils import ThreadLocalConnection
+
+USAGE_FIELDS = [
+    'created_at', 'session_id', 'operation', 'section', 'model_id', 'outcome',
+    'input_tokens', 'output_tokens', 'latency_ms', 'cost_usd'
+]
+
+GROUP_COLUMNS = {
+    'operation': 'operation',
+    'section': 'section',
+    'session': 'session_id',
+    'model': 'model_id',
+    'outcome': 'outcome',
+    'day': "date(created_at, 'unixepoch')",
+}
+
+
+def operation_kind(operation_name):
+    """Reduce an operation name like 'Detailed Hawkeye Analysis: Background' to its kind"""
+    return operation_name.split(':')[0].split(' - ')[0].strip()
+
+
+class UsageLedger:
+    """SQLite-backed record of every Bedrock call, shared by all worker processes
+
+    Fallbacks to the local heuristics are recorded with outcome 'fallback'
+    so they can be counted, but they never reached Bedrock and are left out
+    of the call, token and latency totals.
+    """
+
+    def __init__(self, db_path, input_cost_per_1k=0.0, output_cost_per_1k=0.0, retention_seconds=None,
+                 prune_every=1000):
+        self.input_cost_per_1k = input_cost_per_1k
+        self.output_cost_per_1k = output_cost_per_1k
+        self.retention_seconds = retention_seconds
+        self.prune_every = prune_every
+        self._inserts = 0
+        self._inserts_lock = threading.Lock()
+        self._connections = ThreadLocalConnection(db_path)
+
+        conn = self._connections.get()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS bedrock_usage (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                created_at REAL NOT NULL,
+                session_id TEXT,
+                operation TEXT NOT NULL,
+                section TEXT,
+                model_id TEXT NOT NULL,
+                outcome TEXT NOT NULL,
+                input_tokens INTEGER NOT NULL,
+                output_tokens INTEGER NOT NULL,
+                latency_ms REAL NOT NULL,
+                cost_usd REAL NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_bedrock_usage_session ON bedrock_usage (session_id)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_bedrock_usage_created ON bedrock_usage (created_at)")
+        self.prune()
+
+    def prune(self):
+        """Delete calls older than the retention window"""
+        if self.retention_seconds:
+            self._connections.get().execute(
+                "DELETE FROM bedrock_usage WHERE created_at < ?", (time.time() - self.retention_seconds,)
+            )
+
+    def cost(self, input_tokens, output_tokens):
+        return (input_tokens * self.input_cost_per_1k + output_tokens * self.output_cost_per_1k) / 1000
+
+    def record(self, operation, model_id, input_tokens=0, output_tokens=0, latency_seconds=0.0,
+               outcome='ok', session_id=None, section=None):
+        """Append one call to the ledger; failures are logged, never raised"""
+        try:
+            self._connections.get().execute(
+                "INSERT INTO bedrock_usage (created_at, session_id, operation, section, model_id, outcome, "
+                "input_tokens, output_tokens, latency_ms, cost_usd) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (time.time(), session_id, operation, section, model_id, outcome,
+                 input_tokens, output_tokens, round(latency_seconds * 1000, 1),
+                 self.cost(input_tokens, output_tokens))
+            )
+            # Long-running workers would otherwise only prune at startup
+            with self._inserts_lock:
+                self._inserts += 1
+                due = self.prune_every and self._inserts % self.prune_every == 0
+            if due:
+                self.prune()
+        except Exception as e:
+            print(f"Usage ledger write failed: {str(e)}")
+
+    def _where(self, session_id=None, since=None):
+        clauses, params = [], []
+        if session_id:
+            clauses.append("session_id = ?")
+            params.append(session_id)
+        if since:
+            clauses.append("created_at >= ?")
+            params.append(since)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def summary(self, session_id=None, group_by=None, since=None):
+        """Totals for all calls, optionally for one session and/or grouped by a column"""
+        if group_by and group_by not in GROUP_COLUMNS:
+            raise ValueError(f"group_by must be one of {', '.join(GROUP_COLUMNS)}")
+
+        where, params = self._where(session_id, since)
+        key = GROUP_COLUMNS[group_by] if group_by else "'all'"
+        rows = self._connections.get().execute(
+            f"SELECT {key}, COALESCE(SUM(outcome != 'fallback'), 0), COALESCE(SUM(input_tokens), 0), "
+            f"COALESCE(SUM(output_tokens), 0), COALESCE(SUM(cost_usd), 0), "
+            f"COALESCE(AVG(CASE WHEN outcome != 'fallback' THEN latency_ms END), 0), "
+            f"COALESCE(MAX(CASE WHEN outcome != 'fallback' THEN latency_ms END), 0), "
+            f"COALESCE(SUM(outcome = 'fallback'), 0) FROM bedrock_usage{where} GROUP BY 1 ORDER BY 5 DESC",
+            params
+        ).fetchall()
+
+        groups = [{
+            'key': row[0],
+            'calls': row[1],
+            'input_tokens': row[2],
+            'output_tokens': row[3],
+            'cost_usd': round(row[4], 6),
+            'avg_latency_ms': round(row[5], 1),
+            'max_latency_ms': row[6],
+            'fallbacks': row[7]
+        } for row in rows]
+
+        if not group_by:
+            total = groups[0] if groups else {
+                'calls': 0, 'input_tokens': 0, 'output_tokens': 0, 'cost_usd': 0.0,
+                'avg_latency_ms': 0.0, 'max_latency_ms': 0, 'fallbacks': 0
+            }
+            total.pop('key', None)
+            return total
+        return groups
+
+    def rows(self, session_id=None, since=None):
+        """Every recorded call, oldest first"""
+        where, params = self._where(session_id, since)
+        cursor = self._connections.get().execute(
+            f"SELECT {', '.join(USAGE_FIELDS)} FROM bedrock_usage{where} ORDER BY id", params
+        )
+        return [dict(zip(USAGE_FIELDS, row)) for row in cursor]
+
+    def export_csv(self, session_id=None, since=None):
+        output = io.StringIO()
+        writer = csv.DictWriter(output, fieldnames=USAGE_FIELDS)
+        writer.writeheader()
+        writer.writerows(self.rows(session_id, since))
+        return output.getvalue()
@@ -0,0 +1,11 @@
+"""
+WSGI entry point for production servers (gunicorn wsgi:app -c gunicorn.conf.py)
+
+Importing app loads the guideline documents and builds the keyword matcher;
+the checklist retrieval index is built here too, so with preload_app the
+master does this once and every forked worker starts with it in memory.
+"""
+
+from app import app, get_checklist_retriever
+
+get_checklist_retriever()